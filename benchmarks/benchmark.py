@@ -0,0 +1,214 @@
+"""Benchmarks for the render and interaction throughput of the color picker.
+
+Run from the repository root with:
+
+    python benchmarks/benchmark.py --output results.json
+
+The results are written as JSON so they can be compared between releases.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+from time import perf_counter
+from typing import Any, Callable
+
+import textual
+from textual.app import App, ComposeResult
+from textual.color import HSV, Color
+from textual.widget import Widget
+
+from textual_colorpicker import conversions
+from textual_colorpicker.color_picker import ColorPicker
+from textual_colorpicker.hue_picker import HuePicker
+from textual_colorpicker.saturation_value_picker import SaturationValuePicker
+
+SATURATION_VALUE_PICKER_SIZES = [(37, 17), (80, 24), (160, 48), (320, 96)]
+HUE_PICKER_WIDTHS = [37, 80, 160, 320]
+
+
+class BenchmarkApp(App[None]):
+    def __init__(self, widget: Widget, width: int, height: int) -> None:
+        super().__init__()
+        self.widget = widget
+        self.widget.styles.width = width
+        self.widget.styles.height = height
+        self.changed_times: list[float] = []
+
+    def compose(self) -> ComposeResult:
+        yield self.widget
+
+    def on_color_picker_changed(self, event: ColorPicker.Changed) -> None:
+        self.changed_times.append(perf_counter())
+
+
+def summarize(name: str, params: dict[str, Any], timings: list[float]) -> dict:
+    timings_ms = [timing * 1000 for timing in timings]
+    return {
+        "name": name,
+        "params": params,
+        "iterations": len(timings_ms),
+        "mean_ms": statistics.mean(timings_ms),
+        "median_ms": statistics.median(timings_ms),
+        "min_ms": min(timings_ms),
+        "max_ms": max(timings_ms),
+    }
+
+
+def time_frames(
+    widget: Widget, iterations: int, before_frame: Callable[[int], None]
+) -> list[float]:
+    """Time rendering every line of a widget, after calling `before_frame`."""
+    height = widget.content_size.height
+    timings: list[float] = []
+    for iteration in range(iterations):
+        before_frame(iteration)
+        start = perf_counter()
+        for y in range(height):
+            widget.render_line(y)
+        timings.append(perf_counter() - start)
+    return timings
+
+
+async def bench_saturation_value_picker(iterations: int) -> list[dict]:
+    results: list[dict] = []
+    for width, height in SATURATION_VALUE_PICKER_SIZES:
+        picker = SaturationValuePicker()
+        # Compute the gradient on the event loop, so the timings include it
+        # rather than the placeholder shown while a worker computes it.
+        picker._BACKGROUND_FIELD_SIZE = None
+        app = BenchmarkApp(picker, width, height)
+        async with app.run_test(size=(width + 10, height + 10)) as pilot:
+            await pilot.pause()
+            params = {"width": width, "height": height}
+
+            # Changing the hue requires the whole gradient to be recomputed.
+            def change_hue(iteration: int) -> None:
+                picker.hsv = HSV((iteration + 1) / (iterations + 1), 1.0, 1.0)
+
+            timings = time_frames(picker, iterations, change_hue)
+            results.append(
+                summarize("saturation_value_picker.render_line.hue", params, timings)
+            )
+
+            # Changing the saturation/value only moves the pointer.
+            def move_pointer(iteration: int) -> None:
+                position = (iteration + 1) / (iterations + 1)
+                picker.hsv = HSV(picker.hsv.h, position, 1 - position)
+
+            timings = time_frames(picker, iterations, move_pointer)
+            results.append(
+                summarize(
+                    "saturation_value_picker.render_line.pointer", params, timings
+                )
+            )
+    return results
+
+
+async def bench_hue_picker(iterations: int) -> list[dict]:
+    results: list[dict] = []
+    for width in HUE_PICKER_WIDTHS:
+        picker = HuePicker()
+        app = BenchmarkApp(picker, width, 2)
+        async with app.run_test(size=(width + 10, 10)) as pilot:
+            await pilot.pause()
+
+            def change_hue(iteration: int) -> None:
+                picker.hue = (iteration + 1) / (iterations + 1)
+
+            timings = time_frames(picker, iterations, change_hue)
+            results.append(
+                summarize("hue_picker.render_line", {"width": width}, timings)
+            )
+    return results
+
+
+async def bench_color_picker_frame(iterations: int) -> list[dict]:
+    color_picker = ColorPicker()
+    app = BenchmarkApp(color_picker, 0, 0)
+    color_picker.styles.width = "auto"
+    color_picker.styles.height = "auto"
+    async with app.run_test(size=(120, 40)) as pilot:
+        await pilot.pause()
+        widgets = [color_picker, *color_picker.query("*")]
+        timings: list[float] = []
+        for iteration in range(iterations):
+            hsv = HSV((iteration + 1) / (iterations + 1), 0.5, 0.5)
+            color_picker.color = Color.from_hsv(*hsv)
+            start = perf_counter()
+            for widget in widgets:
+                widget.refresh()
+                widget.render_lines(widget.size.region)
+            timings.append(perf_counter() - start)
+        return [summarize("color_picker.frame", {}, timings)]
+
+
+async def bench_click_latency(iterations: int) -> list[dict]:
+    color_picker = ColorPicker()
+    app = BenchmarkApp(color_picker, 0, 0)
+    color_picker.styles.width = "auto"
+    color_picker.styles.height = "auto"
+    async with app.run_test(size=(120, 40)) as pilot:
+        await pilot.pause()
+        timings: list[float] = []
+        for iteration in range(iterations):
+            # Alternate between two points so every click changes the color.
+            offset = (5, 5) if iteration % 2 else (30, 10)
+            app.changed_times.clear()
+            start = perf_counter()
+            await pilot.click(SaturationValuePicker, offset=offset)
+            await pilot.pause()
+            if app.changed_times:
+                timings.append(app.changed_times[0] - start)
+        return [summarize("color_picker.click_to_changed", {}, timings)]
+
+
+async def run_benchmarks(iterations: int) -> dict:
+    results: list[dict] = []
+    results += await bench_saturation_value_picker(iterations)
+    results += await bench_hue_picker(iterations)
+    results += await bench_color_picker_frame(iterations)
+    results += await bench_click_latency(iterations)
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "textual": textual.__version__,
+        "numpy": conversions.HAS_NUMPY,
+        "iterations": iterations,
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-n",
+        "--iterations",
+        type=int,
+        default=50,
+        help="number of iterations for each benchmark (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="file to write the JSON results to (default: stdout)",
+    )
+    args = parser.parse_args()
+
+    report = asyncio.run(run_benchmarks(args.iterations))
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
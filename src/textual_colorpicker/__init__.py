@@ -1,5 +1,45 @@
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 
-from textual_colorpicker.color_picker import ColorPicker
+if TYPE_CHECKING:
+    from textual_colorpicker.color_picker import ColorPicker
+    from textual_colorpicker.color_preview import ColorPreview
+    from textual_colorpicker.hue_picker import HuePicker
+    from textual_colorpicker.saturation_value_picker import SaturationValuePicker
+    from textual_colorpicker.swatch_grid import SwatchGrid
+
+# The widgets are only imported on first access, so using a single widget
+# doesn't pay for importing the whole color picker.
+_LAZY_IMPORTS = {
+    "ColorPicker": "textual_colorpicker.color_picker",
+    "ColorPreview": "textual_colorpicker.color_preview",
+    "HuePicker": "textual_colorpicker.hue_picker",
+    "SaturationValuePicker": "textual_colorpicker.saturation_value_picker",
+    "SwatchGrid": "textual_colorpicker.swatch_grid",
+}
+
+__all__ = [
+    "ColorPicker",
+    "ColorPreview",
+    "HuePicker",
+    "SaturationValuePicker",
+    "SwatchGrid",
+]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ["ColorPicker"]
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -0,0 +1,366 @@
+"""Render the color picker widgets headlessly.
+
+Write a frame of a widget as ANSI or SVG, or time rendering frames to compare
+performance between terminals and machines:
+
+    python -m textual_colorpicker color-picker --size 80x24 --color "#00ffff"
+    python -m textual_colorpicker saturation-value --format svg -o frame.svg
+    python -m textual_colorpicker hue --color-system 256 --bench 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import json
+import platform
+import statistics
+import sys
+from time import perf_counter
+from typing import TYPE_CHECKING, Literal, Sequence
+
+import textual
+from rich.console import Console
+from rich.segment import Segment, Segments
+from rich.style import Style
+from textual.app import App, ComposeResult
+from textual.color import HSV
+from textual.dom import DOMNode
+from textual.geometry import Region
+from textual.strip import Strip
+from textual.widget import Widget
+
+from textual_colorpicker import conversions
+from textual_colorpicker._palette import get_color_system
+from textual_colorpicker.color_picker import ColorPicker
+from textual_colorpicker.color_state import ColorState
+from textual_colorpicker.hue_picker import HuePicker
+from textual_colorpicker.metrics import Metrics
+from textual_colorpicker.saturation_value_picker import SaturationValuePicker
+
+if TYPE_CHECKING:
+    from typing_extensions import TypeAlias
+
+ColorSystemName: TypeAlias = Literal["truecolor", "256", "standard", "windows"]
+
+WIDGETS = ("color-picker", "saturation-value", "hue")
+COLOR_SYSTEMS: tuple[ColorSystemName, ...] = ("truecolor", "256", "standard", "windows")
+
+
+class RenderApp(App[None]):
+    """A headless app that shows a single widget for rendering."""
+
+    CSS = """
+    SaturationValuePicker {
+        width: 1fr;
+        height: 1fr;
+    }
+    """
+
+    def __init__(self, widget: Widget, color_system: ColorSystemName) -> None:
+        super().__init__()
+        self.widget = widget
+        # The headless driver would otherwise detect a 16-color terminal, and
+        # the pickers quantize their gradients to the console's color system.
+        self.console = Console(
+            color_system=color_system,
+            file=io.StringIO(),
+            markup=True,
+            highlight=False,
+            emoji=False,
+            legacy_windows=False,
+            force_terminal=True,
+            safe_box=False,
+            soft_wrap=False,
+        )
+
+    def compose(self) -> ComposeResult:
+        yield self.widget
+
+
+def create_widget(name: str, state: ColorState) -> Widget:
+    """Create one of the widgets that can be rendered.
+
+    Args:
+        name: The name of the widget, one of `WIDGETS`.
+        state: The initial color state.
+
+    Returns:
+        The widget.
+    """
+    if name == "saturation-value":
+        return SaturationValuePicker(state.hsv)
+    if name == "hue":
+        return HuePicker(state.hsv.h)
+    return ColorPicker(state.color)
+
+
+def set_hsv(widget: Widget, hsv: HSV) -> None:
+    """Set the color of a widget created by `create_widget`.
+
+    Args:
+        widget: The widget.
+        hsv: The HSV (Hue, Saturation, Value) values in the range 0 to 1.
+    """
+    if isinstance(widget, SaturationValuePicker):
+        widget.hsv = hsv
+    elif isinstance(widget, HuePicker):
+        widget.hue = hsv.h
+    elif isinstance(widget, ColorPicker):
+        widget.state = ColorState.from_hsv(hsv)
+
+
+def render_screen(app: App[None]) -> list[Strip]:
+    """Render the lines of the whole screen of a running app.
+
+    Each visible widget is rendered and drawn over its region of the screen,
+    after the widget that contains it and clipped to it.
+
+    Args:
+        app: The running app.
+
+    Returns:
+        A strip for each line of the screen.
+    """
+    width, height = app.size
+    lines = [Strip.blank(width)] * height
+    clips: dict[DOMNode | None, Region] = {app.screen.parent: app.screen.region}
+    for widget in app.screen.walk_children(Widget, with_self=True):
+        region = widget.region
+        parent_clip = clips.get(widget.parent)
+        if parent_clip is None or not widget.visible:
+            continue
+        clip = clips[widget] = region.intersection(parent_clip)
+        if not clip:
+            continue
+        x = clip.x - region.x
+        strips = widget.render_lines(
+            Region(x, clip.y - region.y, clip.width, clip.height)
+        )
+        for y, strip in enumerate(strips, clip.y):
+            line = lines[y]
+            lines[y] = Strip.join(
+                [line.crop(0, clip.x), strip, line.crop(clip.right, width)]
+            )
+    return lines
+
+
+def render_frame(
+    app: App[None], output_format: str, color_system: ColorSystemName
+) -> str:
+    """Render the whole screen of a running app.
+
+    Args:
+        app: The running app.
+        output_format: Either `"ansi"` or `"svg"`.
+        color_system: The color system of the ANSI escape codes.
+
+    Returns:
+        The frame as ANSI text or an SVG document.
+    """
+    if output_format == "svg":
+        return app.export_screenshot()
+
+    width, height = app.size
+    console = Console(
+        width=width,
+        height=height,
+        file=io.StringIO(),
+        force_terminal=True,
+        color_system=color_system,
+        legacy_windows=False,
+        safe_box=False,
+    )
+    # Rich caches the escape codes of a style for the first color system it is
+    # rendered with, and the styles are shared, so render new styles with the
+    # colors already downgraded to the color system.
+    rich_color_system = get_color_system(console)
+    styles: dict[Style, Style] = {}
+    for strip in render_screen(app):
+        segments: list[Segment] = []
+        for text, style, control in strip:
+            if style is not None:
+                if style not in styles:
+                    styles[style] = style + Style.from_color(
+                        style.color and style.color.downgrade(rich_color_system),
+                        style.bgcolor and style.bgcolor.downgrade(rich_color_system),
+                    )
+                style = styles[style]
+            segments.append(Segment(text, style, control))
+        segments.append(Segment.line())
+        console.print(Segments(segments))
+    output = console.file
+    assert isinstance(output, io.StringIO)
+    return output.getvalue()
+
+
+def _compute_gradients_immediately(app: App[None]) -> None:
+    # Large gradients are otherwise computed in a worker, so the frame would
+    # show a placeholder and the timings would not include computing it.
+    for picker in app.query(SaturationValuePicker):
+        picker._BACKGROUND_FIELD_SIZE = None
+        picker.refresh()
+
+
+async def run(
+    name: str,
+    size: tuple[int, int],
+    state: ColorState,
+    output_format: str,
+    color_system: ColorSystemName,
+    bench: int | None,
+) -> str:
+    """Render a widget headlessly.
+
+    Args:
+        name: The name of the widget, one of `WIDGETS`.
+        size: The size of the terminal as a tuple of columns and rows.
+        state: The color to show.
+        output_format: Either `"ansi"` or `"svg"`.
+        color_system: The color system of the terminal.
+        bench: The number of frames to time, or `None` to render a single frame.
+
+    Returns:
+        The rendered frame, or the benchmark report as JSON.
+    """
+    widget = create_widget(name, state)
+    app = RenderApp(widget, color_system)
+    async with app.run_test(size=size) as pilot:
+        _compute_gradients_immediately(app)
+        await pilot.pause()
+        if bench is None:
+            return render_frame(app, output_format, color_system)
+
+        metrics = Metrics()
+        metrics.attach(widget)
+        _, s, v = state.hsv
+        timings: list[float] = []
+        for frame in range(bench):
+            # Changing the hue requires every gradient to be recomputed.
+            set_hsv(widget, HSV((frame + 1) / (bench + 1), s, v))
+            start = perf_counter()
+            render_screen(app)
+            timings.append(perf_counter() - start)
+        metrics.detach(widget)
+
+    snapshot = metrics.snapshot()
+    report = {
+        "widget": name,
+        "size": list(size),
+        "color": state.hex,
+        "color_system": color_system,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "textual": textual.__version__,
+        "numpy": conversions.HAS_NUMPY,
+        "frames": bench,
+        "frames_per_second": bench / sum(timings) if sum(timings) else None,
+        "mean_frame_ms": statistics.mean(timings) * 1000,
+        "median_frame_ms": statistics.median(timings) * 1000,
+        "max_frame_ms": max(timings) * 1000,
+        "lines": {
+            widget_type: {
+                "lines": lines,
+                "mean_line_us": snapshot.render_time[widget_type] / lines * 1e6,
+            }
+            for widget_type, lines in snapshot.render_calls.items()
+        },
+    }
+    return json.dumps(report, indent=2) + "\n"
+
+
+def parse_size(size: str) -> tuple[int, int]:
+    try:
+        columns, rows = size.lower().split("x")
+        return int(columns), int(rows)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"expected a size such as 80x24, not {size!r}"
+        ) from None
+
+
+def parse_color(color: str) -> ColorState:
+    try:
+        return ColorState(conversions.parse_color(color))
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(str(error)) from None
+
+
+def parse_frames(frames: str) -> int:
+    if not frames.isdigit() or int(frames) < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer: {frames!r}")
+    return int(frames)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m textual_colorpicker",
+        description=__doc__.splitlines()[0],
+    )
+    parser.add_argument(
+        "widget",
+        nargs="?",
+        choices=WIDGETS,
+        default="color-picker",
+        help="widget to render (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--size",
+        type=parse_size,
+        default=(80, 24),
+        metavar="COLUMNSxROWS",
+        help="size of the terminal (default: 80x24)",
+    )
+    parser.add_argument(
+        "--color",
+        type=parse_color,
+        default=ColorState(),
+        help="color to show, in any format accepted by the hex input "
+        "(default: #FF0000)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("ansi", "svg"),
+        default="ansi",
+        help="format of the frame (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--color-system",
+        choices=COLOR_SYSTEMS,
+        default="truecolor",
+        help="color system of the terminal (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--bench",
+        type=parse_frames,
+        metavar="N",
+        help="time rendering N frames and write a JSON report instead of a frame",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="file to write to (default: stdout)",
+    )
+    args = parser.parse_args(argv)
+
+    output = asyncio.run(
+        run(
+            args.widget,
+            args.size,
+            args.color,
+            args.format,
+            args.color_system,
+            args.bench,
+        )
+    )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output)
+    else:
+        sys.stdout.write(output)
+
+
+if __name__ == "__main__":
+    main()
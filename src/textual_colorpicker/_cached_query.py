@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from textual import events
+from textual.widget import Widget
+
+
+class CachedQueryWidget(Widget):
+    """A widget that queries its child widgets once they are mounted or
+    recomposed, rather than every time it updates them."""
+
+    def _on_mount(self, event: events.Mount) -> None:
+        self._query_children()
+
+    async def recompose(self) -> None:
+        await super().recompose()
+        self._query_children()
+
+    def _query_children(self) -> None:
+        """Query the child widgets and keep references to them, so they can be
+        updated without walking the DOM every time the color changes."""
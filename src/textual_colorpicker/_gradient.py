@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from rich.color import ColorSystem
+
+from textual_colorpicker import conversions
+from textual_colorpicker._palette import quantize_arrays, quantize_row
+from textual_colorpicker.conversions import _hsv_to_rgb_arrays, hsv_to_rgb_grid
+
+
+def get_saturation_value_field(
+    hue: float, width: int, height: int
+) -> list[list[tuple[int, int, int]]]:
+    """Get the RGB colors for a saturation/value gradient at the given hue.
+
+    Saturation increases from left to right and value decreases from top to
+    bottom.
+
+    Args:
+        hue: The hue value in the range 0 to 1.
+        width: The width of the gradient.
+        height: The height of the gradient.
+
+    Returns:
+        A list of rows, where each row is a list of RGB tuples.
+    """
+    saturations = [x / (width - 1) for x in range(width)]
+    values = [1 - (y / (height - 1)) for y in range(height)]
+
+    return hsv_to_rgb_grid(hue, saturations, values)
+
+
+def get_packed_saturation_value_field(
+    hue: float,
+    width: int,
+    height: int,
+    color_system: ColorSystem,
+    dither: bool = False,
+) -> list[list[int]]:
+    """Get the colors for a saturation/value gradient at the given hue,
+    quantized to the palette of the color system and packed in the form
+    `0xRRGGBB`.
+
+    With NumPy, the whole field is converted and quantized in a single batch
+    without building an RGB tuple for each cell.
+
+    Args:
+        hue: The hue value in the range 0 to 1.
+        width: The width of the gradient.
+        height: The height of the gradient.
+        color_system: The color system of the terminal.
+        dither: Whether to dither the gradient colors.
+
+    Returns:
+        A list of rows, where each row is a list of packed colors.
+    """
+    if conversions.HAS_NUMPY:
+        saturations = [x / (width - 1) for x in range(width)]
+        values = [1 - (y / (height - 1)) for y in range(height)]
+        red, green, blue = quantize_arrays(
+            *_hsv_to_rgb_arrays(hue, saturations, values), color_system, dither
+        )
+        packed: list[list[int]] = (red << 16 | green << 8 | blue).tolist()
+        return packed
+
+    field = get_saturation_value_field(hue, width, height)
+    if color_system == ColorSystem.TRUECOLOR:
+        return [[r << 16 | g << 8 | b for r, g, b in row] for row in field]
+    return [
+        [r << 16 | g << 8 | b for r, g, b in quantize_row(row, color_system, y, dither)]
+        for y, row in enumerate(field)
+    ]
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Sequence
+
+from rich._palettes import EIGHT_BIT_PALETTE, STANDARD_PALETTE, WINDOWS_PALETTE
+from rich.color import Color as RichColor
+from rich.color import ColorSystem
+from rich.console import COLOR_SYSTEMS, Console
+from rich.palette import Palette
+
+from textual_colorpicker.conversions import _numpy
+
+_PALETTES: dict[ColorSystem, Palette] = {
+    ColorSystem.STANDARD: STANDARD_PALETTE,
+    ColorSystem.EIGHT_BIT: EIGHT_BIT_PALETTE,
+    ColorSystem.WINDOWS: WINDOWS_PALETTE,
+}
+
+_PALETTE_SIZES = {
+    ColorSystem.STANDARD: 16,
+    ColorSystem.EIGHT_BIT: 256,
+    ColorSystem.WINDOWS: 16,
+}
+
+_DITHER_SPREAD = {
+    ColorSystem.STANDARD: 128.0,
+    ColorSystem.EIGHT_BIT: 40.0,
+    ColorSystem.WINDOWS: 128.0,
+}
+"""The approximate distance between neighbouring palette colors per channel."""
+
+_BAYER_MATRIX = (
+    (0, 8, 2, 10),
+    (12, 4, 14, 6),
+    (3, 11, 1, 9),
+    (15, 7, 13, 5),
+)
+"""A 4x4 ordered-dither threshold matrix."""
+
+_QUANTIZE_CACHE_SIZE = 65536
+"""The maximum number of quantized colors to remember."""
+
+
+def get_color_system(console: Console) -> ColorSystem:
+    """Get the color system that the console outputs, treating no color as
+    truecolor since there is then nothing to quantize.
+
+    Args:
+        console: The console, typically the app's console.
+
+    Returns:
+        The color system.
+    """
+    return COLOR_SYSTEMS.get(console.color_system or "", ColorSystem.TRUECOLOR)
+
+
+@lru_cache(maxsize=_QUANTIZE_CACHE_SIZE)
+def quantize_color(
+    rgb: tuple[int, int, int], color_system: ColorSystem
+) -> tuple[int, int, int]:
+    """Get the palette color that Rich would downgrade a color to.
+
+    The styles keep the palette color as RGB, so the colors are not converted
+    again by Textual's ANSI filters and map back to the same palette entry
+    when output.
+
+    Args:
+        rgb: The color as an RGB tuple.
+        color_system: The color system of the terminal.
+
+    Returns:
+        The palette color as an RGB tuple.
+    """
+    palette = _PALETTES.get(color_system)
+    if palette is None:
+        return rgb
+    color = RichColor.from_rgb(*rgb).downgrade(color_system)
+    assert color.number is not None
+    red, green, blue = palette[color.number]
+    return red, green, blue
+
+
+def quantize_row(
+    colors: Sequence[tuple[int, int, int]],
+    color_system: ColorSystem,
+    y: int,
+    dither: bool = False,
+) -> list[tuple[int, int, int]]:
+    """Quantize a row of gradient colors to the palette of the color system.
+
+    Args:
+        colors: The colors in the row as RGB tuples.
+        color_system: The color system of the terminal.
+        y: The row of the gradient, which selects the row of the dither matrix.
+        dither: Whether to apply an ordered dither to smooth the color bands.
+
+    Returns:
+        A list of the palette colors as RGB tuples.
+    """
+    if color_system not in _PALETTES:
+        return list(colors)
+    if not dither:
+        return [quantize_color(rgb, color_system) for rgb in colors]
+
+    spread = _DITHER_SPREAD[color_system]
+    offsets = [
+        int(((threshold + 0.5) / 16 - 0.5) * spread)
+        for threshold in _BAYER_MATRIX[y % 4]
+    ]
+    quantized: list[tuple[int, int, int]] = []
+    for x, (red, green, blue) in enumerate(colors):
+        offset = offsets[x % 4]
+        dithered = (
+            min(max(red + offset, 0), 255),
+            min(max(green + offset, 0), 255),
+            min(max(blue + offset, 0), 255),
+        )
+        quantized.append(quantize_color(dithered, color_system))
+
+    return quantized
+
+
+def quantize_arrays(
+    red: Any, green: Any, blue: Any, color_system: ColorSystem, dither: bool = False
+) -> tuple[Any, Any, Any]:
+    """Quantize a field of gradient colors to the palette of the color system
+    in a single batch. This requires NumPy.
+
+    This mirrors the arithmetic of Rich's color downgrade, so the results are
+    identical to `quantize_row`.
+
+    Args:
+        red: The red values as an integer array with a row for each row of
+            the gradient.
+        green: The green values.
+        blue: The blue values.
+        color_system: The color system of the terminal.
+        dither: Whether to apply an ordered dither to smooth the color bands.
+
+    Returns:
+        The red, green and blue values of the palette colors as integer arrays.
+    """
+    if color_system not in _PALETTES:
+        return red, green, blue
+
+    numpy = _numpy()
+    if dither:
+        spread = _DITHER_SPREAD[color_system]
+        offsets = numpy.array(
+            [
+                [int(((threshold + 0.5) / 16 - 0.5) * spread) for threshold in row]
+                for row in _BAYER_MATRIX
+            ]
+        )
+        height, width = red.shape
+        offsets = offsets[
+            numpy.arange(height)[:, numpy.newaxis] % 4, numpy.arange(width) % 4
+        ]
+        red = numpy.clip(red + offsets, 0, 255)
+        green = numpy.clip(green + offsets, 0, 255)
+        blue = numpy.clip(blue + offsets, 0, 255)
+
+    colors = _get_palette_colors(color_system)
+    if color_system == ColorSystem.EIGHT_BIT:
+        numbers = _match_eight_bit(red, green, blue)
+    else:
+        numbers = _match_palette(colors, red, green, blue)
+
+    quantized = colors[numbers]
+    return quantized[..., 0], quantized[..., 1], quantized[..., 2]
+
+
+@lru_cache(maxsize=None)
+def _get_palette_colors(color_system: ColorSystem) -> Any:
+    """Get the colors of a palette as an array of RGB values."""
+    palette = _PALETTES[color_system]
+    return _numpy().array(
+        [palette[number] for number in range(_PALETTE_SIZES[color_system])]
+    )
+
+
+def _match_eight_bit(red: Any, green: Any, blue: Any) -> Any:
+    numpy = _numpy()
+    # NOTE: This mirrors `colorsys.rgb_to_hls` for the lightness and saturation,
+    # then `rich.color.Color.downgrade` for the 8-bit color number.
+    r = red / 255.0
+    g = green / 255.0
+    b = blue / 255.0
+    maxc = numpy.maximum(numpy.maximum(r, g), b)
+    minc = numpy.minimum(numpy.minimum(r, g), b)
+    sumc = maxc + minc
+    rangec = maxc - minc
+    lightness = sumc / 2.0
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        saturation = numpy.where(
+            lightness <= 0.5, rangec / sumc, rangec / (2.0 - maxc - minc)
+        )
+    saturation = numpy.where(minc == maxc, 0.0, saturation)
+
+    # Python rounds halves to even, the same as NumPy.
+    gray = numpy.rint(lightness * 25.0).astype(int)
+    gray_numbers = numpy.where(gray == 0, 16, numpy.where(gray == 25, 231, 231 + gray))
+
+    def six(channel: Any) -> Any:
+        return numpy.rint(
+            numpy.where(channel < 95, channel / 95, 1 + (channel - 95) / 40)
+        ).astype(int)
+
+    cube_numbers = 16 + 36 * six(red) + 6 * six(green) + six(blue)
+    return numpy.where(saturation < 0.15, gray_numbers, cube_numbers)
+
+
+def _match_palette(colors: Any, red: Any, green: Any, blue: Any) -> Any:
+    numpy = _numpy()
+    # NOTE: This mirrors `rich.palette.Palette.match`, comparing the squared
+    # distances since the square root doesn't change their order.
+    red1 = red[..., numpy.newaxis]
+    green1 = green[..., numpy.newaxis]
+    blue1 = blue[..., numpy.newaxis]
+    red2, green2, blue2 = colors[:, 0], colors[:, 1], colors[:, 2]
+    red_mean = (red1 + red2) // 2
+    red_distance = red1 - red2
+    green_distance = green1 - green2
+    blue_distance = blue1 - blue2
+    distances = (
+        (((512 + red_mean) * red_distance * red_distance) >> 8)
+        + 4 * green_distance * green_distance
+        + (((767 - red_mean) * blue_distance * blue_distance) >> 8)
+    )
+    # The first closest color is chosen, the same as Rich.
+    return distances.argmin(axis=-1)
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+def resample_rows(rows: Sequence[list[T]], width: int, height: int) -> list[list[T]]:
+    """Resample the rows of a gradient to a new size by mapping each cell to
+    the nearest cell of the original, which reuses the cells rather than
+    computing them again.
+
+    The first and last rows and columns map to the edges of the original, so
+    the corners of the gradient are unchanged.
+
+    Args:
+        rows: The rows of the original gradient.
+        width: The new width.
+        height: The new height.
+
+    Returns:
+        A list of rows of the new size, which share the cells of the original.
+    """
+    columns = _get_index_map(len(rows[0]), width)
+    return [
+        [row[x] for x in columns]
+        for row in (rows[y] for y in _get_index_map(len(rows), height))
+    ]
+
+
+@lru_cache(maxsize=64)
+def _get_index_map(source_size: int, size: int) -> tuple[int, ...]:
+    if size <= 1:
+        return (0,) * size
+    scale = (source_size - 1) / (size - 1)
+    return tuple(int(index * scale + 0.5) for index in range(size))
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+from rich.color import Color as RichColor
+from rich.color import ColorType
+from rich.color_triplet import ColorTriplet
+from rich.style import Style
+
+_STYLE_CACHE_SIZE = 16384
+"""The maximum number of interned styles, and of the colors they are built from."""
+
+_styles: dict[int, Style] = {}
+"""The interned styles, keyed by their packed foreground and background colors."""
+
+_rich_colors: dict[int, RichColor] = {}
+"""The colors of the interned styles, keyed by their packed RGB values."""
+
+
+def pack_rgb(rgb: tuple[int, int, int]) -> int:
+    """Pack an RGB tuple into a single integer in the form `0xRRGGBB`.
+
+    Args:
+        rgb: The color as an RGB tuple.
+
+    Returns:
+        The packed color.
+    """
+    red, green, blue = rgb
+    return red << 16 | green << 8 | blue
+
+
+def get_style(
+    foreground: tuple[int, int, int], background: tuple[int, int, int]
+) -> Style:
+    """Get a style with the given foreground and background colors.
+
+    Styles are interned, so identical cells share the same style object across
+    rows, frames and widgets.
+
+    Args:
+        foreground: The foreground color as an RGB tuple.
+        background: The background color as an RGB tuple.
+
+    Returns:
+        A Rich style.
+    """
+    key = pack_rgb(foreground) << 24 | pack_rgb(background)
+    return _styles.get(key) or _create_style(key)
+
+
+def get_styles(keys: Iterable[int]) -> list[Style]:
+    """Get the interned styles for many cells at once.
+
+    This avoids building an RGB tuple for each cell, which is most of the cost
+    of a large gradient.
+
+    Args:
+        keys: The packed foreground color shifted left by 24 bits, combined
+            with the packed background color, for each cell.
+
+    Returns:
+        A list of Rich styles.
+    """
+    get = _styles.get
+    return [get(key) or _create_style(key) for key in keys]
+
+
+def _create_style(key: int) -> Style:
+    style = Style.from_color(
+        _get_rich_color(key >> 24), _get_rich_color(key & 0xFFFFFF)
+    )
+    # Clearing a full pool is much cheaper than tracking the least recently
+    # used style for every cell, and styles in use are still referenced.
+    if len(_styles) >= _STYLE_CACHE_SIZE:
+        _styles.clear()
+    _styles[key] = style
+    return style
+
+
+def _get_rich_color(packed: int) -> RichColor:
+    color = _rich_colors.get(packed)
+    if color is None:
+        # NOTE: This is identical to `RichColor.from_rgb`, without formatting
+        # the name from the triplet.
+        color = RichColor(
+            f"#{packed:06x}",
+            ColorType.TRUECOLOR,
+            triplet=ColorTriplet(packed >> 16, packed >> 8 & 0xFF, packed & 0xFF),
+        )
+        if len(_rich_colors) >= _STYLE_CACHE_SIZE:
+            _rich_colors.clear()
+        _rich_colors[packed] = color
+    return color
@@ -1,20 +1,27 @@
 from __future__ import annotations
 
-import re
-
-from textual import on
+from textual import events, on
 from textual.app import ComposeResult
 from textual.color import HSV, Color
 from textual.containers import HorizontalGroup
 from textual.geometry import clamp
 from textual.message import Message
-from textual.reactive import var
-from textual.validation import Integer, Regex
+from textual.reactive import reactive, var
+from textual.validation import Function, Integer
 from textual.widget import Widget
 from textual.widgets import Input, Label
 
+from textual_colorpicker._cached_query import CachedQueryWidget
+from textual_colorpicker.color_state import ColorState, ColorStateMixin
+from textual_colorpicker.conversions import (
+    parse_color,
+    rgb_to_hex,
+    scaled_integers_to_hsv,
+)
+from textual_colorpicker.metrics import MetricsMixin
+
 
-class RgbInputs(Widget):
+class RgbInputs(MetricsMixin, CachedQueryWidget):
     """An RGB inputs widget that combines fields for Red, Green and Blue values."""
 
     DEFAULT_CSS = """
@@ -99,26 +106,30 @@ class RgbInputs(Widget):
                 classes="--blue-input",
             )
 
+    def _query_children(self) -> None:
+        self._red_input = self.query_one(".--red-input", Input)
+        self._green_input = self.query_one(".--green-input", Input)
+        self._blue_input = self.query_one(".--blue-input", Input)
+
     def validate_color(self, color: Color) -> Color:
         return color.clamped
 
     def watch_color(self) -> None:
+        self._record_watcher("color")
+
         self._update_all_from_color()
 
-        self.post_message(self.Changed(self, self.color))
+        message = self.Changed(self, self.color)
+        self._post_and_record(message)
 
     def _update_all_from_color(self) -> None:
         if not self.is_mounted:
             return
-        red_input = self.query_one(".--red-input", Input)
-        green_input = self.query_one(".--green-input", Input)
-        blue_input = self.query_one(".--blue-input", Input)
-
         r, g, b = self.color.rgb
 
-        red_input.value = str(r)
-        green_input.value = str(g)
-        blue_input.value = str(b)
+        self._red_input.value = str(r)
+        self._green_input.value = str(g)
+        self._blue_input.value = str(b)
 
     @on(Input.Blurred)
     @on(Input.Submitted)
@@ -143,9 +154,9 @@ class RgbInputs(Widget):
                 rounded_value = int(float(event.value) + 0.5)
                 event.input.value = str(rounded_value)
 
-        r = int(self.query_one(".--red-input", Input).value)
-        g = int(self.query_one(".--green-input", Input).value)
-        b = int(self.query_one(".--blue-input", Input).value)
+        r = int(self._red_input.value)
+        g = int(self._green_input.value)
+        b = int(self._blue_input.value)
         color = Color(r, g, b)
 
         self.color = color
@@ -155,7 +166,7 @@ class RgbInputs(Widget):
         event.stop()
 
 
-class HsvInputs(Widget):
+class HsvInputs(ColorStateMixin, MetricsMixin, CachedQueryWidget):
     """An HSV inputs widget that combines fields for Hue, Saturation and Value values."""
 
     DEFAULT_CSS = """
@@ -214,12 +225,10 @@ class HsvInputs(Widget):
             disabled: Whether the widget is disabled or not.
         """
         super().__init__(name=name, id=id, classes=classes, disabled=disabled)
-        hsv = self.validate_hsv(hsv)
-        self.hsv = hsv
-        self._hsv_scaled_integers = self._get_hsv_scaled_integers(hsv)
+        self.set_state(ColorState.from_hsv(hsv))
 
     def compose(self) -> ComposeResult:
-        h, s, v = self._hsv_scaled_integers
+        h, s, v = self._state.scaled_integers
         with HorizontalGroup():
             yield Label("H:")
             yield Input(
@@ -242,42 +251,28 @@ class HsvInputs(Widget):
                 classes="--value-input",
             )
 
-    def validate_hsv(self, hsv: HSV) -> HSV:
-        h, s, v = hsv
-        clamped_hsv = HSV(
-            clamp(h, 0.0, 1.0),
-            clamp(s, 0.0, 1.0),
-            clamp(v, 0.0, 1.0),
-        )
-
-        return clamped_hsv
+    def _query_children(self) -> None:
+        self._hue_input = self.query_one(".--hue-input", Input)
+        self._saturation_input = self.query_one(".--saturation-input", Input)
+        self._value_input = self.query_one(".--value-input", Input)
 
     def watch_hsv(self) -> None:
-        self._update_all_from_hsv()
+        self._record_watcher("hsv")
 
-        self.post_message(self.Changed(self, self.hsv))
-
-    def _get_hsv_scaled_integers(self, hsv: HSV) -> tuple[int, int, int]:
-        h = int(hsv.h * 360 + 0.5)
-        s = int(hsv.s * 100 + 0.5)
-        v = int(hsv.v * 100 + 0.5)
+        self._sync_state()
+        self._update_all_from_hsv()
 
-        return h, s, v
+        message = self.Changed(self, self.hsv)
+        self._post_and_record(message)
 
     def _update_all_from_hsv(self) -> None:
-        self._hsv_scaled_integers = self._get_hsv_scaled_integers(self.hsv)
-
         if not self.is_mounted:
             return
-        hue_input = self.query_one(".--hue-input", Input)
-        saturation_input = self.query_one(".--saturation-input", Input)
-        value_input = self.query_one(".--value-input", Input)
-
-        h, s, v = self._hsv_scaled_integers
+        h, s, v = self._state.scaled_integers
 
-        hue_input.value = str(h)
-        saturation_input.value = str(s)
-        value_input.value = str(v)
+        self._hue_input.value = str(h)
+        self._saturation_input.value = str(s)
+        self._value_input.value = str(v)
 
     @on(Input.Blurred)
     @on(Input.Submitted)
@@ -306,14 +301,14 @@ class HsvInputs(Widget):
 
             input_corrected = True
 
-        h = int(self.query_one(".--hue-input", Input).value)
-        s = int(self.query_one(".--saturation-input", Input).value)
-        v = int(self.query_one(".--value-input", Input).value)
+        h = int(self._hue_input.value)
+        s = int(self._saturation_input.value)
+        v = int(self._value_input.value)
 
         # Update the HSV only if the input value has changed.
         # This prevents unwanted updates from the scaled integer values.
-        if (h, s, v) != self._hsv_scaled_integers or input_corrected:
-            hsv = HSV(h / 360, s / 100, v / 100)
+        if (h, s, v) != self._state.scaled_integers or input_corrected:
+            hsv = scaled_integers_to_hsv(h, s, v)
             self.hsv = hsv
 
     @on(Input.Changed)
@@ -321,7 +316,7 @@ class HsvInputs(Widget):
         event.stop()
 
 
-class HexInput(Widget):
+class HexInput(MetricsMixin, CachedQueryWidget):
     """A hex color input widget."""
 
     DEFAULT_CSS = """
@@ -343,9 +338,6 @@ class HexInput(Widget):
     }
     """
 
-    # TODO: Allow shorthand hex values
-    _HEX_COLOR_PATTERN = r"#[0-9a-fA-F]{6}"
-
     value: var[str] = var("#FF0000", init=False)
     """The current hex color value."""
 
@@ -355,9 +347,13 @@ class HexInput(Widget):
         This message can be handled using an `on_hex_input_changed` method.
         """
 
-        def __init__(self, hex_input: HexInput, value: str) -> None:
+        def __init__(
+            self, hex_input: HexInput, value: str, color: Color | None = None
+        ) -> None:
             super().__init__()
             self.value: str = value
+            self.color: Color = parse_color(value) if color is None else color
+            """The hex color value as a `Color`."""
             self.hex_input = hex_input
 
         @property
@@ -375,6 +371,10 @@ class HexInput(Widget):
     ) -> None:
         """Create a hex color input widget.
 
+        The input also accepts shorthand hex values, `rgb()`, `hsl()` and color
+        names, which are converted to a `#RRGGBB` hex value. Any alpha is
+        ignored, as the color picker has no alpha channel.
+
         Args:
             value: The initial hex color value.
             name: The name of the widget.
@@ -383,7 +383,7 @@ class HexInput(Widget):
             disabled: Whether the widget is disabled or not.
         """
         super().__init__(name=name, id=id, classes=classes, disabled=disabled)
-        self.value = value.upper()
+        self.value = value
 
     def compose(self) -> ComposeResult:
         hex_value = self._format_hex_value(self.value)
@@ -391,20 +391,24 @@ class HexInput(Widget):
             yield Label("#")
             yield Input(
                 hex_value,
-                validators=Regex(self._HEX_COLOR_PATTERN[1:]),
+                validators=Function(_is_valid_color, "Invalid color"),
             )
 
+    def _query_children(self) -> None:
+        self._input = self.query_one(Input)
+
     def validate_value(self, value: str) -> str:
-        if re.fullmatch(self._HEX_COLOR_PATTERN, value):
-            return value.upper()
-        raise ValueError(f"Invalid hex color: {value}")
+        return rgb_to_hex(*parse_color(value).rgb)
 
     def watch_value(self) -> None:
+        self._record_watcher("value")
+
         if self.is_mounted:
             hex_value = self._format_hex_value(self.value)
-            self.query_one(Input).value = hex_value
+            self._input.value = hex_value
 
-        self.post_message(self.Changed(self, self.value))
+        message = self.Changed(self, self.value, parse_color(self.value))
+        self._post_and_record(message)
 
     def _format_hex_value(self, hex: str) -> str:
         return hex.lower().lstrip("#")
@@ -415,22 +419,21 @@ class HexInput(Widget):
         self, event: Input.Blurred | Input.Submitted
     ) -> None:
         event.stop()
-        validation_result = event.validation_result
-        assert validation_result is not None
-        if not validation_result.is_valid:
-            # If the value is not a valid hex color, reset the input to the
+        # NOTE: Parsing is cached, so this reuses the result from validating the
+        # input rather than parsing the value again.
+        try:
+            color = parse_color(event.value)
+        except ValueError:
+            # If the value is not a valid color, reset the input to the
             # current hex value.
-            if not re.fullmatch(self._HEX_COLOR_PATTERN, event.value):
-                hex_value = self._format_hex_value(self.value)
-                event.input.value = hex_value
-                return
+            event.input.value = self._format_hex_value(self.value)
+            return
 
-        # If the value is a valid hex color but starts with the "#" prefix,
-        # simply strip the "#" from the input.
-        hex_value = self._format_hex_value(event.value)
-        event.input.value = hex_value
+        # Show the color as a hex value without the "#" prefix, for example
+        # if a shorthand hex value or color name was entered.
+        hex_color = rgb_to_hex(*color.rgb)
+        event.input.value = self._format_hex_value(hex_color)
 
-        hex_color = f"#{hex_value.upper()}"
         self.value = hex_color
 
     @on(Input.Changed)
@@ -438,6 +441,14 @@ class HexInput(Widget):
         event.stop()
 
 
+def _is_valid_color(value: str) -> bool:
+    try:
+        parse_color(value)
+    except ValueError:
+        return False
+    return True
+
+
 class ColorInputs(Widget):
     """A color inputs widget that combines fields for RGB, HSV and Hex values."""
 
@@ -461,6 +472,7 @@ class ColorInputs(Widget):
         self,
         color: Color = Color(255, 0, 0),
         *,
+        state: ColorState | None = None,
         name: str | None = None,
         id: str | None = None,
         classes: str | None = None,
@@ -470,20 +482,110 @@ class ColorInputs(Widget):
 
         Args:
             color: The initial color value.
+            state: The initial color state, which is used instead of `color` if
+                given. Unlike a color, this keeps the exact HSV values.
             name: The name of the widget.
             id: The ID of the widget in the DOM.
             classes: The CSS classes of the widget.
             disabled: Whether the widget is disabled or not.
         """
         super().__init__(name=name, id=id, classes=classes, disabled=disabled)
-        self._color = color.clamped
+        self._state = state if state is not None else ColorState(color)
 
     def compose(self) -> ComposeResult:
-        color = self._color
+        state = self._state
         with HorizontalGroup():
-            yield RgbInputs(color)
-            yield HsvInputs(color.hsv)
-        yield HexInput(color.hex)
+            yield RgbInputs(state.color)
+            yield HsvInputs(state.hsv)
+        yield HexInput(state.hex)
+
+
+class ColorInputsSummary(ColorStateMixin, MetricsMixin, Widget, can_focus=True):
+    """A read-only summary of the RGB, HSV and Hex values, which stands in
+    for `ColorInputs` until the user clicks it or presses Enter while it has
+    focus.
+
+    This is much cheaper to mount than the input widgets, so a `ColorPicker`
+    with lazy inputs only creates them when they are needed. Focusing alone
+    doesn't activate the summary, since the screen may focus it automatically.
+    """
+
+    ALLOW_SELECT = False
+
+    DEFAULT_CSS = """
+    ColorInputsSummary {
+        width: 24;
+        height: 3;
+        color: $text-muted;
+
+        &:hover, &:focus {
+            color: $text;
+            background: $boost;
+        }
+    }
+    """
+
+    hsv: reactive[HSV] = reactive(HSV(0.0, 1.0, 1.0), init=False)
+    """The current HSV (Hue, Saturation, Value) values in the range 0 to 1."""
+
+    class Activated(Message):
+        """Posted when the summary is activated, to request the real inputs.
+
+        This message can be handled using an `on_color_inputs_summary_activated`
+        method.
+        """
+
+        def __init__(self, color_inputs_summary: ColorInputsSummary) -> None:
+            super().__init__()
+            self.color_inputs_summary: ColorInputsSummary = color_inputs_summary
+
+        @property
+        def control(self) -> ColorInputsSummary:
+            return self.color_inputs_summary
+
+    def __init__(
+        self,
+        hsv: HSV = HSV(0.0, 1.0, 1.0),
+        *,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+        disabled: bool = False,
+    ) -> None:
+        """Create a color inputs summary widget.
+
+        Args:
+            hsv: The initial HSV (Hue, Saturation, Value) values in the range 0 to 1.
+            name: The name of the widget.
+            id: The ID of the widget in the DOM.
+            classes: The CSS classes of the widget.
+            disabled: Whether the widget is disabled or not.
+        """
+        super().__init__(name=name, id=id, classes=classes, disabled=disabled)
+        self.set_state(ColorState.from_hsv(hsv))
+
+    def watch_hsv(self) -> None:
+        self._record_watcher("hsv")
+
+        self._sync_state()
+
+    def render(self) -> str:
+        r, g, b = self._state.rgb
+        h, s, v = self._state.scaled_integers
+        return f"RGB {r:>3} {g:>3} {b:>3}\nHSV {h:>3} {s:>3} {v:>3}\n{self._state.hex}"
+
+    def _activate(self) -> None:
+        message = self.Activated(self)
+        self._post_and_record(message)
+
+    async def _on_key(self, event: events.Key) -> None:
+        if event.key in ("enter", "space"):
+            event.stop()
+            event.prevent_default()
+            self._activate()
+
+    async def _on_click(self, event: events.Click) -> None:
+        self._activate()
 
 
 if __name__ == "__main__":
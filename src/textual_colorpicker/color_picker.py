@@ -1,19 +1,37 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
+from time import monotonic
+from typing import Generator, Sequence
+
+from textual import events
 from textual.app import ComposeResult
 from textual.color import HSV, Color
 from textual.containers import VerticalGroup
 from textual.message import Message
 from textual.reactive import var
+from textual.timer import Timer
 from textual.widget import Widget
-
-from textual_colorpicker.color_inputs import ColorInputs, HexInput, HsvInputs, RgbInputs
+from textual.widgets import Input
+
+from textual_colorpicker._cached_query import CachedQueryWidget
+from textual_colorpicker.color_inputs import (
+    ColorInputs,
+    ColorInputsSummary,
+    HexInput,
+    HsvInputs,
+    RgbInputs,
+)
 from textual_colorpicker.color_preview import ColorPreview
+from textual_colorpicker.color_state import ColorState
+from textual_colorpicker.compact_color_inputs import CompactColorInputs
 from textual_colorpicker.hue_picker import HuePicker
+from textual_colorpicker.metrics import MetricsMixin
 from textual_colorpicker.saturation_value_picker import SaturationValuePicker
+from textual_colorpicker.swatch_grid import SwatchGrid
 
 
-class ColorPicker(Widget):
+class ColorPicker(MetricsMixin, CachedQueryWidget):
     """A color picker widget."""
 
     DEFAULT_CSS = """
@@ -44,14 +62,33 @@ class ColorPicker(Widget):
         ColorInputs {
             margin-left: 2;
         }
+
+        CompactColorInputs {
+            margin-left: 2;
+        }
+
+        ColorInputsSummary {
+            margin-left: 2;
+        }
+
+        SwatchGrid {
+            width: 26;
+            height: 20;
+            margin-left: 2;
+        }
     }
     """
 
     color: var[Color] = var(Color(255, 0, 0), init=False)
     """The current color value."""
 
-    _hsv: var[HSV] = var(HSV(0.0, 1.0, 1.0), init=False)
-    """The current HSV color value."""
+    state: var[ColorState] = var(ColorState(), init=False)
+    """The current color state, which holds the authoritative color value and is
+    shared with the child widgets. Setting the `color` replaces the state."""
+
+    changed_rate_limit: var[float | None] = var(None)
+    """The maximum number of `Changed` messages to post per second, or `None`
+    for no limit. The latest color is always posted once the limit allows."""
 
     class Changed(Message):
         """Posted when the color value changes.
@@ -68,10 +105,30 @@ class ColorPicker(Widget):
         def control(self) -> ColorPicker:
             return self.color_picker
 
+    class Committed(Message):
+        """Posted when a color change is committed by releasing the mouse,
+        pressing Enter or leaving an input.
+
+        This message can be handled using an `on_color_picker_committed` method.
+        """
+
+        def __init__(self, color_picker: ColorPicker, color: Color) -> None:
+            super().__init__()
+            self.color: Color = color
+            self.color_picker = color_picker
+
+        @property
+        def control(self) -> ColorPicker:
+            return self.color_picker
+
     def __init__(
         self,
         color: Color = Color(255, 0, 0),
         *,
+        swatches: Sequence[Color] | None = None,
+        changed_rate_limit: float | None = None,
+        compact_inputs: bool = False,
+        lazy_inputs: bool = False,
         name: str | None = None,
         id: str | None = None,
         classes: str | None = None,
@@ -81,64 +138,214 @@ class ColorPicker(Widget):
 
         Args:
             color: The initial color value.
+            swatches: Colors to show in a grid of swatches next to the picker,
+                which set the color when clicked.
+            changed_rate_limit: The maximum number of `Changed` messages to post
+                per second, or `None` for no limit.
+            compact_inputs: Whether to use `CompactColorInputs`, which draws all
+                the inputs on a single line, rather than `ColorInputs`.
+            lazy_inputs: Whether to show a read-only summary of the color values,
+                and only mount the `ColorInputs` when the summary is clicked or
+                Enter is pressed. Ignored with `compact_inputs`.
             name: The name of the widget.
             id: The ID of the widget in the DOM.
             classes: The CSS classes of the widget.
             disabled: Whether the widget is disabled or not.
         """
         super().__init__(name=name, id=id, classes=classes, disabled=disabled)
-        color = color.clamped
-        self.color = color
-        self._hsv = color.hsv
+        self._swatches = swatches
+        self._compact_inputs = compact_inputs
+        self._lazy_inputs = lazy_inputs and not compact_inputs
+        self._batch_depth = 0
+        self._batch_start_color = Color(255, 0, 0)
+        self._last_changed_color = color.clamped
+        self._last_changed_time = 0.0
+        self._changed_timer: Timer | None = None
+        self._uncommitted = False
+        self.changed_rate_limit = changed_rate_limit
+        self.state = ColorState(color)
 
     def compose(self) -> ComposeResult:
-        hsv = self._hsv
+        state = self.state
         with VerticalGroup():
-            yield SaturationValuePicker(hsv)
-            yield HuePicker(hsv.h)
+            yield SaturationValuePicker(state.hsv)
+            yield HuePicker(state.hsv.h)
         with VerticalGroup():
-            yield ColorPreview(self.color)
-            yield ColorInputs(self.color)
+            yield ColorPreview(state.color)
+            if self._compact_inputs:
+                yield CompactColorInputs(state.hsv)
+            elif self._lazy_inputs:
+                yield ColorInputsSummary(state.hsv)
+            else:
+                yield ColorInputs(state=state)
+        if self._swatches is not None:
+            yield SwatchGrid(self._swatches)
+
+    async def recompose(self) -> None:
+        # The new inputs are created from the current state, so any messages
+        # they post while mounting would only echo it back.
+        with self.prevent(HsvInputs.Changed, RgbInputs.Changed, HexInput.Changed):
+            await super().recompose()
+
+    def _query_children(self) -> None:
+        self._saturation_value_picker = self.query_one(SaturationValuePicker)
+        self._hue_picker = self.query_one(HuePicker)
+        self._color_preview = self.query_one(ColorPreview)
+        self._rgb_inputs: RgbInputs | None = None
+        self._hsv_inputs: HsvInputs | None = None
+        self._hex_input: HexInput | None = None
+        self._compact_color_inputs: CompactColorInputs | None = None
+        self._color_inputs_summary: ColorInputsSummary | None = None
+        if self._compact_inputs:
+            self._compact_color_inputs = self.query_one(CompactColorInputs)
+        elif self.query(ColorInputsSummary):
+            self._color_inputs_summary = self.query_one(ColorInputsSummary)
+        else:
+            self._rgb_inputs = self.query_one(RgbInputs)
+            self._hsv_inputs = self.query_one(HsvInputs)
+            self._hex_input = self.query_one(HexInput)
+
+        if self._metrics is not None:
+            self._metrics.attach(self)
 
     def validate_color(self, color: Color) -> Color:
         return color.clamped
 
-    def watch_color(self) -> None:
-        hsv = self.color.hsv
-        self.set_reactive(ColorPicker._hsv, hsv)
+    def watch_color(self, new_color: Color) -> None:
+        self._record_watcher("color")
 
-        self._update_all_from_color_and_hsv()
+        self.state = ColorState(new_color)
 
-        self.post_message(self.Changed(self, self.color))
+    def watch_state(self, old_state: ColorState, new_state: ColorState) -> None:
+        self._record_watcher("state")
 
-    def _watch__hsv(self) -> None:
-        old_color = self.color
-        new_color = Color.from_hsv(*self._hsv)
-        self.set_reactive(ColorPicker.color, new_color)
+        self.set_reactive(ColorPicker.color, new_state.color)
 
-        self._update_all_from_color_and_hsv()
+        self._apply_color_change(old_state.color)
 
-        if new_color != old_color:
-            self.post_message(self.Changed(self, self.color))
+    @property
+    def _hsv(self) -> HSV:
+        """The current HSV color value."""
+        return self.state.hsv
 
-    def _update_all_from_color_and_hsv(self) -> None:
-        if not self.is_mounted:
+    @_hsv.setter
+    def _hsv(self, hsv: HSV) -> None:
+        self.state = ColorState.from_hsv(hsv)
+
+    @contextmanager
+    def batch_update(self) -> Generator[None, None, None]:
+        """A context manager to apply multiple color changes as a single update.
+
+        The child widgets are only updated once the outermost batch exits, and
+        at most one `ColorPicker.Changed` message is posted.
+
+        Example:
+            ```python
+            with color_picker.batch_update():
+                color_picker.color = Color(0, 0, 0)
+                color_picker.color = Color(255, 255, 255)
+            ```
+        """
+        if self._batch_depth == 0:
+            self._batch_start_color = self.color
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._apply_color_change(self._batch_start_color)
+
+    def _apply_color_change(self, old_color: Color) -> None:
+        # Changes within a batch are deferred until the batch exits.
+        if self._batch_depth:
+            return
+
+        self._update_all_from_state()
+
+        if self.color != old_color:
+            self._post_changed()
+
+    def _post_changed(self) -> None:
+        """Post a `Changed` message, unless that would exceed the rate limit, in
+        which case the latest color is posted once the limit allows."""
+        rate_limit = self.changed_rate_limit
+        if rate_limit and self.is_mounted:
+            delay = self._last_changed_time + 1 / rate_limit - monotonic()
+            if delay > 0:
+                if self._changed_timer is None:
+                    self._changed_timer = self.set_timer(delay, self._flush_changed)
+                return
+
+        self._flush_changed()
+
+    def _flush_changed(self) -> None:
+        """Post a `Changed` message for the latest color, if it has changed
+        since the last message."""
+        if self._changed_timer is not None:
+            self._changed_timer.stop()
+            self._changed_timer = None
+
+        if self.color == self._last_changed_color:
+            return
+        self._last_changed_color = self.color
+        self._last_changed_time = monotonic()
+
+        message = self.Changed(self, self.color)
+        self._post_and_record(message)
+
+    def _commit(self) -> None:
+        """Post a `Committed` message if the color has been changed by the user
+        since the last commit."""
+        if not self._uncommitted:
             return
-        color = self.color
-        self.query_one(ColorPreview).color = color
-        self.query_one(RgbInputs).color = color
-        self.query_one(HexInput).value = color.hex
+        self._uncommitted = False
 
-        hsv = self._hsv
-        self.query_one(HuePicker).hue = hsv.h
-        self.query_one(SaturationValuePicker).hsv = hsv
-        self.query_one(HsvInputs).hsv = hsv
+        # Deliver any rate-limited change first, so handlers always see the
+        # final `Changed` message before the `Committed` message.
+        self._flush_changed()
+
+        message = self.Committed(self, self.color)
+        self._post_and_record(message)
+
+    def _update_all_from_state(self) -> None:
+        if not self.is_mounted:
+            return
+        # Prevent the child widgets echoing their changes back to the color
+        # picker, which would otherwise flood the message queue with stale
+        # values when the color is changed rapidly, for example when dragging.
+        with self.prevent(
+            RgbInputs.Changed,
+            HexInput.Changed,
+            HuePicker.Changed,
+            SaturationValuePicker.Changed,
+            HsvInputs.Changed,
+            Input.Changed,
+            CompactColorInputs.Changed,
+        ), self.app.batch_update():
+            # The state is shared with the children, so each representation
+            # is converted at most once however many children display it.
+            state = self.state
+            self._color_preview.color = state.color
+            self._hue_picker.hue = state.hsv.h
+            self._saturation_value_picker.hsv = state.hsv
+
+            if self._compact_color_inputs is not None:
+                self._compact_color_inputs.set_state(state)
+            if self._color_inputs_summary is not None:
+                self._color_inputs_summary.set_state(state)
+            if self._rgb_inputs is not None:
+                self._rgb_inputs.color = state.color
+            if self._hsv_inputs is not None:
+                self._hsv_inputs.set_state(state)
+            if self._hex_input is not None:
+                self._hex_input.value = state.hex
 
     def _on_hue_picker_changed(self, event: HuePicker.Changed) -> None:
         event.stop()
         h = event.hue
         _, s, v = self._hsv
-        self._hsv = HSV(h, s, v)
+        self._update_hsv_from_picker(HSV(h, s, v))
 
     def _on_saturation_value_picker_changed(
         self, event: SaturationValuePicker.Changed
@@ -146,20 +353,88 @@ class ColorPicker(Widget):
         event.stop()
         h, _, _ = self._hsv
         _, s, v = event.hsv
-        self._hsv = HSV(h, s, v)
+        self._update_hsv_from_picker(HSV(h, s, v))
+
+    def _update_hsv_from_picker(self, hsv: HSV) -> None:
+        # Changes from the pickers are committed when the mouse is released.
+        # Only a change of color is committed, so for example changing the hue
+        # of a gray posts neither a `Changed` nor a `Committed` message.
+        if hsv != self._hsv:
+            old_color = self.color
+            self._hsv = hsv
+            if self.color != old_color:
+                self._uncommitted = True
+
+    async def _on_mouse_up(self, event: events.MouseUp) -> None:
+        # The pickers have already updated their values when the mouse up
+        # bubbles here, but their final `Changed` message may still be on the
+        # way, so apply their values before committing.
+        h = self._hue_picker.hue
+        _, s, v = self._saturation_value_picker.hsv
+        self._update_hsv_from_picker(HSV(h, s, v))
+        self._commit()
+
+    async def _on_color_inputs_summary_activated(
+        self, event: ColorInputsSummary.Activated
+    ) -> None:
+        event.stop()
+        summary = self._color_inputs_summary
+        if summary is None:
+            return
+        self._lazy_inputs = False
+        focus_inputs = summary.has_focus
+        container = summary.parent
+        assert isinstance(container, Widget)
+        color_inputs = ColorInputs(state=self.state)
+        with self.prevent(HsvInputs.Changed, RgbInputs.Changed, HexInput.Changed):
+            await container.mount(color_inputs, after=summary)
+        if focus_inputs:
+            # Move the focus before removing the summary, otherwise the screen
+            # would move it to the next widget in the focus chain.
+            self.screen.set_focus(color_inputs.query(Input).first())
+        await summary.remove()
+        self._query_children()
+        self._update_all_from_state()
+
+    # The inputs only post their changes on Enter or blur, so changes from the
+    # inputs and swatches are committed immediately.
 
     def _on_rgb_inputs_changed(self, event: RgbInputs.Changed) -> None:
         event.stop()
-        self.color = event.color
+        self._update_color_from_input(event.color)
 
     def _on_hsv_inputs_changed(self, event: HsvInputs.Changed) -> None:
         event.stop()
-        self._hsv = event.hsv
+        self._update_hsv_from_input(event.hsv)
+
+    def _on_compact_color_inputs_changed(
+        self, event: CompactColorInputs.Changed
+    ) -> None:
+        event.stop()
+        self._update_hsv_from_input(event.hsv)
 
     def _on_hex_input_changed(self, event: HexInput.Changed) -> None:
         event.stop()
-        color = Color.parse(event.value)
-        self.color = color
+        self._update_color_from_input(event.color)
+
+    def _on_swatch_grid_selected(self, event: SwatchGrid.Selected) -> None:
+        event.stop()
+        self._update_color_from_input(event.color)
+
+    def _update_color_from_input(self, color: Color) -> None:
+        # Inputs that are re-submitted or blurred without an edit are ignored.
+        if color.clamped != self.color:
+            self.color = color
+            self._uncommitted = True
+            self._commit()
+
+    def _update_hsv_from_input(self, hsv: HSV) -> None:
+        if hsv != self._hsv:
+            old_color = self.color
+            self._hsv = hsv
+            if self.color != old_color:
+                self._uncommitted = True
+                self._commit()
 
 
 if __name__ == "__main__":
@@ -1,11 +1,16 @@
+from __future__ import annotations
+
 from textual.app import RenderResult
 from textual.color import Color
 from textual.reactive import reactive
 from textual.renderables.blank import Blank
+from textual.strip import Strip
 from textual.widget import Widget
 
+from textual_colorpicker.metrics import MetricsMixin, measure_render
+
 
-class ColorPreview(Widget):
+class ColorPreview(MetricsMixin, Widget):
     """A color preview widget."""
 
     color: reactive[Color] = reactive(Color(255, 0, 0))
@@ -18,7 +23,7 @@ class ColorPreview(Widget):
         name: str | None = None,
         id: str | None = None,
         classes: str | None = None,
-        disabled: bool = False
+        disabled: bool = False,
     ) -> None:
         """Create a color preview widget.
 
@@ -34,3 +39,7 @@ class ColorPreview(Widget):
 
     def render(self) -> RenderResult:
         return Blank(self.color)
+
+    @measure_render
+    def render_line(self, y: int) -> Strip:
+        return super().render_line(y)
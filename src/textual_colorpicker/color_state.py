@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from textual.color import HSV, Color
+from textual.geometry import clamp
+
+from textual_colorpicker.conversions import (
+    hsv_to_rgb,
+    hsv_to_scaled_integers,
+    rgb_to_hex,
+    rgb_to_hsv,
+)
+
+
+class ColorState:
+    """An immutable color value, which is shared by the color picker and its
+    child widgets.
+
+    The state is created from either a `Color` or HSV values, which is kept as
+    the authoritative value. The other representations are only computed when
+    first needed and then cached, so each is converted at most once however
+    many widgets read it, and HSV values never drift from a round trip through
+    RGB.
+
+    Example:
+        ```python
+        state = ColorState.from_hsv(HSV(0.5, 1.0, 1.0))
+        assert state.hex == "#00FFFF"
+        ```
+    """
+
+    __slots__ = ("_color", "_hsv", "_scaled_integers", "_hex", "_from_hsv")
+
+    def __init__(self, color: Color = Color(255, 0, 0)) -> None:
+        """Create a color state from a color.
+
+        Args:
+            color: The color value.
+        """
+        self._color: Color | None = color.clamped
+        self._hsv: HSV | None = None
+        self._scaled_integers: tuple[int, int, int] | None = None
+        self._hex: str | None = None
+        self._from_hsv = False
+
+    @classmethod
+    def from_hsv(cls, hsv: HSV) -> ColorState:
+        """Create a color state from HSV values.
+
+        Args:
+            hsv: The HSV (Hue, Saturation, Value) values, which are clamped to
+                the range 0 to 1.
+
+        Returns:
+            A new color state.
+        """
+        h, s, v = hsv
+        state = cls.__new__(cls)
+        state._color = None
+        state._hsv = HSV(clamp(h, 0.0, 1.0), clamp(s, 0.0, 1.0), clamp(v, 0.0, 1.0))
+        state._scaled_integers = None
+        state._hex = None
+        state._from_hsv = True
+        return state
+
+    @property
+    def color(self) -> Color:
+        """The color value."""
+        if self._color is None:
+            assert self._hsv is not None
+            self._color = Color(*hsv_to_rgb(*self._hsv))
+        return self._color
+
+    @property
+    def rgb(self) -> tuple[int, int, int]:
+        """The red, green and blue values in the range 0 to 255."""
+        return self.color.rgb
+
+    @property
+    def hsv(self) -> HSV:
+        """The HSV (Hue, Saturation, Value) values in the range 0 to 1."""
+        if self._hsv is None:
+            self._hsv = rgb_to_hsv(*self.rgb)
+        return self._hsv
+
+    @property
+    def scaled_integers(self) -> tuple[int, int, int]:
+        """The hue in degrees, and the saturation and value as percentages."""
+        if self._scaled_integers is None:
+            self._scaled_integers = hsv_to_scaled_integers(*self.hsv)
+        return self._scaled_integers
+
+    @property
+    def hex(self) -> str:
+        """The uppercase hex color in the form `#RRGGBB`."""
+        if self._hex is None:
+            self._hex = rgb_to_hex(*self.rgb)
+        return self._hex
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ColorState):
+            return NotImplemented
+        # Compare the values the states were created from where possible, so
+        # comparing doesn't convert either state.
+        if self._from_hsv and other._from_hsv:
+            return self._hsv == other._hsv
+        if not self._from_hsv and not other._from_hsv:
+            return self._color == other._color
+        return self.hsv == other.hsv and self.color == other.color
+
+    def __hash__(self) -> int:
+        # Equal states always have equal colors.
+        return hash(self.color)
+
+    def __repr__(self) -> str:
+        return f"ColorState({self.color!r}, hsv={self.hsv!r})"
+
+
+class ColorStateMixin:
+    """A mixin for widgets that keep a color state in sync with their `hsv`
+    reactive, so a state shared by the color picker is never converted again.
+    """
+
+    _state: ColorState
+    """The color state of the current HSV."""
+
+    if TYPE_CHECKING:
+        hsv: HSV
+
+    def validate_hsv(self, hsv: HSV) -> HSV:
+        h, s, v = hsv
+        return HSV(clamp(h, 0.0, 1.0), clamp(s, 0.0, 1.0), clamp(v, 0.0, 1.0))
+
+    def set_state(self, state: ColorState) -> None:
+        """Set the HSV from a color state shared with other widgets, so its
+        cached conversions are reused.
+
+        Args:
+            state: The color state.
+        """
+        self._state = state
+        self.hsv = state.hsv
+
+    def _sync_state(self) -> None:
+        """Replace the color state if the HSV has been set directly, rather
+        than with `set_state`. Call this from the `hsv` watcher."""
+        if self.hsv != self._state.hsv:
+            self._state = ColorState.from_hsv(self.hsv)
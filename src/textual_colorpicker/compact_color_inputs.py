@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from rich.segment import Segment
+from textual import events
+from textual.color import HSV, Color
+from textual.geometry import clamp
+from textual.message import Message
+from textual.reactive import reactive
+from textual.strip import Strip
+from textual.widget import Widget
+
+from textual_colorpicker.color_state import ColorState, ColorStateMixin
+from textual_colorpicker.conversions import parse_color, scaled_integers_to_hsv
+from textual_colorpicker.metrics import MetricsMixin, measure_render
+
+
+class _Field(NamedTuple):
+    label: str
+    width: int
+    maximum: int
+    characters: str
+
+
+_DIGITS = "0123456789"
+_HEX_DIGITS = "0123456789abcdefABCDEF"
+
+_FIELDS = (
+    _Field("R", 3, 255, _DIGITS),
+    _Field("G", 3, 255, _DIGITS),
+    _Field("B", 3, 255, _DIGITS),
+    _Field("H", 3, 360, _DIGITS),
+    _Field("S", 3, 100, _DIGITS),
+    _Field("V", 3, 100, _DIGITS),
+    _Field("#", 6, 0xFFFFFF, _HEX_DIGITS),
+)
+
+_HEX_FIELD = len(_FIELDS) - 1
+
+
+class CompactColorInputs(ColorStateMixin, MetricsMixin, Widget, can_focus=True):
+    """A compact alternative to `ColorInputs`, which draws the RGB, HSV and Hex
+    fields on a single line and edits them in place.
+
+    Select a field by clicking it or with the left and right arrow keys, then
+    type a new value and press Enter. The up and down arrow keys step the
+    value of the selected field.
+    """
+
+    ALLOW_SELECT = False
+
+    COMPONENT_CLASSES = {
+        "compact-color-inputs--field",
+        "compact-color-inputs--cursor",
+    }
+
+    DEFAULT_CSS = """
+    CompactColorInputs {
+        width: 44;
+        height: 1;
+
+        & > .compact-color-inputs--field {
+            background: $boost;
+        }
+
+        & > .compact-color-inputs--cursor {
+            background: $boost;
+        }
+
+        &:focus > .compact-color-inputs--cursor {
+            background: $accent;
+            color: $text-accent;
+        }
+    }
+    """
+
+    hsv: reactive[HSV] = reactive(HSV(0.0, 1.0, 1.0), init=False)
+    """The current HSV (Hue, Saturation, Value) values in the range 0 to 1."""
+
+    class Changed(Message):
+        """Posted when the HSV (Hue, Saturation, Value) value changes.
+
+        This message can be handled using an `on_compact_color_inputs_changed` method.
+        """
+
+        def __init__(self, compact_color_inputs: CompactColorInputs, hsv: HSV) -> None:
+            super().__init__()
+            self.hsv: HSV = hsv
+            self.compact_color_inputs: CompactColorInputs = compact_color_inputs
+
+        @property
+        def control(self) -> CompactColorInputs:
+            return self.compact_color_inputs
+
+    def __init__(
+        self,
+        hsv: HSV = HSV(0.0, 1.0, 1.0),
+        *,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+        disabled: bool = False,
+    ) -> None:
+        """Create a compact color inputs widget.
+
+        Args:
+            hsv: The initial HSV (Hue, Saturation, Value) values in the range 0 to 1.
+            name: The name of the widget.
+            id: The ID of the widget in the DOM.
+            classes: The CSS classes of the widget.
+            disabled: Whether the widget is disabled or not.
+        """
+        super().__init__(name=name, id=id, classes=classes, disabled=disabled)
+        self.set_state(ColorState.from_hsv(hsv))
+        self._cursor = 0
+        self._edit_buffer: str | None = None
+
+    @property
+    def color(self) -> Color:
+        """The current color value."""
+        return self._state.color
+
+    def watch_hsv(self) -> None:
+        self._record_watcher("hsv")
+
+        self._sync_state()
+
+        message = self.Changed(self, self.hsv)
+        self._post_and_record(message)
+
+    def _get_field_values(self) -> list[str]:
+        """Get the text of each field for the current HSV value."""
+        state = self._state
+        return [
+            *(str(channel) for channel in state.rgb),
+            *(str(value) for value in state.scaled_integers),
+            state.hex[1:].lower(),
+        ]
+
+    @measure_render
+    def render_line(self, y: int) -> Strip:
+        if y != 0:
+            return Strip.blank(self.size.width, self.rich_style)
+
+        base_style = self.rich_style
+        field_style = base_style + self.get_component_rich_style(
+            "compact-color-inputs--field", partial=True
+        )
+        cursor_style = base_style + self.get_component_rich_style(
+            "compact-color-inputs--cursor", partial=True
+        )
+
+        segments: list[Segment] = []
+        for index, (field, value) in enumerate(zip(_FIELDS, self._get_field_values())):
+            if index == self._cursor and self._edit_buffer is not None:
+                text = self._edit_buffer.ljust(field.width)
+            else:
+                text = value.rjust(field.width)
+            style = cursor_style if index == self._cursor else field_style
+            separator = " " if index else ""
+            segments.append(Segment(f"{separator}{field.label} ", base_style))
+            segments.append(Segment(text, style))
+
+        return Strip(segments).adjust_cell_length(self.size.width, base_style)
+
+    def _get_field_at(self, x: int) -> int | None:
+        """Get the index of the field at a column of the widget.
+
+        Args:
+            x: The column relative to the content region.
+
+        Returns:
+            The index of the field, or `None` if the column is not in a field.
+        """
+        field_x = 0
+        for index, field in enumerate(_FIELDS):
+            if index:
+                field_x += 1
+            field_x += len(field.label) + 1
+            if field_x <= x < field_x + field.width:
+                return index
+            field_x += field.width
+        return None
+
+    def _move_cursor(self, cursor: int) -> None:
+        self._commit_edit()
+        self._cursor = clamp(cursor, 0, len(_FIELDS) - 1)
+        self.refresh()
+
+    def _commit_edit(self) -> None:
+        """Apply the value being edited in the selected field, if any."""
+        edit_buffer = self._edit_buffer
+        if edit_buffer is None:
+            return
+        self._edit_buffer = None
+        self.refresh()
+        if not edit_buffer:
+            return
+
+        if self._cursor == _HEX_FIELD:
+            if len(edit_buffer) in (3, 6):
+                self.set_state(ColorState(parse_color(f"#{edit_buffer}")))
+            return
+
+        self._set_field_value(self._cursor, int(edit_buffer))
+
+    def _set_field_value(self, index: int, value: int) -> None:
+        """Set the value of one of the RGB or HSV fields.
+
+        Args:
+            index: The index of the field.
+            value: The new value, which is clamped to the range of the field.
+        """
+        value = clamp(value, 0, _FIELDS[index].maximum)
+        if index < 3:
+            rgb = list(self._state.rgb)
+            rgb[index] = value
+            r, g, b = rgb
+            if (r, g, b) != self._state.rgb:
+                # Keep the RGB as the authoritative value, so it doesn't drift.
+                self.set_state(ColorState(Color(r, g, b)))
+        else:
+            scaled_integers = list(self._state.scaled_integers)
+            scaled_integers[index - 3] = value
+            h, s, v = scaled_integers
+            if (h, s, v) != self._state.scaled_integers:
+                self.hsv = scaled_integers_to_hsv(h, s, v)
+
+    def _step_field_value(self, step: int) -> None:
+        self._commit_edit()
+        if self._cursor == _HEX_FIELD:
+            return
+        value = int(self._get_field_values()[self._cursor])
+        self._set_field_value(self._cursor, value + step)
+
+    async def _on_key(self, event: events.Key) -> None:
+        key = event.key
+        if key in ("left", "right"):
+            self._move_cursor(self._cursor + (1 if key == "right" else -1))
+        elif key in ("up", "down"):
+            self._step_field_value(1 if key == "up" else -1)
+        elif key == "enter":
+            self._commit_edit()
+        elif key == "escape" and self._edit_buffer is not None:
+            self._edit_buffer = None
+            self.refresh()
+        elif key == "backspace":
+            if self._edit_buffer is None:
+                self._edit_buffer = self._get_field_values()[self._cursor]
+            self._edit_buffer = self._edit_buffer[:-1]
+            self.refresh()
+        elif event.character and event.character in _FIELDS[self._cursor].characters:
+            # Typing into a field replaces its value, like a selected input.
+            field = _FIELDS[self._cursor]
+            edit_buffer = self._edit_buffer or ""
+            if len(edit_buffer) < field.width:
+                self._edit_buffer = edit_buffer + event.character
+                self.refresh()
+        else:
+            return
+        event.stop()
+        event.prevent_default()
+
+    async def _on_click(self, event: events.Click) -> None:
+        mouse_offset = event.get_content_offset(self)
+        if mouse_offset is None:
+            return
+        index = self._get_field_at(mouse_offset.x)
+        if index is not None:
+            self._move_cursor(index)
+
+    def _on_blur(self, event: events.Blur) -> None:
+        self._commit_edit()
+
+
+if __name__ == "__main__":
+    from textual.app import App, ComposeResult
+
+    class CompactColorInputsApp(App):
+        CSS = """
+        Screen {
+            align: center middle;
+        }
+        """
+
+        def compose(self) -> ComposeResult:
+            yield CompactColorInputs()
+
+    app = CompactColorInputsApp()
+    app.run()
@@ -0,0 +1,293 @@
+"""Color conversions shared by the color picker widgets.
+
+The conversions give identical results to the equivalent Textual `Color`
+methods, while avoiding creating intermediate color objects. The grid of
+saturation/value colors is converted with NumPy when it is installed.
+"""
+
+from __future__ import annotations
+
+import colorsys
+import re
+from functools import lru_cache
+from importlib.util import find_spec
+from types import ModuleType
+from typing import Any, Sequence
+
+from textual._color_constants import COLOR_NAME_TO_RGB
+from textual.color import HSV, Color
+
+HAS_NUMPY = find_spec("numpy") is not None
+"""Whether NumPy is installed. It is only imported when first needed, as it is
+slow to import and most widgets never use it."""
+
+_HEX_BYTES = [f"{value:02X}" for value in range(256)]
+"""Lookup table of the uppercase hex digits for each byte value."""
+
+_PARSE_CACHE_SIZE = 256
+"""The maximum number of recently parsed color strings to remember."""
+
+_COLOR_PATTERN = re.compile(
+    r"""
+    \#?(?P<hex>[0-9a-f]{8}|[0-9a-f]{6}|[0-9a-f]{3,4})
+    |rgba?\((?P<rgb>[^)]*)\)
+    |hsla?\((?P<hsl>[^)]*)\)
+    |(?P<name>[a-z_]+)
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+"""Matches every supported color format in a single pass."""
+
+_ARGUMENT_SEPARATOR = re.compile(r"[\s,/]+")
+
+
+def hsv_to_rgb(h: float, s: float, v: float) -> tuple[int, int, int]:
+    """Convert HSV values in the range 0 to 1 to RGB values in the range 0 to 255.
+
+    Args:
+        h: Hue.
+        s: Saturation.
+        v: Value.
+
+    Returns:
+        A tuple of the red, green and blue values.
+    """
+    r, g, b = colorsys.hsv_to_rgb(h, s, v)
+    return int(r * 255 + 0.5), int(g * 255 + 0.5), int(b * 255 + 0.5)
+
+
+def rgb_to_hsv(r: int, g: int, b: int) -> HSV:
+    """Convert RGB values in the range 0 to 255 to HSV values in the range 0 to 1.
+
+    Args:
+        r: Red.
+        g: Green.
+        b: Blue.
+
+    Returns:
+        The HSV (Hue, Saturation, Value) values.
+    """
+    h, s, v = colorsys.rgb_to_hsv(r / 255, g / 255, b / 255)
+    return HSV(h, s, v)
+
+
+def rgb_to_hex(r: int, g: int, b: int) -> str:
+    """Convert RGB values in the range 0 to 255 to an uppercase hex color.
+
+    Args:
+        r: Red.
+        g: Green.
+        b: Blue.
+
+    Returns:
+        The hex color in the form `#RRGGBB`.
+    """
+    return f"#{_HEX_BYTES[r]}{_HEX_BYTES[g]}{_HEX_BYTES[b]}"
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def parse_color(text: str) -> Color:
+    """Parse a color in any of the formats accepted by the color inputs.
+
+    The supported formats are `#RGB`, `#RGBA`, `#RRGGBB` and `#RRGGBBAA` (where
+    the `#` is optional), `rgb()`, `rgba()`, `hsl()`, `hsla()` and color names.
+    Recently parsed strings are remembered, so validating and then applying
+    the same input only parses it once.
+
+    Args:
+        text: The color to parse.
+
+    Raises:
+        ValueError: If the color is not valid.
+
+    Returns:
+        The parsed color.
+    """
+    match = _COLOR_PATTERN.fullmatch(text.strip())
+    if match is None:
+        raise ValueError(f"Invalid color: {text}")
+
+    kind = match.lastgroup
+    value = match.group(kind) if kind else ""
+    try:
+        if kind == "hex":
+            return _parse_hex(value)
+        if kind == "rgb":
+            return _parse_rgb(value)
+        if kind == "hsl":
+            return _parse_hsl(value)
+        red, green, blue, *alpha = COLOR_NAME_TO_RGB[value.lower()]
+    except (KeyError, ValueError):
+        raise ValueError(f"Invalid color: {text}") from None
+
+    return Color(red, green, blue, alpha[0] if alpha else 1.0)
+
+
+def _parse_hex(digits: str) -> Color:
+    if len(digits) <= 4:
+        digits = "".join(digit * 2 for digit in digits)
+    value = int(digits, 16)
+    if len(digits) == 8:
+        alpha = (value & 0xFF) / 255
+        value >>= 8
+    else:
+        alpha = 1.0
+    return Color(value >> 16, (value >> 8) & 0xFF, value & 0xFF, alpha)
+
+
+def _parse_arguments(arguments: str) -> list[str]:
+    values = _ARGUMENT_SEPARATOR.split(arguments.strip())
+    if len(values) not in (3, 4):
+        raise ValueError(f"Expected 3 or 4 values: {arguments}")
+    return values
+
+
+def _parse_alpha(values: list[str]) -> float:
+    if len(values) < 4:
+        return 1.0
+    alpha = values[3]
+    if alpha.endswith("%"):
+        return min(max(float(alpha[:-1]) / 100, 0.0), 1.0)
+    return min(max(float(alpha), 0.0), 1.0)
+
+
+def _parse_rgb(arguments: str) -> Color:
+    values = _parse_arguments(arguments)
+    rgb = [
+        (float(channel[:-1]) * 255 / 100 if channel.endswith("%") else float(channel))
+        for channel in values[:3]
+    ]
+    red, green, blue = [int(min(max(channel, 0), 255) + 0.5) for channel in rgb]
+    return Color(red, green, blue, _parse_alpha(values))
+
+
+def _parse_hsl(arguments: str) -> Color:
+    values = _parse_arguments(arguments)
+    hue, saturation, lightness = values[:3]
+    if hue.endswith("deg"):
+        hue = hue[:-3]
+    if not (saturation.endswith("%") and lightness.endswith("%")):
+        raise ValueError(f"Expected saturation and lightness percentages: {arguments}")
+    color = Color.from_hsl(
+        float(hue) / 360 % 1,
+        min(max(float(saturation[:-1]) / 100, 0.0), 1.0),
+        min(max(float(lightness[:-1]) / 100, 0.0), 1.0),
+    )
+    return color.with_alpha(_parse_alpha(values))
+
+
+def hsv_to_scaled_integers(h: float, s: float, v: float) -> tuple[int, int, int]:
+    """Convert HSV values in the range 0 to 1 to integer degrees and percentages.
+
+    Args:
+        h: Hue.
+        s: Saturation.
+        v: Value.
+
+    Returns:
+        A tuple of the hue in degrees, and the saturation and value as percentages.
+    """
+    return int(h * 360 + 0.5), int(s * 100 + 0.5), int(v * 100 + 0.5)
+
+
+def scaled_integers_to_hsv(h: int, s: int, v: int) -> HSV:
+    """Convert integer degrees and percentages to HSV values in the range 0 to 1.
+
+    Args:
+        h: Hue in degrees from 0 to 360.
+        s: Saturation as a percentage.
+        v: Value as a percentage.
+
+    Returns:
+        The HSV (Hue, Saturation, Value) values.
+    """
+    return HSV(h / 360, s / 100, v / 100)
+
+
+def hsv_to_rgb_grid(
+    hue: float, saturations: Sequence[float], values: Sequence[float]
+) -> list[list[tuple[int, int, int]]]:
+    """Convert a grid of saturations and values at a single hue to RGB values.
+
+    The grid is converted in a single batch with NumPy when it is installed,
+    otherwise this falls back to pure Python.
+
+    Args:
+        hue: The hue in the range 0 to 1.
+        saturations: The saturations for each column, in the range 0 to 1.
+        values: The values for each row, in the range 0 to 1.
+
+    Returns:
+        A list of rows, where each row is a list of RGB tuples.
+    """
+    if HAS_NUMPY:
+        return _hsv_to_rgb_grid_numpy(hue, saturations, values)
+    return _hsv_to_rgb_grid_python(hue, saturations, values)
+
+
+def _hsv_to_rgb_grid_python(
+    hue: float, saturations: Sequence[float], values: Sequence[float]
+) -> list[list[tuple[int, int, int]]]:
+    return [[hsv_to_rgb(hue, s, v) for s in saturations] for v in values]
+
+
+@lru_cache(maxsize=None)
+def _numpy() -> ModuleType:
+    import numpy
+
+    return numpy
+
+
+def _hsv_to_rgb_grid_numpy(
+    hue: float, saturations: Sequence[float], values: Sequence[float]
+) -> list[list[tuple[int, int, int]]]:
+    r, g, b = _hsv_to_rgb_arrays(hue, saturations, values)
+    red: list[list[int]] = r.tolist()
+    green: list[list[int]] = g.tolist()
+    blue: list[list[int]] = b.tolist()
+
+    return [list(zip(*channels)) for channels in zip(red, green, blue)]
+
+
+def _hsv_to_rgb_arrays(
+    hue: float, saturations: Sequence[float], values: Sequence[float]
+) -> tuple[Any, Any, Any]:
+    """Convert a grid of saturations and values at a single hue to arrays of
+    the red, green and blue values. This requires NumPy.
+
+    Args:
+        hue: The hue in the range 0 to 1.
+        saturations: The saturations for each column, in the range 0 to 1.
+        values: The values for each row, in the range 0 to 1.
+
+    Returns:
+        The red, green and blue values as integer arrays with a row for each
+        value and a column for each saturation.
+    """
+    numpy = _numpy()
+    # NOTE: This mirrors the arithmetic in `colorsys.hsv_to_rgb` so that the
+    # results are identical to the pure Python implementation.
+    saturation = numpy.asarray(saturations, dtype=float)
+    value = numpy.asarray(values, dtype=float)[:, numpy.newaxis]
+
+    sector = int(hue * 6.0)
+    f = (hue * 6.0) - sector
+    v = numpy.broadcast_to(value, (len(values), len(saturations)))
+    p = value * (1.0 - saturation)
+    q = value * (1.0 - saturation * f)
+    t = value * (1.0 - saturation * (1.0 - f))
+
+    r, g, b = [
+        (v, t, p),
+        (q, v, p),
+        (p, v, t),
+        (p, q, v),
+        (t, p, v),
+        (v, p, q),
+    ][sector % 6]
+
+    return (
+        (r * 255 + 0.5).astype(int),
+        (g * 255 + 0.5).astype(int),
+        (b * 255 + 0.5).astype(int),
+    )
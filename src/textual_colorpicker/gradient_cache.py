@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import sys
+from collections import Counter, OrderedDict
+from threading import Lock
+from typing import Hashable, Sequence
+
+from rich.segment import Segment
+
+_SEGMENT_SIZE = sys.getsizeof(Segment(" ", None)) + 8
+"""The approximate memory used by each cached segment, including its list slot.
+The styles are interned, so are not counted."""
+
+
+class GradientCache:
+    """A process-wide cache of the rows of gradient segments, which is shared
+    by every hue picker and saturation/value picker.
+
+    The memory used grows with the number of distinct gradients rather than
+    the number of pickers. The same rows may be stored under more than one
+    key, and are only counted once. When the memory cap is reached, the least
+    recently used gradients are evicted.
+
+    Example:
+        ```python
+        from textual_colorpicker.gradient_cache import gradient_cache
+
+        gradient_cache.max_size = 8 * 1024 * 1024
+        ```
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Create a gradient cache.
+
+        Args:
+            max_size: The approximate maximum memory in bytes used by the cache.
+        """
+        self._max_size = max_size
+        self._size = 0
+        self._gradients: OrderedDict[Hashable, Sequence[list[Segment]]] = OrderedDict()
+        self._sizes: dict[Hashable, int] = {}
+        self._references: Counter[int] = Counter()
+        self._lock = Lock()
+
+    @property
+    def max_size(self) -> int:
+        """The approximate maximum memory in bytes used by the cache."""
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, max_size: int) -> None:
+        with self._lock:
+            self._max_size = max_size
+            self._evict()
+
+    @property
+    def size(self) -> int:
+        """The approximate memory in bytes currently used by the cache."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._gradients)
+
+    def get(self, key: Hashable) -> Sequence[list[Segment]] | None:
+        """Get the rows of a cached gradient.
+
+        Args:
+            key: The key of the gradient.
+
+        Returns:
+            The rows of segments, or `None` if the gradient is not cached.
+        """
+        with self._lock:
+            rows = self._gradients.get(key)
+            if rows is not None:
+                self._gradients.move_to_end(key)
+            return rows
+
+    def set(self, key: Hashable, rows: Sequence[list[Segment]]) -> None:
+        """Add the rows of a gradient to the cache, evicting the least recently
+        used gradients if the cache is over its memory cap.
+
+        The most recent gradient is always kept, even if it is larger than the
+        cap, so the picker that computed it can draw it.
+
+        Args:
+            key: The key of the gradient.
+            rows: The rows of segments.
+        """
+        size = sum(len(row) for row in rows) * _SEGMENT_SIZE
+        with self._lock:
+            if key in self._gradients:
+                self._remove(key)
+            self._gradients[key] = rows
+            self._sizes[key] = size
+            self._references[id(rows)] += 1
+            if self._references[id(rows)] == 1:
+                self._size += size
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove all the gradients from the cache."""
+        with self._lock:
+            self._gradients.clear()
+            self._sizes.clear()
+            self._references.clear()
+            self._size = 0
+
+    def _remove(self, key: Hashable) -> None:
+        rows = self._gradients.pop(key)
+        size = self._sizes.pop(key)
+        self._references[id(rows)] -= 1
+        if not self._references[id(rows)]:
+            del self._references[id(rows)]
+            self._size -= size
+
+    def _evict(self) -> None:
+        while self._size > self._max_size and len(self._gradients) > 1:
+            self._remove(next(iter(self._gradients)))
+
+
+gradient_cache = GradientCache(max_size=32 * 1024 * 1024)
+"""The gradient cache shared by all the pickers in the process."""
@@ -1,27 +1,26 @@
 from __future__ import annotations
 
+from typing import Sequence
+
+from rich.color import ColorSystem
 from rich.segment import Segment
-from rich.style import Style
 from textual import events
-from textual.color import BLACK, WHITE, Gradient
-from textual.geometry import clamp
+from textual.color import BLACK, WHITE
+from textual.geometry import Offset, clamp
 from textual.message import Message
 from textual.reactive import reactive
 from textual.strip import Strip
 from textual.widget import Widget
 
-_GRADIENT_COLORS = [
-    "#ff0000",
-    "#ffff00",
-    "#00ff00",
-    "#00ffff",
-    "#0000ff",
-    "#ff00ff",
-    "#ff0000",
-]
+from textual_colorpicker._palette import get_color_system, quantize_row
+from textual_colorpicker._resample import resample_rows
+from textual_colorpicker._styles import get_style
+from textual_colorpicker.conversions import hsv_to_rgb
+from textual_colorpicker.gradient_cache import gradient_cache
+from textual_colorpicker.metrics import MetricsMixin, measure_render
 
 
-class HuePicker(Widget):
+class HuePicker(MetricsMixin, Widget):
     """A hue picker widget."""
 
     ALLOW_SELECT = False
@@ -32,11 +31,17 @@ class HuePicker(Widget):
     }
     """
 
-    _GRADIENT = Gradient.from_colors(*_GRADIENT_COLORS)
+    _MASTER_HEADROOM = 1.25
+    """How much wider than the widget the gradient is built when the widget
+    grows, so that further resizes can be resampled from it."""
 
     hue: reactive[float] = reactive(0.0, init=False)
     """The currently selected hue value in the range 0 to 1."""
 
+    dither: reactive[bool] = reactive(False)
+    """Whether to apply an ordered dither to the gradient on terminals with a
+    limited color palette, which smooths the color bands."""
+
     class Changed(Message):
         """Posted when the hue value changes.
 
@@ -56,6 +61,7 @@ class HuePicker(Widget):
         self,
         hue: float = 0.0,
         *,
+        dither: bool = False,
         name: str | None = None,
         id: str | None = None,
         classes: str | None = None,
@@ -65,6 +71,8 @@ class HuePicker(Widget):
 
         Args:
             hue: The initial hue value in the range 0 to 1.
+            dither: Whether to dither the gradient on terminals with a limited
+                color palette.
             name: The name of the widget.
             id: The ID of the widget in the DOM.
             classes: The CSS classes of the widget.
@@ -72,63 +80,127 @@ class HuePicker(Widget):
         """
         super().__init__(name=name, id=id, classes=classes, disabled=disabled)
         self.hue = hue
+        self.dither = dither
         self._grabbed = False
+        self._pending_mouse_offset: Offset | None = None
 
+    @measure_render
     def render_line(self, y: int) -> Strip:
         width = self.content_size.width
 
-        get_color = self._GRADIENT.get_rich_color
-        from_color = Style.from_color
+        color_system = get_color_system(self.app.console)
+        row = self._get_gradient_rows(width, color_system)[y]
 
         arrow_x = int(self.hue * (width - 1) + 0.5)
-        arrow_icon, arrow_color = ("▼", BLACK) if y == 0 else ("▲", WHITE)
-
-        segments = [
-            (
-                Segment(
-                    arrow_icon if x == arrow_x else " ",
-                    from_color(
-                        arrow_color.rich_color,
-                        get_color(x / (width - 1)),
-                    ),
-                )
-            )
-            for x in range(width)
-        ]
+        arrow_icon = "▼" if y == 0 else "▲"
+
+        # Splice the arrow into a copy of the cached gradient row.
+        segments = row.copy()
+        segments[arrow_x] = Segment(arrow_icon, row[arrow_x].style)
+
+        return Strip(segments, width)
 
-        return Strip(segments)
+    def _get_gradient_rows(
+        self, width: int, color_system: ColorSystem
+    ) -> Sequence[list[Segment]]:
+        """Get the blank segments for both rows of the gradient, using the
+        shared gradient cache since they only depend on the width, color system
+        and dithering.
+
+        The widest gradient built is kept as a master gradient, so when the
+        widget is resized to fit within it, the gradient is resampled from the
+        master rather than built again.
+
+        Args:
+            width: The width of the gradient.
+            color_system: The color system of the terminal.
+
+        Returns:
+            A tuple of the top and bottom rows of blank segments.
+        """
+        gradient_key = ("hue", width, color_system, self.dither)
+        gradient_rows = gradient_cache.get(gradient_key)
+        if gradient_rows is not None:
+            return gradient_rows
+
+        # Dithered gradients have no master, since the dither pattern depends
+        # on the position of each cell so can't be resampled.
+        master_key = ("hue_master", color_system)
+        master_rows = None if self.dither else gradient_cache.get(master_key)
+        if master_rows is not None and width <= len(master_rows[0]):
+            gradient_rows = resample_rows(master_rows, width, 2)
+        else:
+            build_width = width
+            if master_rows is not None:
+                # The widget is growing, so leave room to keep resizing
+                # without building the gradient again.
+                build_width = max(width, int(width * self._MASTER_HEADROOM))
+            gradient_rows = self._build_gradient_rows(build_width, color_system)
+            if not self.dither:
+                gradient_cache.set(master_key, gradient_rows)
+            if build_width != width:
+                gradient_rows = resample_rows(gradient_rows, width, 2)
+        gradient_cache.set(gradient_key, gradient_rows)
+
+        return gradient_rows
+
+    def _build_gradient_rows(
+        self, width: int, color_system: ColorSystem
+    ) -> Sequence[list[Segment]]:
+        gradient_colors = [hsv_to_rgb(x / (width - 1), 1.0, 1.0) for x in range(width)]
+        top_colors, bottom_colors = [
+            quantize_row(gradient_colors, color_system, y, self.dither)
+            for y in range(2)
+        ]
+        return (
+            [Segment(" ", get_style(BLACK.rgb, rgb)) for rgb in top_colors],
+            [Segment(" ", get_style(WHITE.rgb, rgb)) for rgb in bottom_colors],
+        )
 
     def validate_hue(self, hue: float) -> float:
         return clamp(hue, 0.0, 1.0)
 
     def watch_hue(self) -> None:
-        self.post_message(self.Changed(self, self.hue))
+        self._record_watcher("hue")
+
+        message = self.Changed(self, self.hue)
+        self._post_and_record(message)
 
     async def _on_mouse_down(self, event: events.MouseDown) -> None:
         mouse_offset = event.get_content_offset(self)
         if mouse_offset is None:
             return
+        self._update_hue_from_mouse_offset(mouse_offset)
+
+        self._grabbed = True
+        self.capture_mouse(True)
+
+    async def _on_mouse_move(self, event: events.MouseMove) -> None:
+        if not self._grabbed:
+            return
+        # Mouse moves are coalesced so the hue is only updated once per
+        # refresh, using the latest mouse position.
+        if self._pending_mouse_offset is None:
+            self.call_after_refresh(self._apply_pending_mouse_offset)
+        self._pending_mouse_offset = event.get_content_offset_capture(self)
+
+    async def _on_mouse_up(self, event: events.MouseUp) -> None:
+        if self._grabbed:
+            self._apply_pending_mouse_offset()
+            self._grabbed = False
+            self.release_mouse()
+
+    def _apply_pending_mouse_offset(self) -> None:
+        mouse_offset = self._pending_mouse_offset
+        if mouse_offset is None:
+            return
+        self._pending_mouse_offset = None
+        self._update_hue_from_mouse_offset(mouse_offset)
+
+    def _update_hue_from_mouse_offset(self, mouse_offset: Offset) -> None:
         mouse_x_norm = mouse_offset.x / (self.content_size.width - 1)
         self.hue = mouse_x_norm
 
-    # TODO: Enable click and drag for the hue picker. Unfortunately this causes
-    # the app to lag and eventually freeze entirely when implemented in the
-    # color picker widget.
-    #
-    #     self._grabbed = True
-    #     self.capture_mouse(True)
-    #
-    # async def _on_mouse_move(self, event: events.MouseMove) -> None:
-    #     mouse_offset = event.get_content_offset(self)
-    #     if self._grabbed and mouse_offset is not None:
-    #         mouse_x_norm = mouse_offset.x / (self.content_size.width - 1)
-    #         self.hue = mouse_x_norm
-    #
-    # async def _on_mouse_up(self, event: events.MouseUp) -> None:
-    #     if self._grabbed:
-    #         self._grabbed = False
-    #         self.release_mouse()
-
 
 if __name__ == "__main__":
     from textual.app import App, ComposeResult
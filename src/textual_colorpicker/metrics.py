@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from functools import wraps
+from time import perf_counter
+from typing import TYPE_CHECKING, Callable, NamedTuple, TypeVar
+
+if TYPE_CHECKING:
+    from textual.message import Message
+    from textual.widget import Widget
+
+_MeasuredT = TypeVar("_MeasuredT", bound="MetricsMixin")
+_RenderResultT = TypeVar("_RenderResultT")
+
+
+class MetricsSnapshot(NamedTuple):
+    """A snapshot of the metrics collected for the color picker widgets."""
+
+    render_calls: dict[str, int]
+    """The number of `render_line` (or `render`) calls per widget type."""
+    render_time: dict[str, float]
+    """The total time in seconds spent rendering per widget type."""
+    messages: dict[str, int]
+    """The number of `Changed` messages posted per message type."""
+    watcher_calls: dict[str, int]
+    """The number of reactive watcher invocations per widget attribute."""
+
+
+class Metrics:
+    """Collects render and message metrics for the color picker widgets.
+
+    Metrics are opt-in. Attach the metrics to a widget to start collecting, for
+    example to help identify which widget is responsible for any lag.
+
+    Example:
+        ```python
+        metrics = Metrics()
+        metrics.attach(color_picker)
+        ...
+        print(metrics.snapshot())
+        ```
+    """
+
+    def __init__(self) -> None:
+        self._render_calls: Counter[str] = Counter()
+        self._render_time: defaultdict[str, float] = defaultdict(float)
+        self._messages: Counter[str] = Counter()
+        self._watcher_calls: Counter[str] = Counter()
+
+    def attach(self, widget: Widget) -> None:
+        """Start collecting metrics for a widget and its descendants.
+
+        A `ColorPicker` also passes the metrics on to any child widgets that
+        are mounted later.
+
+        Args:
+            widget: A color picker widget.
+        """
+        for node in [widget, *widget.query("*")]:
+            if hasattr(node, "_metrics"):
+                node._metrics = self
+
+    def detach(self, widget: Widget) -> None:
+        """Stop collecting metrics for a widget and its descendants.
+
+        Args:
+            widget: A color picker widget.
+        """
+        for node in [widget, *widget.query("*")]:
+            if getattr(node, "_metrics", None) is self:
+                node._metrics = None
+
+    def record_render(self, widget: MetricsMixin, elapsed: float) -> None:
+        """Record a call to render a widget.
+
+        Args:
+            widget: The widget that was rendered.
+            elapsed: The time in seconds spent rendering.
+        """
+        name = type(widget).__name__
+        self._render_calls[name] += 1
+        self._render_time[name] += elapsed
+
+    def record_message(self, message: Message) -> None:
+        """Record a message that was posted.
+
+        Args:
+            message: The message that was posted.
+        """
+        self._messages[type(message).__qualname__] += 1
+
+    def record_watcher(self, widget: MetricsMixin, attribute: str) -> None:
+        """Record a call to a reactive watcher.
+
+        Args:
+            widget: The widget whose watcher was called.
+            attribute: The name of the reactive attribute.
+        """
+        self._watcher_calls[f"{type(widget).__name__}.{attribute}"] += 1
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Get a snapshot of the metrics collected so far.
+
+        Returns:
+            A snapshot of the metrics, which is not affected by later updates.
+        """
+        return MetricsSnapshot(
+            render_calls=dict(self._render_calls),
+            render_time=dict(self._render_time),
+            messages=dict(self._messages),
+            watcher_calls=dict(self._watcher_calls),
+        )
+
+    def reset(self) -> None:
+        """Reset all the metrics to zero."""
+        self._render_calls.clear()
+        self._render_time.clear()
+        self._messages.clear()
+        self._watcher_calls.clear()
+
+
+class MetricsMixin:
+    """A mixin for the color picker widgets that report to attached metrics."""
+
+    _metrics: Metrics | None = None
+    """The metrics to report to, or `None` if no metrics are attached."""
+
+    if TYPE_CHECKING:
+
+        def post_message(self, message: Message) -> bool: ...
+
+    def _post_and_record(self, message: Message) -> bool:
+        """Post a message, and record it if any metrics are attached.
+
+        Args:
+            message: The message to post.
+
+        Returns:
+            True if the message was posted, otherwise False.
+        """
+        posted = self.post_message(message)
+        if posted and self._metrics is not None:
+            self._metrics.record_message(message)
+        return posted
+
+    def _record_watcher(self, attribute: str) -> None:
+        """Record a call to a reactive watcher, if any metrics are attached.
+
+        Args:
+            attribute: The name of the reactive attribute.
+        """
+        if self._metrics is not None:
+            self._metrics.record_watcher(self, attribute)
+
+
+def measure_render(
+    render: Callable[[_MeasuredT, int], _RenderResultT],
+) -> Callable[[_MeasuredT, int], _RenderResultT]:
+    """Decorate a widget's `render_line` method to record the time spent
+    rendering each line, if any metrics are attached.
+
+    Args:
+        render: The `render_line` method.
+
+    Returns:
+        The decorated method.
+    """
+
+    @wraps(render)
+    def measured_render(self: _MeasuredT, y: int) -> _RenderResultT:
+        metrics = self._metrics
+        if metrics is None:
+            return render(self, y)
+        start = perf_counter()
+        result = render(self, y)
+        metrics.record_render(self, perf_counter() - start)
+        return result
+
+    return measured_render
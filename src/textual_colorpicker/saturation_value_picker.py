@@ -1,24 +1,75 @@
 from __future__ import annotations
 
+from functools import partial
+from math import ceil, sqrt
+from time import perf_counter
+from typing import TYPE_CHECKING, Sequence
+
+from rich.color import ColorSystem
 from rich.segment import Segment
-from rich.style import Style
 from textual import events
-from textual.color import HSV, WHITE, Color
-from textual.geometry import clamp
+from textual.color import HSV, WHITE
+from textual.geometry import Offset, Region, clamp
 from textual.message import Message
 from textual.reactive import reactive
 from textual.strip import Strip
+from textual.timer import Timer
 from textual.widget import Widget
+from textual.worker import Worker, WorkerState, get_current_worker
+
+from textual_colorpicker._gradient import get_packed_saturation_value_field
+from textual_colorpicker._palette import get_color_system
+from textual_colorpicker._resample import resample_rows
+from textual_colorpicker._styles import get_style, get_styles, pack_rgb
+from textual_colorpicker.gradient_cache import gradient_cache
+from textual_colorpicker.metrics import MetricsMixin, measure_render
+
+if TYPE_CHECKING:
+    _FieldKey = tuple[float, int, int, bool, ColorSystem, bool]
+    """The hue, width, height, half-block, color system and dither of a field."""
 
 
-class SaturationValuePicker(Widget):
+class SaturationValuePicker(MetricsMixin, Widget):
     """A two-dimensional saturation/value picker widget."""
 
     ALLOW_SELECT = False
 
-    hsv = reactive(HSV(0.0, 1.0, 1.0), init=False)
+    _BACKGROUND_FIELD_SIZE: int | None = 16384
+    """The number of cells from which the gradient is computed in a thread
+    worker, or `None` to always compute it on the event loop."""
+
+    _LOW_RESOLUTION_SCALE = 4
+    """How much smaller the placeholder field is when the size changes."""
+
+    _MASTER_HEADROOM = 1.25
+    """How much larger than the widget a field is built when the widget grows,
+    so that further resizes can be resampled from it."""
+
+    _REFINE_DELAY = 0.1
+    """How long in seconds a preview must stay unchanged before it is refined
+    towards full resolution."""
+
+    _CALIBRATION_SIZE = (32, 16)
+    """The width and height of a field built to estimate how long fields take
+    to build, when no field has been built yet."""
+
+    hsv = reactive(HSV(0.0, 1.0, 1.0), init=False, repaint=False)
     """The currently selected HSV (Hue, Saturation, Value) values in the range 0 to 1."""
 
+    half_block: reactive[bool] = reactive(False)
+    """Whether to draw the gradient with half-block characters, which doubles the
+    vertical resolution by drawing two rows of the gradient in each cell."""
+
+    dither: reactive[bool] = reactive(False)
+    """Whether to apply an ordered dither to the gradient on terminals with a
+    limited color palette, which smooths the color bands."""
+
+    frame_budget: reactive[float | None] = reactive(None, repaint=False)
+    """The time in seconds that computing a new gradient field may take, or
+    `None` for no limit. A field that is expected to take longer is first drawn
+    at a reduced resolution, then refined to full resolution once it stops
+    changing."""
+
     class Changed(Message):
         """Posted when the HSV (Hue, Saturation, Value) value changes.
 
@@ -40,6 +91,9 @@ class SaturationValuePicker(Widget):
         self,
         hsv: HSV = HSV(0.0, 1.0, 1.0),
         *,
+        half_block: bool = False,
+        dither: bool = False,
+        frame_budget: float | None = None,
         name: str | None = None,
         id: str | None = None,
         classes: str | None = None,
@@ -49,6 +103,12 @@ class SaturationValuePicker(Widget):
 
         Args:
             hsv: The initial HSV (Hue, Saturation, Value) values in the range 0 to 1.
+            half_block: Whether to draw the gradient with half-block characters.
+            dither: Whether to dither the gradient on terminals with a limited
+                color palette.
+            frame_budget: The time in seconds that computing a new gradient
+                field may take before a reduced-resolution preview is drawn
+                instead, such as `1 / 60`, or `None` for no limit.
             name: The name of the widget.
             id: The ID of the widget in the DOM.
             classes: The CSS classes of the widget.
@@ -56,40 +116,488 @@ class SaturationValuePicker(Widget):
         """
         super().__init__(name=name, id=id, classes=classes, disabled=disabled)
         self.hsv = hsv
+        self.half_block = half_block
+        self.dither = dither
+        self.frame_budget = frame_budget
         self._grabbed = False
-
+        self._pending_mouse_event: events.MouseMove | None = None
+        self._pending_field_key: _FieldKey | None = None
+        self._pending_build_key: _FieldKey | None = None
+        self._gradient_worker: Worker[None] | None = None
+        self._placeholder_rows: list[list[Segment]] = []
+        self._placeholder_key: _FieldKey | None = None
+        self._preview_key: _FieldKey | None = None
+        self._preview_build_key: _FieldKey | None = None
+        self._preview_scale = 1
+        self._refine_timer: Timer | None = None
+        self._cell_build_time: float | None = None
+        self._mouse_pixels = False
+
+    @measure_render
     def render_line(self, y: int) -> Strip:
         width = self.content_size.width
         height = self.content_size.height
 
-        from_color = Style.from_color
+        color_system = get_color_system(self.app.console)
+        row = self._get_gradient_row(y, width, height, color_system)
 
-        hue = self.hsv.h
-        value = 1 - (y / (height - 1))
+        pointer_x, pointer_y = self._get_pointer_offset(self.hsv)
+
+        if self.half_block:
+            return self._render_half_block_pointer(row, y, pointer_x, pointer_y)
+
+        # Draw the pointer on top of the cached gradient row.
+        if y == pointer_y:
+            segments = [Segment("═", style) for _, style, _ in row]
+            segments[pointer_x] = Segment("╬", row[pointer_x].style)
+        else:
+            segments = row.copy()
+            segments[pointer_x] = Segment("║", row[pointer_x].style)
+
+        return Strip(segments, width)
+
+    def _render_half_block_pointer(
+        self, row: list[Segment], y: int, pointer_x: int, pointer_y: int
+    ) -> Strip:
+        """Draw the pointer on top of a cached half-block gradient row.
 
-        pointer_y = int((1 - self.hsv.v) * (height - 1) + 0.5)
-        pointer_x = int(self.hsv.s * (width - 1) + 0.5)
+        The horizontal pointer line is drawn as a white half-block so it keeps
+        the doubled vertical resolution.
 
-        segments: list[Segment] = []
-        for x in range(width):
-            saturation = x / (width - 1)
-            style = from_color(
-                WHITE.rich_color,
-                Color.from_hsv(hue, saturation, value).rich_color,
+        Args:
+            row: The half-block segments for the row of the gradient.
+            y: The row of the gradient.
+            pointer_x: The column of the pointer.
+            pointer_y: The row of the pointer.
+
+        Returns:
+            The strip for the row of the gradient.
+        """
+        white = WHITE.rgb
+
+        segments = row.copy()
+        if y == pointer_y:
+            upper_half = self._get_pointer_half_row(self.hsv) % 2 == 0
+            for x, (upper, lower) in enumerate(self._get_half_block_colors(row)):
+                if x == pointer_x:
+                    # Mark where the pointer lines cross on the half of the
+                    # cell that the horizontal line does not cover.
+                    background = lower if upper_half else upper
+                    segments[x] = Segment("╬", get_style(white, background))
+                elif upper_half:
+                    segments[x] = Segment("▀", get_style(white, lower))
+                else:
+                    segments[x] = Segment("▀", get_style(upper, white))
+        else:
+            upper, _ = self._get_half_block_colors(row[pointer_x : pointer_x + 1])[0]
+            segments[pointer_x] = Segment("║", get_style(white, upper))
+
+        return Strip(segments, len(segments))
+
+    def _get_half_block_colors(
+        self, segments: list[Segment]
+    ) -> list[tuple[tuple[int, int, int], tuple[int, int, int]]]:
+        """Get the colors of the upper and lower half-rows from half-block segments.
+
+        Args:
+            segments: Segments from a cached half-block gradient row.
+
+        Returns:
+            A list of the upper and lower colors as RGB tuples.
+        """
+        colors: list[tuple[tuple[int, int, int], tuple[int, int, int]]] = []
+        for _, style, _ in segments:
+            assert style is not None and style.color and style.bgcolor
+            upper = style.color.get_truecolor()
+            lower = style.bgcolor.get_truecolor()
+            colors.append((upper, lower))
+
+        return colors
+
+    def _get_gradient_row(
+        self, y: int, width: int, height: int, color_system: ColorSystem
+    ) -> list[Segment]:
+        """Get the blank segments for a row of the gradient, using the shared
+        gradient cache where possible since the colors only depend on the hue
+        and size.
+
+        The colors are quantized up front to the palette of the terminal's
+        color system, so Rich does not need to downgrade each cell on output.
+
+        The largest field built for each hue is kept as a master field, so
+        when the widget is resized to fit within it, the field is resampled
+        from the master rather than computed again.
+
+        A field that is expected to take longer to compute than the frame
+        budget is first drawn at a reduced resolution, then refined to full
+        resolution once it has stopped changing for a moment.
+
+        Large fields are computed in a thread worker. Until the worker has
+        finished, this returns a row of the previous field, or of a resampled
+        or low-resolution field if the size has changed.
+
+        Args:
+            y: The row of the gradient.
+            width: The width of the gradient.
+            height: The height of the gradient.
+            color_system: The color system of the terminal.
+
+        Returns:
+            A list of blank segments styled with the gradient colors.
+        """
+        field_key = self._get_field_key(width, height, color_system)
+        rows = gradient_cache.get(("saturation_value", *field_key))
+        if rows is not None:
+            return rows[y]
+
+        master_rows = _get_master_rows(field_key)
+        if (
+            master_rows is not None
+            and width <= len(master_rows[0])
+            and height <= len(master_rows)
+        ):
+            rows = resample_rows(master_rows, width, height)
+            self._set_gradient_rows(field_key, rows)
+            return rows[y]
+
+        build_key = field_key
+        if master_rows is not None:
+            # The widget is growing, so leave room to keep resizing without
+            # building the field again.
+            headroom = self._MASTER_HEADROOM
+            build_key = (
+                *field_key[:1],
+                max(width, int(width * headroom)),
+                max(height, int(height * headroom)),
+                *field_key[3:],
             )
 
-            if (y, x) == (pointer_y, pointer_x):
-                char = "╬"
-            elif y == pointer_y:
-                char = "═"
-            elif x == pointer_x:
-                char = "║"
-            else:
-                char = " "
+        if field_key != self._pending_field_key:
+            preview_scale = self._get_preview_scale(build_key)
+            if preview_scale > 1:
+                return self._get_preview_rows(field_key, build_key, preview_scale)[y]
+
+        background_field_size = self._BACKGROUND_FIELD_SIZE
+        if background_field_size is None or width * height < background_field_size:
+            # Compute the whole field in one batch, as the other rows for this
+            # hue will almost certainly be needed too.
+            rows = self._set_built_rows(
+                field_key, self._measure_gradient_rows(build_key)
+            )
+            return rows[y]
+
+        if field_key != self._pending_field_key:
+            self._start_gradient_worker(field_key, build_key)
+
+        return self._get_placeholder_rows(field_key)[y]
+
+    def _get_field_key(
+        self, width: int, height: int, color_system: ColorSystem
+    ) -> _FieldKey:
+        return (
+            self.hsv.h,
+            width,
+            height,
+            self.half_block,
+            color_system,
+            self.dither,
+        )
+
+    def _start_gradient_worker(
+        self, field_key: _FieldKey, build_key: _FieldKey
+    ) -> None:
+        self._pending_field_key = field_key
+        self._pending_build_key = build_key
+        self._gradient_worker = self.run_worker(
+            partial(self._compute_gradient_rows, field_key, build_key),
+            name="gradient",
+            group="gradient",
+            exclusive=True,
+            thread=True,
+            exit_on_error=False,
+        )
+
+    def _compute_gradient_rows(
+        self, field_key: _FieldKey, build_key: _FieldKey
+    ) -> None:
+        """Compute the rows of a gradient field in a thread worker, then swap
+        them in on the event loop."""
+        start = perf_counter()
+        rows = _build_gradient_rows(*build_key)
+        build_time = perf_counter() - start
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(
+                self._set_worker_rows, field_key, build_key, rows, build_time
+            )
+
+    def _set_worker_rows(
+        self,
+        field_key: _FieldKey,
+        build_key: _FieldKey,
+        rows: list[list[Segment]],
+        build_time: float,
+    ) -> None:
+        self._record_build_time(build_key, build_time)
+        self._set_built_rows(field_key, rows)
+
+    def _on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        if event.worker is not self._gradient_worker or event.state not in (
+            WorkerState.ERROR,
+            WorkerState.CANCELLED,
+        ):
+            return
+        self._gradient_worker = None
+        field_key = self._pending_field_key
+        build_key = self._pending_build_key
+        self._pending_field_key = None
+        if field_key is None or build_key is None:
+            return
+        width, height = self.content_size
+        color_system = get_color_system(self.app.console)
+        if field_key != self._get_field_key(width, height, color_system):
+            return
+        # The worker failed, or was cancelled without starting another, so
+        # build the field on the event loop rather than never drawing it.
+        self._set_built_rows(field_key, self._measure_gradient_rows(build_key))
+        self.refresh()
+
+    def _set_built_rows(
+        self, field_key: _FieldKey, rows: list[list[Segment]]
+    ) -> list[list[Segment]]:
+        """Keep the rows of a newly built field as the master field for its
+        hue, then store them resampled to the size of the field.
+
+        Args:
+            field_key: The hue, size and options of the field.
+            rows: The built rows, which may be larger than the field if they
+                were built with headroom.
+
+        Returns:
+            The rows of the field.
+        """
+        _set_master_rows(field_key, rows)
+        _, width, height, *_ = field_key
+        if len(rows) != height or len(rows[0]) != width:
+            rows = resample_rows(rows, width, height)
+        self._set_gradient_rows(field_key, rows)
+        return rows
+
+    def _set_gradient_rows(
+        self, field_key: _FieldKey, rows: list[list[Segment]]
+    ) -> None:
+        """Store all the rows of a gradient field at once, so a partially
+        updated field is never drawn."""
+        gradient_cache.set(("saturation_value", *field_key), rows)
+        self._placeholder_rows = rows
+        self._placeholder_key = field_key
+        if field_key == self._pending_field_key:
+            self._pending_field_key = None
+            self.refresh()
+
+    def _get_preview_scale(self, build_key: _FieldKey) -> int:
+        """Get how much smaller than a field its preview must be to compute it
+        within the frame budget.
+
+        Args:
+            build_key: The hue, size and options of the field to be built.
+
+        Returns:
+            The scale of the preview, or 1 if the whole field is expected to
+            be computed within the frame budget.
+        """
+        frame_budget = self.frame_budget
+        if frame_budget is None:
+            return 1
+        build_time = self._estimate_build_time(build_key)
+        if build_time <= frame_budget:
+            return 1
+        _, width, height, *_ = build_key
+        if frame_budget <= 0:
+            return max(width, height)
+        return max(2, ceil(sqrt(build_time / frame_budget)))
+
+    def _estimate_build_time(self, build_key: _FieldKey) -> float:
+        """Estimate how long building a field will take, from the time taken
+        to build recent fields.
+
+        If no field has been built yet, a small field is built first to
+        calibrate the estimate.
+
+        Args:
+            build_key: The hue, size and options of the field to be built.
+
+        Returns:
+            The estimated time in seconds.
+        """
+        if self._cell_build_time is None:
+            hue, _, _, half_block, color_system, dither = build_key
+            width, height = self._CALIBRATION_SIZE
+            self._measure_gradient_rows(
+                (hue, width, height, half_block, color_system, dither)
+            )
+        assert self._cell_build_time is not None
+        return _get_build_cells(build_key) * self._cell_build_time
+
+    def _measure_gradient_rows(self, build_key: _FieldKey) -> list[list[Segment]]:
+        """Build the rows of a full-resolution field on the event loop, recording
+        how long it took to estimate the time of later fields.
+
+        Args:
+            build_key: The hue, size and options of the field to be built.
+
+        Returns:
+            A list of rows, where each row is a list of styled segments.
+        """
+        start = perf_counter()
+        rows = _build_gradient_rows(*build_key)
+        self._record_build_time(build_key, perf_counter() - start)
+        return rows
+
+    def _record_build_time(self, build_key: _FieldKey, build_time: float) -> None:
+        """Record how long a field took to build, whether on the event loop or
+        in a thread worker.
+
+        Args:
+            build_key: The hue, size and options of the field that was built.
+            build_time: The time in seconds that it took.
+        """
+        cell_build_time = build_time / _get_build_cells(build_key)
+        if self._cell_build_time is None:
+            self._cell_build_time = cell_build_time
+        else:
+            self._cell_build_time = (self._cell_build_time + cell_build_time) / 2
+
+    def _get_preview_rows(
+        self, field_key: _FieldKey, build_key: _FieldKey, scale: int
+    ) -> list[list[Segment]]:
+        """Get the rows of a reduced-resolution preview of a field, and
+        schedule refining it once the field has stopped changing.
+
+        Args:
+            field_key: The hue, size and options of the field.
+            build_key: The hue, size and options of the field to be built.
+            scale: How much smaller the preview is than the field.
+
+        Returns:
+            The rows of the preview, with each cell repeated to fill the field.
+        """
+        # A worker for an earlier field may have replaced the placeholder
+        # since the preview was drawn.
+        if field_key == self._preview_key and field_key == self._placeholder_key:
+            return self._placeholder_rows
+
+        master_rows = _get_master_rows(field_key)
+        if master_rows is not None:
+            # Resampling the smaller master is better than any preview, so
+            # the next refinement can go straight to full resolution.
+            _, width, height, *_ = field_key
+            rows = resample_rows(master_rows, width, height)
+            scale = 2
+        else:
+            rows = self._build_low_resolution_rows(field_key, scale)
+        self._placeholder_rows = rows
+        self._placeholder_key = field_key
+        self._preview_key = field_key
+        self._preview_build_key = build_key
+        self._preview_scale = scale
+        self._schedule_refine()
+
+        return rows
+
+    def _schedule_refine(self) -> None:
+        if self._refine_timer is not None:
+            self._refine_timer.stop()
+        self._refine_timer = self.set_timer(self._REFINE_DELAY, self._refine_preview)
+
+    def _refine_preview(self) -> None:
+        """Refine the preview of a field one step towards full resolution,
+        halving its scale each step. The full field is then computed on the
+        event loop or in a thread worker, the same as without a budget."""
+        self._refine_timer = None
+        field_key = self._preview_key
+        build_key = self._preview_build_key
+        if field_key is None or build_key is None:
+            return
+        width, height = self.content_size
+        color_system = get_color_system(self.app.console)
+        if field_key != self._get_field_key(width, height, color_system):
+            # The field has changed since the preview was drawn.
+            self._preview_key = None
+            return
+
+        scale = self._preview_scale // 2
+        if scale > 1:
+            self._placeholder_rows = self._build_low_resolution_rows(field_key, scale)
+            self._placeholder_key = field_key
+            self._preview_scale = scale
+            self._schedule_refine()
+            self.refresh()
+            return
+
+        self._preview_key = None
+        background_field_size = self._BACKGROUND_FIELD_SIZE
+        if background_field_size is None or width * height < background_field_size:
+            self._set_built_rows(field_key, self._measure_gradient_rows(build_key))
+            self.refresh()
+        else:
+            self._start_gradient_worker(field_key, build_key)
+
+    def _build_low_resolution_rows(
+        self, field_key: _FieldKey, scale: int
+    ) -> list[list[Segment]]:
+        """Build a field at a reduced resolution, with each cell repeated to
+        fill the size of the field.
+
+        Args:
+            field_key: The hue, size and options of the field.
+            scale: How much smaller the field is built.
 
-            segments.append(Segment(char, style))
+        Returns:
+            The rows of the field.
+        """
+        hue, width, height, half_block, color_system, dither = field_key
+        low_rows = _build_gradient_rows(
+            hue,
+            max(2, width // scale),
+            max(2, height // scale),
+            half_block,
+            color_system,
+            dither,
+        )
+        return resample_rows(low_rows, width, height)
+
+    def _get_placeholder_rows(self, field_key: _FieldKey) -> list[list[Segment]]:
+        """Get the rows to show while a gradient field is being computed.
+
+        Args:
+            field_key: The hue, size and options of the field being computed.
+
+        Returns:
+            The rows of the previous field if it has the same size and options,
+            otherwise the rows of the master field for the hue resampled to
+            the new size, or failing that a low-resolution field.
+        """
+        placeholder_key = self._placeholder_key
+        if placeholder_key is not None and placeholder_key[1:] == field_key[1:]:
+            return self._placeholder_rows
+
+        _, width, height, *_ = field_key
+        master_rows = _get_master_rows(field_key)
+        if master_rows is None:
+            rows = self._build_low_resolution_rows(
+                field_key, self._LOW_RESOLUTION_SCALE
+            )
+        else:
+            rows = resample_rows(master_rows, width, height)
+        self._placeholder_rows = rows
+        self._placeholder_key = field_key
+
+        return rows
 
-        return Strip(segments)
+    def validate_frame_budget(self, frame_budget: float | None) -> float | None:
+        if frame_budget is None:
+            return None
+        return max(0.0, frame_budget)
 
     def validate_hsv(self, hsv: HSV) -> HSV:
         h, s, v = hsv
@@ -102,47 +610,233 @@ class SaturationValuePicker(Widget):
 
         return clamped_hsv
 
-    def watch_hsv(self) -> None:
-        self.post_message(self.Changed(self, self.hsv))
+    def watch_hsv(self, old_hsv: HSV, new_hsv: HSV) -> None:
+        self._record_watcher("hsv")
+
+        if new_hsv.h != old_hsv.h:
+            self.refresh()
+        else:
+            # Only the pointer has moved, so refresh just the rows and columns
+            # covered by the old and new pointer lines.
+            self.refresh(
+                *self._get_pointer_regions(old_hsv),
+                *self._get_pointer_regions(new_hsv),
+            )
+
+        message = self.Changed(self, self.hsv)
+        self._post_and_record(message)
+
+    def _get_pointer_offset(self, hsv: HSV) -> Offset:
+        """Get the position of the pointer for the given HSV value.
+
+        Args:
+            hsv: The HSV (Hue, Saturation, Value) values in the range 0 to 1.
+
+        Returns:
+            The offset of the pointer relative to the content region.
+        """
+        width = self.content_size.width
+        height = self.content_size.height
+        pointer_x = int(hsv.s * (width - 1) + 0.5)
+        if self.half_block:
+            pointer_y = self._get_pointer_half_row(hsv) // 2
+        else:
+            pointer_y = int((1 - hsv.v) * (height - 1) + 0.5)
+
+        return Offset(pointer_x, pointer_y)
+
+    def _get_pointer_half_row(self, hsv: HSV) -> int:
+        """Get the half-row of the pointer when drawing with half-blocks.
+
+        Args:
+            hsv: The HSV (Hue, Saturation, Value) values in the range 0 to 1.
+
+        Returns:
+            The half-row of the pointer, where each cell contains two half-rows.
+        """
+        half_rows = self.content_size.height * 2
+        return int((1 - hsv.v) * (half_rows - 1) + 0.5)
+
+    def _get_pointer_regions(self, hsv: HSV) -> tuple[Region, Region]:
+        """Get the regions covered by the pointer lines for the given HSV value.
+
+        Args:
+            hsv: The HSV (Hue, Saturation, Value) values in the range 0 to 1.
+
+        Returns:
+            The regions of the horizontal and vertical pointer lines.
+        """
+        width = self.content_size.width
+        height = self.content_size.height
+        pointer_x, pointer_y = self._get_pointer_offset(hsv)
+
+        return Region(0, pointer_y, width, 1), Region(pointer_x, 0, 1, height)
 
     async def _on_mouse_down(self, event: events.MouseDown) -> None:
         mouse_offset = event.get_content_offset(self)
         if mouse_offset is None:
             return
+        self._update_hsv_from_mouse_event(event)
+
+        self._grabbed = True
+        self.capture_mouse(True)
+
+    async def _on_mouse_move(self, event: events.MouseMove) -> None:
+        self._detect_mouse_pixels(event)
+        if not self._grabbed:
+            return
+        # Mouse moves are coalesced so the HSV is only updated once per
+        # refresh, using the latest mouse position.
+        if self._pending_mouse_event is None:
+            self.call_after_refresh(self._apply_pending_mouse_event)
+        self._pending_mouse_event = event
+
+    async def _on_mouse_up(self, event: events.MouseUp) -> None:
+        if self._grabbed:
+            self._apply_pending_mouse_event()
+            self._grabbed = False
+            self.release_mouse()
+
+    def _apply_pending_mouse_event(self) -> None:
+        event = self._pending_mouse_event
+        if event is None:
+            return
+        self._pending_mouse_event = None
+        self._update_hsv_from_mouse_event(event)
+
+    def _update_hsv_from_mouse_event(self, event: events.MouseEvent) -> None:
+        mouse_offset = event.get_content_offset_capture(self)
         width = self.content_size.width
         height = self.content_size.height
-        mouse_y_norm = mouse_offset.y / (height - 1)
         mouse_x_norm = mouse_offset.x / (width - 1)
+        if self.half_block:
+            mouse_y_norm = self._get_mouse_half_row(event) / (height * 2 - 1)
+        else:
+            mouse_y_norm = mouse_offset.y / (height - 1)
 
         hue = self.hsv.h
         saturation = mouse_x_norm
         value = 1 - mouse_y_norm
         self.hsv = HSV(hue, saturation, value)
 
-    # TODO: Enable click and drag for the saturation/value picker. Unfortunately
-    # this causes the app to lag and eventually freeze entirely when implemented
-    # in the color picker widget.
-    #
-    #     self._grabbed = True
-    #     self.capture_mouse(True)
-    #
-    # async def _on_mouse_move(self, event: events.MouseMove) -> None:
-    #     mouse_offset = event.get_content_offset(self)
-    #     if self._grabbed and mouse_offset is not None:
-    #         width = self.content_size.width
-    #         height = self.content_size.height
-    #         mouse_y_norm = mouse_offset.y / (height - 1)
-    #         mouse_x_norm = mouse_offset.x / (width - 1)
-    #
-    #         hue = self.hsv.h
-    #         saturation = mouse_x_norm
-    #         value = 1 - mouse_y_norm
-    #         self.hsv = HSV(hue, saturation, value)
-    #
-    # async def _on_mouse_up(self, event: events.MouseUp) -> None:
-    #     if self._grabbed:
-    #         self._grabbed = False
-    #         self.release_mouse()
+    def _get_mouse_half_row(self, event: events.MouseEvent) -> int:
+        """Get the half-row under the mouse when drawing with half-blocks.
+
+        Terminals that report the mouse position in pixels allow selecting
+        either half of a cell. Otherwise the cell rows are mapped evenly across
+        the half-rows, so the first and last half-rows can still be selected.
+
+        Args:
+            event: The mouse event.
+
+        Returns:
+            The half-row under the mouse.
+        """
+        height = self.content_size.height
+        mouse_y = event.pointer_y - self.gutter.top
+        self._detect_mouse_pixels(event)
+        if self._mouse_pixels:
+            half_row = int(mouse_y * 2)
+        else:
+            half_row = int(mouse_y * (height * 2 - 1) / max(height - 1, 1) + 0.5)
+
+        return clamp(half_row, 0, height * 2 - 1)
+
+    def _detect_mouse_pixels(self, event: events.MouseEvent) -> None:
+        """Remember if the terminal reports the mouse position in pixels.
+
+        A pixel position at the top edge of a cell is a whole number, the same
+        as a cell position, so the mode is detected from any fractional
+        position rather than from each event.
+
+        Args:
+            event: The mouse event.
+        """
+        if not float(event.pointer_y).is_integer():
+            self._mouse_pixels = True
+
+
+def _get_master_rows(field_key: _FieldKey) -> Sequence[list[Segment]] | None:
+    """Get the rows of the largest field built for the hue and options of a
+    field, if it is still cached.
+
+    Dithered fields have no master, since the dither pattern depends on the
+    position of each cell so can't be resampled.
+    """
+    hue, _, _, half_block, color_system, dither = field_key
+    if dither:
+        return None
+    return gradient_cache.get(
+        ("saturation_value_master", hue, half_block, color_system)
+    )
+
+
+def _set_master_rows(field_key: _FieldKey, rows: list[list[Segment]]) -> None:
+    """Keep the rows of a newly built field as the master field for its hue
+    and options, if it is at least as large as the current master."""
+    hue, _, _, half_block, color_system, dither = field_key
+    if dither:
+        return
+    master_key = ("saturation_value_master", hue, half_block, color_system)
+    master_rows = gradient_cache.get(master_key)
+    if (
+        master_rows is None
+        or len(rows) >= len(master_rows)
+        and len(rows[0]) >= len(master_rows[0])
+    ):
+        gradient_cache.set(master_key, rows)
+
+
+def _get_build_cells(build_key: _FieldKey) -> int:
+    _, width, height, half_block, *_ = build_key
+    return width * height * (2 if half_block else 1)
+
+
+def _build_gradient_rows(
+    hue: float,
+    width: int,
+    height: int,
+    half_block: bool,
+    color_system: ColorSystem,
+    dither: bool,
+) -> list[list[Segment]]:
+    """Build the blank segments for every row of a gradient field.
+
+    This only depends on its arguments, so it is safe to run in a thread.
+
+    Args:
+        hue: The hue value in the range 0 to 1.
+        width: The width of the gradient.
+        height: The height of the gradient.
+        half_block: Whether to draw the gradient with half-block characters.
+        color_system: The color system of the terminal.
+        dither: Whether to dither the gradient colors.
+
+    Returns:
+        A list of rows, where each row is a list of styled segments.
+    """
+    if half_block:
+        # Each cell draws the upper row of the gradient in the foreground
+        # and the lower row in the background.
+        field = get_packed_saturation_value_field(
+            hue, width, height * 2, color_system, dither
+        )
+        return [
+            [
+                Segment("▀", style)
+                for style in get_styles(
+                    [upper << 24 | lower for upper, lower in zip(upper_row, lower_row)]
+                )
+            ]
+            for upper_row, lower_row in zip(field[::2], field[1::2])
+        ]
+
+    white = pack_rgb(WHITE.rgb) << 24
+    field = get_packed_saturation_value_field(hue, width, height, color_system, dither)
+    return [
+        [Segment(" ", style) for style in get_styles([white | rgb for rgb in row])]
+        for row in field
+    ]
 
 
 if __name__ == "__main__":
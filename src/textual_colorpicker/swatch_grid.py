@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+from rich.segment import Segment
+from textual import events
+from textual.color import Color
+from textual.geometry import Size
+from textual.message import Message
+from textual.reactive import reactive
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+from textual_colorpicker._styles import get_style
+from textual_colorpicker.metrics import MetricsMixin, measure_render
+
+
+class SwatchGrid(MetricsMixin, ScrollView, can_focus=True):
+    """A scrollable grid of color swatches, which can show very large palettes.
+
+    Only the visible rows of swatches are rendered, so the palette can contain
+    tens of thousands of colors.
+    """
+
+    ALLOW_SELECT = False
+
+    DEFAULT_CSS = """
+    SwatchGrid {
+        width: 1fr;
+        height: 10;
+        scrollbar-gutter: stable;
+    }
+    """
+
+    SWATCH_WIDTH = 4
+    """The width of each swatch in cells."""
+
+    SWATCH_HEIGHT = 2
+    """The height of each swatch in cells."""
+
+    swatches: reactive[Sequence[Color]] = reactive((), init=False, repaint=False)
+    """The colors of the swatches."""
+
+    class Selected(Message):
+        """Posted when a swatch is clicked.
+
+        This message can be handled using an `on_swatch_grid_selected` method.
+        """
+
+        def __init__(self, swatch_grid: SwatchGrid, index: int, color: Color) -> None:
+            super().__init__()
+            self.index: int = index
+            """The index of the selected swatch."""
+            self.color: Color = color
+            """The color of the selected swatch."""
+            self.swatch_grid: SwatchGrid = swatch_grid
+
+        @property
+        def control(self) -> SwatchGrid:
+            return self.swatch_grid
+
+    def __init__(
+        self,
+        swatches: Sequence[Color] = (),
+        *,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+        disabled: bool = False,
+    ) -> None:
+        """Create a swatch grid widget.
+
+        Args:
+            swatches: The colors of the swatches.
+            name: The name of the widget.
+            id: The ID of the widget in the DOM.
+            classes: The CSS classes of the widget.
+            disabled: Whether the widget is disabled or not.
+        """
+        super().__init__(name=name, id=id, classes=classes, disabled=disabled)
+        self.swatches = tuple(swatches)
+
+    @property
+    def columns(self) -> int:
+        """The number of swatches in each row of the grid."""
+        return max(1, self.scrollable_content_region.width // self.SWATCH_WIDTH)
+
+    def validate_swatches(self, swatches: Sequence[Color]) -> tuple[Color, ...]:
+        return tuple(swatches)
+
+    def watch_swatches(self) -> None:
+        self._record_watcher("swatches")
+
+        self._update_virtual_size()
+        self.refresh()
+
+    def _on_resize(self, event: events.Resize) -> None:
+        self._update_virtual_size()
+
+    def _update_virtual_size(self) -> None:
+        columns = self.columns
+        rows = -(-len(self.swatches) // columns)
+        self.virtual_size = Size(columns * self.SWATCH_WIDTH, rows * self.SWATCH_HEIGHT)
+
+    @measure_render
+    def render_line(self, y: int) -> Strip:
+        width = self.scrollable_content_region.width
+        _, scroll_y = self.scroll_offset
+        columns = self.columns
+
+        # Only the swatches in the visible row are looked up and styled.
+        start = ((scroll_y + y) // self.SWATCH_HEIGHT) * columns
+        blank = " " * self.SWATCH_WIDTH
+        segments = [
+            Segment(blank, get_style(rgb, rgb))
+            for rgb in (color.rgb for color in self.swatches[start : start + columns])
+        ]
+
+        return Strip(segments).extend_cell_length(width, self.rich_style)
+
+    def get_swatch_index_at(self, x: int, y: int) -> int | None:
+        """Get the index of the swatch at an offset in the visible region.
+
+        Args:
+            x: The column relative to the content region.
+            y: The row relative to the content region.
+
+        Returns:
+            The index of the swatch, or `None` if there is no swatch there.
+        """
+        columns = self.columns
+        column = x // self.SWATCH_WIDTH
+        if x < 0 or y < 0 or column >= columns:
+            return None
+        _, scroll_y = self.scroll_offset
+        index = ((scroll_y + y) // self.SWATCH_HEIGHT) * columns + column
+        if index >= len(self.swatches):
+            return None
+
+        return index
+
+    async def _on_click(self, event: events.Click) -> None:
+        mouse_offset = event.get_content_offset(self)
+        if mouse_offset is None:
+            return
+        index = self.get_swatch_index_at(*mouse_offset)
+        if index is None:
+            return
+        message = self.Selected(self, index, self.swatches[index])
+        self._post_and_record(message)
+
+
+if __name__ == "__main__":
+    from textual.app import App, ComposeResult
+
+    class SwatchGridApp(App):
+        CSS = """
+        Screen {
+            align: center middle;
+        }
+
+        SwatchGrid {
+            width: 80%;
+            height: 80%;
+        }
+        """
+
+        def compose(self) -> ComposeResult:
+            yield SwatchGrid(
+                [Color.from_hsv(h / 360, 1.0, 1.0) for h in range(360)] * 100
+            )
+
+    app = SwatchGridApp()
+    app.run()
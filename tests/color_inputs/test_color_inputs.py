@@ -11,10 +11,10 @@ class ColorInputsApp(App):
 
 def test_color_value_is_clamped() -> None:
     color_inputs = ColorInputs(Color(999, 999, 999))
-    assert color_inputs._color == Color(255, 255, 255)
+    assert color_inputs._state.color == Color(255, 255, 255)
 
     color_inputs = ColorInputs(Color(-999, -999, -999))
-    assert color_inputs._color == Color(0, 0, 0)
+    assert color_inputs._state.color == Color(0, 0, 0)
 
 
 async def test_initial_color_updates_all_inputs() -> None:
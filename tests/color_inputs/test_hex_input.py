@@ -1,5 +1,6 @@
 import pytest
 from textual.app import App, ComposeResult
+from textual.color import Color
 from textual.widgets import Input
 
 from textual_colorpicker.color_inputs import HexInput
@@ -101,3 +102,44 @@ async def test_submitted_input_strips_hash_prefix() -> None:
 
         assert input_widget.value == "ffff00"
         assert hex_input.value == "#FFFF00"
+
+
+def test_hex_value_is_normalized() -> None:
+    hex_input = HexInput("#abc")
+    assert hex_input.value == "#AABBCC"
+
+    hex_input.value = "rgb(0, 255, 0)"
+    assert hex_input.value == "#00FF00"
+
+
+def test_changed_message_color_defaults_to_parsed_value() -> None:
+    hex_input = HexInput()
+    message = HexInput.Changed(hex_input, "#00AAFF")
+    assert message.color == Color(0, 170, 255)
+
+
+@pytest.mark.parametrize(
+    "text, expected_value",
+    [
+        ("0af", "#00AAFF"),
+        ("#0af8", "#00AAFF"),
+        ("00aaff80", "#00AAFF"),
+        ("rgb(0, 170, 255)", "#00AAFF"),
+        ("hsl(120, 100%, 50%)", "#00FF00"),
+        ("crimson", "#DC143C"),
+    ],
+)
+async def test_submitted_input_accepts_other_color_formats(
+    text: str, expected_value: str
+) -> None:
+    app = HexInputApp()
+    async with app.run_test() as pilot:
+        hex_input = pilot.app.query_one(HexInput)
+        input_widget = hex_input.query_one(Input)
+
+        input_widget.value = text
+        await input_widget.action_submit()
+        await pilot.pause()
+
+        assert hex_input.value == expected_value
+        assert input_widget.value == expected_value[1:].lower()
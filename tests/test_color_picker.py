@@ -1,11 +1,21 @@
+import pytest
 from textual.app import App, ComposeResult
 from textual.color import HSV, Color
-
-from textual_colorpicker.color_inputs import HexInput, HsvInputs, RgbInputs
+from textual.message import Message
+from textual.widgets import Input
+
+from textual_colorpicker.color_inputs import (
+    ColorInputsSummary,
+    HexInput,
+    HsvInputs,
+    RgbInputs,
+)
 from textual_colorpicker.color_picker import ColorPicker
 from textual_colorpicker.color_preview import ColorPreview
+from textual_colorpicker.color_state import ColorState
 from textual_colorpicker.hue_picker import HuePicker
 from textual_colorpicker.saturation_value_picker import SaturationValuePicker
+from textual_colorpicker.swatch_grid import SwatchGrid
 
 
 class ColorPickerApp(App):
@@ -157,3 +167,349 @@ async def test_changed_color_posts_message() -> None:
         # The RGB has not changed so no message should have been posted
         assert color_picker.color == Color(0, 0, 0)
         assert app.messages == expected_messages
+
+
+async def test_rapid_picker_changes_update_all_widgets_once_each(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    app = ColorPickerApp()
+    async with app.run_test() as pilot:
+        color_picker = pilot.app.query_one(ColorPicker)
+        saturation_value_picker = pilot.app.query_one(SaturationValuePicker)
+        update_all = color_picker._update_all_from_state
+        updates: list[HSV] = []
+
+        def _update_all_from_state() -> None:
+            updates.append(color_picker._hsv)
+            update_all()
+
+        monkeypatch.setattr(
+            color_picker,
+            "_update_all_from_state",
+            _update_all_from_state,
+        )
+
+        # Simulate two samples from dragging arriving before the color picker
+        # has handled the first.
+        saturation_value_picker.hsv = HSV(0.0, 0.5, 0.5)
+        saturation_value_picker.hsv = HSV(0.0, 0.0, 1.0)
+        await pilot.pause()
+
+        assert updates == [HSV(0.0, 0.5, 0.5), HSV(0.0, 0.0, 1.0)]
+        assert saturation_value_picker.hsv == HSV(0.0, 0.0, 1.0)
+        assert color_picker.color == Color(255, 255, 255)
+        assert app.messages == ["Changed", "Changed"]
+
+
+async def test_clicking_posts_single_changed_message() -> None:
+    app = ColorPickerApp()
+    posted: list[Message] = []
+
+    def message_hook(message: Message) -> None:
+        if isinstance(
+            message,
+            (
+                ColorPicker.Changed,
+                Input.Changed,
+                HuePicker.Changed,
+                SaturationValuePicker.Changed,
+                RgbInputs.Changed,
+                HsvInputs.Changed,
+                HexInput.Changed,
+            ),
+        ) and not any(message is posted_message for posted_message in posted):
+            posted.append(message)
+
+    async with app.run_test(message_hook=message_hook) as pilot:
+        await pilot.pause()
+        posted.clear()
+
+        await pilot.click(SaturationValuePicker, offset=(0, 0))
+        await pilot.pause()
+
+        assert [message.__class__.__qualname__ for message in posted] == [
+            "SaturationValuePicker.Changed",
+            "ColorPicker.Changed",
+        ]
+        assert app.messages == ["Changed"]
+
+
+async def test_batch_update_posts_single_changed_message(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    app = ColorPickerApp()
+    async with app.run_test() as pilot:
+        color_picker = pilot.app.query_one(ColorPicker)
+        update_all = color_picker._update_all_from_state
+        updates: list[Color] = []
+
+        def _update_all_from_state() -> None:
+            updates.append(color_picker.color)
+            update_all()
+
+        monkeypatch.setattr(
+            color_picker,
+            "_update_all_from_state",
+            _update_all_from_state,
+        )
+
+        with color_picker.batch_update():
+            color_picker.color = Color(0, 0, 0)
+            color_picker._hsv = HSV(0.5, 1.0, 1.0)
+            with color_picker.batch_update():
+                color_picker.color = Color(0, 0, 255)
+        await pilot.pause()
+
+        assert updates == [Color(0, 0, 255)]
+        assert app.messages == ["Changed"]
+        assert pilot.app.query_one(HsvInputs).hsv == Color(0, 0, 255).hsv
+
+        # No message is posted if the color is unchanged after the batch.
+        with color_picker.batch_update():
+            color_picker.color = Color(255, 0, 0)
+            color_picker.color = Color(0, 0, 255)
+        await pilot.pause()
+
+        assert app.messages == ["Changed"]
+
+
+async def test_updating_color_does_not_query_child_widgets(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    app = ColorPickerApp()
+    async with app.run_test() as pilot:
+        color_picker = pilot.app.query_one(ColorPicker)
+        rgb_inputs = pilot.app.query_one(RgbInputs)
+        hsv_inputs = pilot.app.query_one(HsvInputs)
+        hex_input = pilot.app.query_one(HexInput)
+
+        def query_one(*args: object) -> None:
+            raise AssertionError("Child widgets should not be queried")
+
+        for widget in (color_picker, rgb_inputs, hsv_inputs, hex_input):
+            monkeypatch.setattr(widget, "query_one", query_one)
+
+        color_picker.color = Color(0, 255, 255)
+        await pilot.pause()
+
+        assert rgb_inputs.color == Color(0, 255, 255)
+        assert hsv_inputs.hsv == HSV(0.5, 1.0, 1.0)
+        assert hex_input.value == "#00FFFF"
+
+
+async def test_recomposing_updates_child_widget_references() -> None:
+    app = ColorPickerApp()
+    async with app.run_test() as pilot:
+        color_picker = pilot.app.query_one(ColorPicker)
+        old_rgb_inputs = pilot.app.query_one(RgbInputs)
+
+        await color_picker.recompose()
+        color_picker.color = Color(0, 255, 255)
+        await pilot.pause()
+
+        rgb_inputs = pilot.app.query_one(RgbInputs)
+        assert rgb_inputs is not old_rgb_inputs
+        assert rgb_inputs.color == Color(0, 255, 255)
+        assert pilot.app.query_one(HexInput).value == "#00FFFF"
+
+
+async def test_clicking_swatch_sets_color() -> None:
+    swatches = [Color(0, 0, 255), Color(0, 255, 0)]
+
+    class SwatchesApp(App):
+        def compose(self) -> ComposeResult:
+            yield ColorPicker(swatches=swatches)
+
+    app = SwatchesApp()
+    async with app.run_test(size=(120, 30)) as pilot:
+        color_picker = app.query_one(ColorPicker)
+
+        await pilot.click(SwatchGrid, offset=(5, 0))
+        assert color_picker.color == Color(0, 255, 0)
+        assert pilot.app.query_one(ColorPreview).color == Color(0, 255, 0)
+
+
+class CommittedApp(App):
+    def __init__(self, color_picker: ColorPicker) -> None:
+        super().__init__()
+        self.color_picker = color_picker
+        self.messages: list[tuple[str, Color]] = []
+
+    def compose(self) -> ComposeResult:
+        yield self.color_picker
+
+    def on_color_picker_changed(self, event: ColorPicker.Changed) -> None:
+        self.messages.append(("Changed", event.color))
+
+    def on_color_picker_committed(self, event: ColorPicker.Committed) -> None:
+        self.messages.append(("Committed", event.color))
+
+
+async def test_changed_messages_are_rate_limited_with_trailing_edge() -> None:
+    color_picker = ColorPicker(changed_rate_limit=2)
+    app = CommittedApp(color_picker)
+    async with app.run_test() as pilot:
+        for value in range(5):
+            color_picker.color = Color(value, 0, 0)
+        await pilot.pause()
+        assert app.messages == [("Changed", Color(0, 0, 0))]
+
+        await pilot.pause(0.6)
+        assert app.messages == [
+            ("Changed", Color(0, 0, 0)),
+            ("Changed", Color(4, 0, 0)),
+        ]
+
+
+async def test_mounting_with_color_does_not_post_committed_message() -> None:
+    app = CommittedApp(ColorPicker(Color(10, 20, 30)))
+    async with app.run_test() as pilot:
+        await pilot.pause()
+
+        assert app.messages == []
+
+
+async def test_changing_hue_of_gray_posts_no_messages() -> None:
+    app = CommittedApp(ColorPicker(Color(128, 128, 128)))
+    async with app.run_test() as pilot:
+        await pilot.click(HuePicker, offset=(20, 0))
+        await pilot.pause()
+
+        assert app.color_picker.color == Color(128, 128, 128)
+        assert app.messages == []
+
+
+async def test_setting_color_does_not_post_committed_message() -> None:
+    app = CommittedApp(ColorPicker())
+    async with app.run_test() as pilot:
+        app.color_picker.color = Color(0, 0, 0)
+        await pilot.pause()
+        await pilot.click(ColorPreview)
+        await pilot.pause()
+
+        assert app.messages == [("Changed", Color(0, 0, 0))]
+
+
+async def test_releasing_mouse_posts_committed_message() -> None:
+    app = CommittedApp(ColorPicker())
+    async with app.run_test() as pilot:
+        await pilot.mouse_down(SaturationValuePicker, offset=(0, 0))
+        await pilot.hover(SaturationValuePicker, offset=(36, 16))
+        await pilot.pause()
+        assert ("Committed", Color(255, 255, 255)) not in app.messages
+
+        await pilot.mouse_up(SaturationValuePicker, offset=(36, 16))
+        await pilot.pause()
+        assert app.messages[-2:] == [
+            ("Changed", Color(0, 0, 0)),
+            ("Committed", Color(0, 0, 0)),
+        ]
+        assert [name for name, _ in app.messages].count("Committed") == 1
+
+
+async def test_committing_delivers_pending_changed_message_first() -> None:
+    app = CommittedApp(ColorPicker(changed_rate_limit=1))
+    async with app.run_test() as pilot:
+        await pilot.click(SaturationValuePicker, offset=(0, 0))
+        await pilot.click(SaturationValuePicker, offset=(36, 16))
+        await pilot.pause()
+
+        assert app.messages == [
+            ("Changed", Color(255, 255, 255)),
+            ("Committed", Color(255, 255, 255)),
+            ("Changed", Color(0, 0, 0)),
+            ("Committed", Color(0, 0, 0)),
+        ]
+
+
+async def test_submitting_input_posts_committed_message() -> None:
+    app = CommittedApp(ColorPicker())
+    async with app.run_test() as pilot:
+        hex_input = app.query_one(HexInput)
+        input_widget = hex_input.query_one(Input)
+        input_widget.focus()
+        input_widget.value = "00ffff"
+        await pilot.press("enter")
+        await pilot.pause()
+
+        assert app.messages == [
+            ("Changed", Color(0, 255, 255)),
+            ("Committed", Color(0, 255, 255)),
+        ]
+
+
+async def test_lazy_inputs_shows_summary_until_clicked() -> None:
+    app = CommittedApp(ColorPicker(lazy_inputs=True))
+    async with app.run_test() as pilot:
+        color_picker = app.color_picker
+        assert not color_picker.query(Input)
+
+        color_picker.color = Color(0, 255, 255)
+        await pilot.pause()
+        summary = color_picker.query_one(ColorInputsSummary)
+        assert summary.render() == "RGB   0 255 255\nHSV 180 100 100\n#00FFFF"
+
+        await pilot.click(ColorInputsSummary)
+        await pilot.pause()
+        assert not color_picker.query(ColorInputsSummary)
+        assert color_picker.query_one(RgbInputs).color == Color(0, 255, 255)
+        assert color_picker.query_one(HsvInputs).hsv == HSV(0.5, 1.0, 1.0)
+        assert color_picker.query_one(HexInput).value == "#00FFFF"
+        assert app.messages == [("Changed", Color(0, 255, 255))]
+
+        color_picker.color = Color(0, 0, 0)
+        await pilot.pause()
+        assert color_picker.query_one(HexInput).value == "#000000"
+
+
+async def test_activating_summary_does_not_change_state() -> None:
+    app = CommittedApp(ColorPicker(lazy_inputs=True))
+    async with app.run_test() as pilot:
+        color_picker = app.color_picker
+        state = ColorState.from_hsv(HSV(0.5, 0.333, 0.777))
+        color_picker.state = state
+        await pilot.pause()
+        app.messages.clear()
+
+        await pilot.click(ColorInputsSummary)
+        await pilot.pause()
+        assert color_picker.query(HsvInputs)
+        assert color_picker.state is state
+        assert app.messages == []
+
+        await color_picker.recompose()
+        await pilot.pause()
+        assert color_picker.state is state
+        assert app.messages == []
+
+
+async def test_lazy_inputs_are_focused_when_summary_is_activated() -> None:
+    app = CommittedApp(ColorPicker(lazy_inputs=True))
+    async with app.run_test() as pilot:
+        app.query_one(ColorInputsSummary).focus()
+        await pilot.pause()
+        assert not app.query(Input)
+
+        await pilot.press("enter")
+        await pilot.pause()
+
+        red_input = app.query_one(RgbInputs).query(Input).first()
+        assert app.focused is red_input
+
+        red_input.value = "0"
+        await pilot.press("enter")
+        await pilot.pause()
+        assert app.color_picker.color == Color(0, 0, 0)
+        assert app.messages[-1] == ("Committed", Color(0, 0, 0))
+
+
+async def test_color_state_is_shared_with_child_widgets() -> None:
+    app = ColorPickerApp()
+    async with app.run_test() as pilot:
+        color_picker = pilot.app.query_one(ColorPicker)
+        color_picker.color = Color(0, 255, 255)
+        await pilot.pause()
+
+        state = color_picker.state
+        assert state.hsv == HSV(0.5, 1.0, 1.0)
+        assert pilot.app.query_one(HsvInputs)._state is state
@@ -0,0 +1,75 @@
+import pytest
+from textual.color import HSV, Color
+
+from textual_colorpicker import conversions
+from textual_colorpicker.color_state import ColorState
+
+
+def test_representations_from_color() -> None:
+    state = ColorState(Color(0, 255, 255))
+
+    assert state.color == Color(0, 255, 255)
+    assert state.rgb == (0, 255, 255)
+    assert state.hsv == HSV(0.5, 1.0, 1.0)
+    assert state.scaled_integers == (180, 100, 100)
+    assert state.hex == "#00FFFF"
+
+
+def test_representations_from_hsv() -> None:
+    state = ColorState.from_hsv(HSV(0.5, 1.0, 1.0))
+
+    assert state.color == Color(0, 255, 255)
+    assert state.scaled_integers == (180, 100, 100)
+    assert state.hex == "#00FFFF"
+
+
+def test_hsv_is_kept_when_it_is_the_authoritative_value() -> None:
+    # The hue of a grey would be lost in a round trip through RGB.
+    state = ColorState.from_hsv(HSV(0.5, 0.0, 0.5))
+
+    assert state.color == Color(128, 128, 128)
+    assert state.hsv == HSV(0.5, 0.0, 0.5)
+
+
+def test_values_are_clamped() -> None:
+    assert ColorState(Color(300, -10, 0)).color == Color(255, 0, 0)
+    assert ColorState.from_hsv(HSV(1.5, -1.0, 0.5)).hsv == HSV(1.0, 0.0, 0.5)
+
+
+def test_conversions_are_computed_lazily_and_cached(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[tuple[int, int, int]] = []
+
+    def rgb_to_hex(r: int, g: int, b: int) -> str:
+        calls.append((r, g, b))
+        return conversions.rgb_to_hex(r, g, b)
+
+    monkeypatch.setattr("textual_colorpicker.color_state.rgb_to_hex", rgb_to_hex)
+    state = ColorState(Color(0, 255, 255))
+    assert calls == []
+
+    assert state.hex == "#00FFFF"
+    assert state.hex == "#00FFFF"
+    assert calls == [(0, 255, 255)]
+
+
+def test_equality() -> None:
+    assert ColorState(Color(255, 0, 0)) == ColorState.from_hsv(HSV(0.0, 1.0, 1.0))
+    assert hash(ColorState(Color(255, 0, 0))) == hash(
+        ColorState.from_hsv(HSV(0.0, 1.0, 1.0))
+    )
+    # The same color with a different hue is a different state.
+    assert ColorState(Color(0, 0, 0)) != ColorState.from_hsv(HSV(0.5, 0.0, 0.0))
+
+
+def test_comparing_states_does_not_convert_them() -> None:
+    state = ColorState.from_hsv(HSV(0.5, 0.333, 0.777))
+    other = ColorState.from_hsv(HSV(0.5, 0.333, 0.777))
+
+    assert state == other
+    assert state._color is None and other._color is None
+
+    state = ColorState(Color(0, 255, 255))
+    assert state != ColorState(Color(0, 0, 0))
+    assert state._hsv is None
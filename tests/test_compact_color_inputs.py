@@ -0,0 +1,134 @@
+from textual.app import App, ComposeResult
+from textual.color import HSV, Color
+
+from textual_colorpicker.color_picker import ColorPicker
+from textual_colorpicker.compact_color_inputs import CompactColorInputs
+
+
+class CompactColorInputsApp(App):
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages: list[HSV] = []
+
+    def compose(self) -> ComposeResult:
+        yield CompactColorInputs()
+
+    def on_compact_color_inputs_changed(
+        self, event: CompactColorInputs.Changed
+    ) -> None:
+        self.messages.append(event.hsv)
+
+
+async def test_all_fields_are_drawn_on_one_line() -> None:
+    app = CompactColorInputsApp()
+    async with app.run_test():
+        compact_color_inputs = app.query_one(CompactColorInputs)
+
+        strip = compact_color_inputs.render_line(0)
+        assert strip.text == "R 255 G   0 B   0 H   0 S 100 V 100 # ff0000"
+
+
+async def test_typing_into_field_and_submitting_changes_color() -> None:
+    app = CompactColorInputsApp()
+    async with app.run_test() as pilot:
+        compact_color_inputs = app.query_one(CompactColorInputs)
+        compact_color_inputs.focus()
+
+        await pilot.press("right", "1", "2", "8")
+        assert compact_color_inputs.render_line(0).text.startswith("R 255 G 128")
+        assert compact_color_inputs.color == Color(255, 0, 0)
+
+        await pilot.press("enter")
+        await pilot.pause()
+        assert compact_color_inputs.color == Color(255, 128, 0)
+        assert app.messages == [compact_color_inputs.hsv]
+
+
+async def test_values_are_clamped_and_stepped() -> None:
+    app = CompactColorInputsApp()
+    async with app.run_test() as pilot:
+        compact_color_inputs = app.query_one(CompactColorInputs)
+        compact_color_inputs.focus()
+
+        # Select the hue field.
+        await pilot.press("right", "right", "right", "9", "9", "9", "enter")
+        assert compact_color_inputs.hsv == HSV(1.0, 1.0, 1.0)
+
+        await pilot.press("right", "down", "down")
+        assert compact_color_inputs.hsv == HSV(1.0, 0.98, 1.0)
+
+        # The cursor stops at the last field.
+        await pilot.press(*["right"] * 10, "escape")
+        assert compact_color_inputs._cursor == 6
+
+
+async def test_hex_field_accepts_shorthand() -> None:
+    app = CompactColorInputsApp()
+    async with app.run_test() as pilot:
+        compact_color_inputs = app.query_one(CompactColorInputs)
+        compact_color_inputs.focus()
+
+        await pilot.press(*["right"] * 6, "0", "a", "f", "enter")
+        assert compact_color_inputs.color == Color(0, 170, 255)
+
+        # Incomplete hex values are ignored.
+        await pilot.press("1", "2", "enter")
+        assert compact_color_inputs.color == Color(0, 170, 255)
+
+
+async def test_escape_cancels_editing() -> None:
+    app = CompactColorInputsApp()
+    async with app.run_test() as pilot:
+        compact_color_inputs = app.query_one(CompactColorInputs)
+        compact_color_inputs.focus()
+
+        await pilot.press("1", "escape", "enter")
+        assert compact_color_inputs.color == Color(255, 0, 0)
+        assert app.messages == []
+
+
+async def test_clicking_field_selects_it_and_blur_commits() -> None:
+    app = CompactColorInputsApp()
+    async with app.run_test() as pilot:
+        compact_color_inputs = app.query_one(CompactColorInputs)
+
+        await pilot.click(CompactColorInputs, offset=(32, 0))
+        assert compact_color_inputs._cursor == 5
+
+        await pilot.press("5", "0")
+        compact_color_inputs.blur()
+        await pilot.pause()
+        assert compact_color_inputs.hsv == HSV(0.0, 1.0, 0.5)
+
+
+async def test_color_picker_with_compact_inputs() -> None:
+    class CompactColorPickerApp(App):
+        def __init__(self) -> None:
+            super().__init__()
+            self.committed: list[Color] = []
+
+        def compose(self) -> ComposeResult:
+            yield ColorPicker(compact_inputs=True)
+
+        def on_color_picker_committed(self, event: ColorPicker.Committed) -> None:
+            self.committed.append(event.color)
+
+    app = CompactColorPickerApp()
+    async with app.run_test() as pilot:
+        color_picker = app.query_one(ColorPicker)
+        compact_color_inputs = app.query_one(CompactColorInputs)
+        assert len(color_picker.query("*")) < 10
+
+        color_picker.color = Color(0, 255, 255)
+        await pilot.pause()
+        assert compact_color_inputs.color == Color(0, 255, 255)
+
+        compact_color_inputs.focus()
+        await pilot.press("0", "enter")
+        await pilot.pause()
+        assert color_picker.color == Color(0, 255, 255)
+
+        await pilot.press("1", "2", "8", "enter")
+        await pilot.pause()
+        assert color_picker.color == Color(128, 255, 255)
+        assert app.committed == [Color(128, 255, 255)]
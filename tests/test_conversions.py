@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import pytest
+from textual.color import HSV, Color
+
+from textual_colorpicker import conversions
+from textual_colorpicker.conversions import (
+    _hsv_to_rgb_grid_numpy,
+    _hsv_to_rgb_grid_python,
+    hsv_to_rgb,
+    hsv_to_scaled_integers,
+    parse_color,
+    rgb_to_hex,
+    rgb_to_hsv,
+    scaled_integers_to_hsv,
+)
+
+HSV_VALUES = [
+    HSV(h / 12, s / 4, v / 4) for h in range(13) for s in range(5) for v in range(5)
+]
+
+RGB_VALUES = [
+    (r, g, b) for r in range(0, 256, 51) for g in range(0, 256, 85) for b in (0, 255)
+]
+
+
+@pytest.mark.parametrize("hsv", HSV_VALUES)
+def test_hsv_to_rgb_matches_color_from_hsv(hsv: HSV) -> None:
+    assert hsv_to_rgb(*hsv) == Color.from_hsv(*hsv).rgb
+
+
+@pytest.mark.parametrize("rgb", RGB_VALUES)
+def test_rgb_to_hsv_matches_color_hsv(rgb: tuple[int, int, int]) -> None:
+    assert rgb_to_hsv(*rgb) == Color(*rgb).hsv
+
+
+@pytest.mark.parametrize("rgb", RGB_VALUES)
+def test_rgb_to_hex_matches_color_hex(rgb: tuple[int, int, int]) -> None:
+    assert rgb_to_hex(*rgb) == Color(*rgb).hex
+
+
+def test_scaled_integers_round_trip() -> None:
+    assert hsv_to_scaled_integers(0.5, 0.254, 0.996) == (180, 25, 100)
+    assert scaled_integers_to_hsv(180, 25, 100) == HSV(0.5, 0.25, 1.0)
+
+
+@pytest.mark.parametrize("hue", [0.0, 1 / 6, 0.3, 0.5, 0.75, 0.999, 1.0])
+def test_numpy_grid_is_identical_to_python_grid(hue: float) -> None:
+    if not conversions.HAS_NUMPY:
+        pytest.skip("NumPy is not installed")
+
+    saturations = [x / 36 for x in range(37)]
+    values = [1 - (y / 16) for y in range(17)]
+    python_grid = _hsv_to_rgb_grid_python(hue, saturations, values)
+    numpy_grid = _hsv_to_rgb_grid_numpy(hue, saturations, values)
+
+    assert numpy_grid == python_grid
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("#0AF", Color(0, 170, 255)),
+        ("0af", Color(0, 170, 255)),
+        ("#0AF8", Color(0, 170, 255, 136 / 255)),
+        ("#00aaff", Color(0, 170, 255)),
+        ("#00AAFF80", Color(0, 170, 255, 128 / 255)),
+        ("rgb(0, 170, 255)", Color(0, 170, 255)),
+        ("rgba(0 170 255 / 50%)", Color(0, 170, 255, 0.5)),
+        ("rgb(0%, 50%, 100%)", Color(0, 128, 255)),
+        ("hsl(180, 50%, 50%)", Color.parse("hsl(180, 50%, 50%)")),
+        ("hsla(180deg 50% 50% / 0.25)", Color.parse("hsla(180, 50%, 50%, 0.25)")),
+        ("crimson", Color.parse("crimson")),
+        ("  RebeccaPurple ", Color.parse("rebeccapurple")),
+    ],
+)
+def test_parse_color(text: str, expected: Color) -> None:
+    assert parse_color(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text", ["", "#", "#12", "#12345", "rgb(1, 2)", "hsl(1, 2, 3)", "notacolor"]
+)
+def test_parse_color_raises_if_invalid(text: str) -> None:
+    with pytest.raises(ValueError):
+        parse_color(text)
+
+
+def test_parse_color_remembers_recent_strings() -> None:
+    assert parse_color("#123") is parse_color("#123")
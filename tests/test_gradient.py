@@ -0,0 +1,41 @@
+import pytest
+from rich.color import ColorSystem
+from textual.color import Color
+
+from textual_colorpicker._gradient import (
+    get_packed_saturation_value_field,
+    get_saturation_value_field,
+)
+from textual_colorpicker._palette import quantize_row
+from textual_colorpicker._styles import pack_rgb
+
+
+@pytest.mark.parametrize("hue", [0.0, 0.1, 0.25, 0.5, 0.8, 1.0])
+def test_saturation_value_field_matches_color_from_hsv(hue: float) -> None:
+    width, height = 7, 5
+    field = get_saturation_value_field(hue, width, height)
+
+    assert len(field) == height
+    for y, row in enumerate(field):
+        assert len(row) == width
+        value = 1 - (y / (height - 1))
+        for x, rgb in enumerate(row):
+            assert rgb == Color.from_hsv(hue, x / (width - 1), value).rgb
+
+
+@pytest.mark.parametrize(
+    "color_system",
+    [ColorSystem.TRUECOLOR, ColorSystem.EIGHT_BIT, ColorSystem.STANDARD],
+)
+@pytest.mark.parametrize("dither", [False, True])
+def test_packed_field_matches_quantized_field(
+    color_system: ColorSystem, dither: bool
+) -> None:
+    hue, width, height = 0.3, 9, 6
+    field = get_saturation_value_field(hue, width, height)
+    packed = get_packed_saturation_value_field(hue, width, height, color_system, dither)
+
+    assert packed == [
+        [pack_rgb(rgb) for rgb in quantize_row(row, color_system, y, dither)]
+        for y, row in enumerate(field)
+    ]
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from rich.segment import Segment
+from textual.app import App, ComposeResult
+from textual.containers import HorizontalGroup
+
+from textual_colorpicker._palette import get_color_system
+from textual_colorpicker.gradient_cache import GradientCache, gradient_cache
+from textual_colorpicker.hue_picker import HuePicker
+from textual_colorpicker.saturation_value_picker import SaturationValuePicker
+
+
+def make_rows(width: int, height: int) -> list[list[Segment]]:
+    return [[Segment(" ") for _ in range(width)] for _ in range(height)]
+
+
+def test_least_recently_used_gradients_are_evicted() -> None:
+    rows = make_rows(10, 10)
+    cache = GradientCache(max_size=0)
+    cache.set("first", rows)
+    gradient_size = cache.size
+    cache.max_size = gradient_size * 2
+
+    cache.set("second", make_rows(10, 10))
+    assert cache.get("first") is rows  # Now the most recently used
+    cache.set("third", make_rows(10, 10))
+
+    assert len(cache) == 2
+    assert cache.get("first") is rows
+    assert cache.get("second") is None
+    assert cache.get("third") is not None
+    assert cache.size == gradient_size * 2
+
+
+def test_reducing_max_size_evicts_gradients() -> None:
+    cache = GradientCache(max_size=1024 * 1024)
+    for key in range(3):
+        cache.set(key, make_rows(10, 10))
+    assert len(cache) == 3
+
+    cache.max_size = 0
+    # The most recent gradient is always kept.
+    assert len(cache) == 1
+    assert cache.get(2) is not None
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+def test_rows_stored_under_several_keys_are_counted_once() -> None:
+    rows = make_rows(10, 10)
+    cache = GradientCache(max_size=1024 * 1024)
+    cache.set("field", rows)
+    gradient_size = cache.size
+
+    cache.set("master", rows)
+    assert len(cache) == 2
+    assert cache.size == gradient_size
+
+    cache.set("field", make_rows(10, 10))
+    assert cache.size == gradient_size * 2
+    cache.set("master", make_rows(5, 5))
+    assert cache.size == gradient_size + gradient_size // 4
+
+
+class ManyPickersApp(App):
+    CSS = """
+    SaturationValuePicker {
+        width: 35;
+        height: 17;
+    }
+
+    HuePicker {
+        width: 35;
+    }
+    """
+
+    def compose(self) -> ComposeResult:
+        for _ in range(3):
+            with HorizontalGroup():
+                yield SaturationValuePicker()
+                yield HuePicker()
+
+
+async def test_gradients_are_shared_between_pickers() -> None:
+    gradient_cache.clear()
+    app = ManyPickersApp()
+    async with app.run_test(size=(120, 60)):
+        color_system = get_color_system(app.console)
+        saturation_value_pickers = list(app.query(SaturationValuePicker))
+        hue_pickers = list(app.query(HuePicker))
+
+        first_row = saturation_value_pickers[0]._get_gradient_row(
+            0, 35, 17, color_system
+        )
+        for saturation_value_picker in saturation_value_pickers[1:]:
+            row = saturation_value_picker._get_gradient_row(0, 35, 17, color_system)
+            assert row is first_row
+
+        first_rows = hue_pickers[0]._get_gradient_rows(35, color_system)
+        for hue_picker in hue_pickers[1:]:
+            assert hue_picker._get_gradient_rows(35, color_system) is first_rows
+
+        # One saturation/value field and one hue gradient, each also kept
+        # under a second key as the master for resizing.
+        assert len(gradient_cache) == 4
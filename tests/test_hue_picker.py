@@ -1,5 +1,7 @@
 from textual.app import App, ComposeResult
 
+from textual_colorpicker._palette import get_color_system
+from textual_colorpicker.gradient_cache import gradient_cache
 from textual_colorpicker.hue_picker import HuePicker
 
 
@@ -52,15 +54,14 @@ async def test_clicking_outside_content_is_noop() -> None:
         assert hue_picker.hue == expected_value  # No change
 
 
-# TODO: Remember to uncomment this test after enabling click and drag
-#
-# async def test_click_and_drag_updates_hue_value() -> None:
-#     app = HuePickerApp()
-#     async with app.run_test() as pilot:
-#         hue_picker = pilot.app.query_one(HuePicker)
-#         await pilot.mouse_down(HuePicker, offset=(7, 0))
-#         await pilot.hover(HuePicker, offset=(17, 0))
-#         assert hue_picker.hue == 0.5
+async def test_click_and_drag_updates_hue_value() -> None:
+    app = HuePickerApp()
+    async with app.run_test() as pilot:
+        hue_picker = pilot.app.query_one(HuePicker)
+        await pilot.mouse_down(HuePicker, offset=(7, 0))
+        await pilot.hover(HuePicker, offset=(17, 0))
+        await pilot.pause()
+        assert hue_picker.hue == 0.5
 
 
 async def test_changed_hue_posts_message() -> None:
@@ -74,3 +75,37 @@ async def test_changed_hue_posts_message() -> None:
         await pilot.pause()
         expected_messages.append("Changed")
         assert app.messages == expected_messages
+
+
+async def test_gradient_rows_are_reused_until_width_changes() -> None:
+    app = HuePickerApp()
+    async with app.run_test() as pilot:
+        hue_picker = pilot.app.query_one(HuePicker)
+        color_system = get_color_system(app.console)
+        gradient_rows = hue_picker._get_gradient_rows(35, color_system)
+
+        hue_picker.hue = 0.5
+        assert hue_picker.render_line(0).text == " " * 17 + "▼" + " " * 17
+        assert hue_picker.render_line(1).text == " " * 17 + "▲" + " " * 17
+        assert hue_picker._get_gradient_rows(35, color_system) is gradient_rows
+
+        hue_picker.styles.width = 21
+        await pilot.pause()
+        assert hue_picker.render_line(0).text == " " * 10 + "▼" + " " * 10
+        assert hue_picker._get_gradient_rows(21, color_system) is not gradient_rows
+
+
+async def test_narrower_gradient_is_resampled_from_the_master() -> None:
+    gradient_cache.clear()
+    app = HuePickerApp()
+    async with app.run_test() as pilot:
+        hue_picker = pilot.app.query_one(HuePicker)
+        color_system = get_color_system(app.console)
+        gradient_rows = hue_picker._get_gradient_rows(35, color_system)
+
+        narrow_rows = hue_picker._get_gradient_rows(21, color_system)
+        for row, narrow_row in zip(gradient_rows, narrow_rows):
+            assert len(narrow_row) == 21
+            assert narrow_row[0] is row[0]
+            assert narrow_row[-1] is row[-1]
+            assert all(segment in row for segment in narrow_row)
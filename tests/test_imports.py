@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import textual_colorpicker
+
+
+def get_imported_modules(statement: str) -> set[str]:
+    """Get the modules imported by a statement in a fresh interpreter."""
+    code = f"{statement}\nimport sys\nprint(*sys.modules, sep='\\n')"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+def test_importing_package_does_not_import_widgets() -> None:
+    modules = get_imported_modules("import textual_colorpicker")
+
+    assert not any(module.startswith("textual_colorpicker.") for module in modules)
+    assert "textual.widget" not in modules
+
+
+def test_importing_hue_picker_does_not_import_color_picker() -> None:
+    modules = get_imported_modules("from textual_colorpicker import HuePicker")
+
+    assert "textual_colorpicker.hue_picker" in modules
+    assert "textual_colorpicker.color_picker" not in modules
+    assert "textual_colorpicker.color_inputs" not in modules
+    assert "textual.widgets._input" not in modules
+    assert "textual.validation" not in modules
+    assert "numpy" not in modules
+
+
+def test_lazy_attributes() -> None:
+    from textual_colorpicker.color_picker import ColorPicker
+
+    assert textual_colorpicker.ColorPicker is ColorPicker
+    assert set(textual_colorpicker.__all__) <= set(dir(textual_colorpicker))
+    with pytest.raises(AttributeError):
+        textual_colorpicker.NotAWidget
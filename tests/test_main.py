@@ -0,0 +1,64 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from textual_colorpicker.__main__ import main
+
+
+def test_renders_ansi_frame(capsys: pytest.CaptureFixture[str]) -> None:
+    main(["hue", "--size", "20x2", "--color", "#00ffff"])
+
+    output = capsys.readouterr().out
+    assert len(output.splitlines()) == 2
+    # The hue pointer is drawn at the cyan hue.
+    assert "\x1b[38;2;" in output
+
+
+def test_writes_svg_frame(tmp_path: Path) -> None:
+    path = tmp_path / "frame.svg"
+    main(["saturation-value", "--size", "20x5", "--format", "svg", "-o", str(path)])
+
+    assert path.read_text().startswith("<svg")
+
+
+def test_quantizes_frame_to_color_system(capsys: pytest.CaptureFixture[str]) -> None:
+    main(["saturation-value", "--size", "20x5", "--color-system", "256"])
+
+    output = capsys.readouterr().out
+    assert "\x1b[38;2;" not in output
+    assert "\x1b[38;5;" in output
+
+
+def test_color_systems_do_not_share_escape_codes(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    main(["saturation-value", "--size", "20x5", "--color-system", "truecolor"])
+    assert "\x1b[38;2;" in capsys.readouterr().out
+
+    # The gradient styles are shared, so the second frame would reuse the
+    # escape codes of the first if they were cached on the shared styles.
+    main(["saturation-value", "--size", "20x5", "--color-system", "standard"])
+    output = capsys.readouterr().out
+    assert "\x1b[38;2;" not in output
+    assert "\x1b[38;5;" not in output
+
+
+def test_bench_reports_frames_per_second_and_line_timings(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    main(["--size", "80x24", "--bench", "3"])
+
+    report = json.loads(capsys.readouterr().out)
+    assert report["widget"] == "color-picker"
+    assert report["frames"] == 3
+    assert report["frames_per_second"] > 0
+    assert report["lines"]["SaturationValuePicker"]["lines"] > 0
+    assert report["lines"]["SaturationValuePicker"]["mean_line_us"] > 0
+
+
+def test_invalid_arguments_are_rejected() -> None:
+    with pytest.raises(SystemExit):
+        main(["--size", "80"])
+    with pytest.raises(SystemExit):
+        main(["--color", "not a color"])
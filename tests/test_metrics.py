@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from textual.app import App, ComposeResult
+from textual.color import Color
+
+from textual_colorpicker.color_picker import ColorPicker
+from textual_colorpicker.metrics import Metrics
+from textual_colorpicker.saturation_value_picker import SaturationValuePicker
+from textual_colorpicker.swatch_grid import SwatchGrid
+
+
+class ColorPickerApp(App):
+    def __init__(
+        self, metrics: Metrics, color_picker: ColorPicker | None = None
+    ) -> None:
+        super().__init__()
+        self.metrics = metrics
+        self.color_picker = color_picker
+
+    def compose(self) -> ComposeResult:
+        color_picker = self.color_picker or ColorPicker()
+        self.metrics.attach(color_picker)
+        yield color_picker
+
+
+async def test_metrics_are_collected_for_color_picker_and_children() -> None:
+    metrics = Metrics()
+    app = ColorPickerApp(metrics)
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        snapshot = metrics.snapshot()
+        assert snapshot.render_calls["SaturationValuePicker"] > 0
+        assert snapshot.render_calls["HuePicker"] > 0
+        assert snapshot.render_calls["ColorPreview"] > 0
+        assert snapshot.render_time["SaturationValuePicker"] > 0
+
+        metrics.reset()
+        await pilot.click(SaturationValuePicker, offset=(0, 0))
+        await pilot.pause()
+
+        snapshot = metrics.snapshot()
+        assert snapshot.messages == {
+            "SaturationValuePicker.Changed": 1,
+            "ColorPicker.Changed": 1,
+            "ColorPicker.Committed": 1,
+        }
+        assert snapshot.watcher_calls == {
+            "SaturationValuePicker.hsv": 1,
+            "ColorPicker.state": 1,
+            "RgbInputs.color": 1,
+            "HexInput.value": 1,
+            "HsvInputs.hsv": 1,
+        }
+
+
+async def test_snapshot_is_not_affected_by_reset() -> None:
+    metrics = Metrics()
+    app = ColorPickerApp(metrics)
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        snapshot = metrics.snapshot()
+
+        metrics.reset()
+
+        assert snapshot.render_calls
+        assert metrics.snapshot().render_calls == {}
+        assert metrics.snapshot().messages == {}
+
+
+async def test_detached_widgets_are_not_measured() -> None:
+    metrics = Metrics()
+    app = ColorPickerApp(metrics)
+    async with app.run_test() as pilot:
+        color_picker = pilot.app.query_one(ColorPicker)
+        await pilot.pause()
+        metrics.detach(color_picker)
+        metrics.reset()
+
+        await pilot.click(SaturationValuePicker, offset=(0, 0))
+        await pilot.pause()
+
+        assert metrics.snapshot() == ({}, {}, {}, {})
+
+
+async def test_metrics_are_collected_for_summary_and_swatch_grid() -> None:
+    metrics = Metrics()
+    color_picker = ColorPicker(lazy_inputs=True, swatches=[Color(0, 0, 0)])
+    app = ColorPickerApp(metrics, color_picker)
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        metrics.reset()
+
+        await pilot.click(SaturationValuePicker, offset=(0, 0))
+        color_picker.query_one(SwatchGrid).swatches = [Color(255, 255, 255)]
+        await pilot.pause()
+
+        snapshot = metrics.snapshot()
+        assert snapshot.watcher_calls["ColorInputsSummary.hsv"] == 1
+        assert snapshot.watcher_calls["SwatchGrid.swatches"] == 1
+        assert snapshot.render_calls["SwatchGrid"] > 0
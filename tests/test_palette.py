@@ -0,0 +1,71 @@
+import pytest
+from rich.color import ColorSystem
+from rich.console import Console
+
+from textual_colorpicker import conversions
+from textual_colorpicker._palette import (
+    get_color_system,
+    quantize_arrays,
+    quantize_color,
+    quantize_row,
+)
+
+
+def test_get_color_system() -> None:
+    assert get_color_system(Console(color_system="256")) == ColorSystem.EIGHT_BIT
+    assert get_color_system(Console(color_system="standard")) == ColorSystem.STANDARD
+    assert get_color_system(Console(color_system=None)) == ColorSystem.TRUECOLOR
+
+
+def test_truecolor_is_not_quantized() -> None:
+    assert quantize_color((1, 2, 3), ColorSystem.TRUECOLOR) == (1, 2, 3)
+    assert quantize_row([(1, 2, 3)], ColorSystem.TRUECOLOR, 0, True) == [(1, 2, 3)]
+
+
+def test_colors_are_quantized_to_palette_colors() -> None:
+    assert quantize_color((250, 5, 5), ColorSystem.EIGHT_BIT) == (255, 0, 0)
+    assert quantize_color((0, 100, 140), ColorSystem.EIGHT_BIT) == (0, 95, 135)
+    assert quantize_color((250, 5, 5), ColorSystem.STANDARD) == (170, 0, 0)
+
+
+def test_dither_mixes_neighbouring_palette_colors() -> None:
+    colors = [(0, 115, 0)] * 8
+    undithered = quantize_row(colors, ColorSystem.EIGHT_BIT, 0)
+    dithered = quantize_row(colors, ColorSystem.EIGHT_BIT, 0, dither=True)
+
+    assert len(set(undithered)) == 1
+    assert set(dithered) == {(0, 95, 0), (0, 135, 0)}
+    # The dither pattern repeats every four columns.
+    assert dithered[:4] == dithered[4:]
+
+
+@pytest.mark.parametrize(
+    "color_system",
+    [ColorSystem.TRUECOLOR, ColorSystem.EIGHT_BIT, ColorSystem.STANDARD],
+)
+@pytest.mark.parametrize("dither", [False, True])
+def test_quantize_arrays_is_identical_to_quantize_row(
+    color_system: ColorSystem, dither: bool
+) -> None:
+    if not conversions.HAS_NUMPY:
+        pytest.skip("NumPy is not installed")
+
+    numpy = conversions._numpy()
+    rows = [
+        [
+            ((x * 37 + y * 11) % 256, (x * 13) % 256, (y * 59 + x) % 256)
+            for x in range(29)
+        ]
+        for y in range(9)
+    ]
+    expected = [
+        quantize_row(row, color_system, y, dither) for y, row in enumerate(rows)
+    ]
+    channels = numpy.array(rows)
+    red, green, blue = quantize_arrays(
+        channels[..., 0], channels[..., 1], channels[..., 2], color_system, dither
+    )
+
+    assert numpy.stack([red, green, blue], axis=-1).tolist() == [
+        [list(rgb) for rgb in row] for row in expected
+    ]
@@ -0,0 +1,18 @@
+import pytest
+
+from textual_colorpicker._resample import resample_rows
+
+
+@pytest.mark.parametrize("width, height", [(4, 3), (13, 9), (40, 20), (1, 1)])
+def test_resampled_rows_keep_edges_and_share_cells(width: int, height: int) -> None:
+    rows = [[(x, y) for x in range(10)] for y in range(6)]
+    resampled = resample_rows(rows, width, height)
+
+    assert len(resampled) == height
+    assert all(len(row) == width for row in resampled)
+    assert resampled[0][0] is rows[0][0]
+    if width > 1 and height > 1:
+        assert resampled[-1][-1] is rows[-1][-1]
+    for row in resampled:
+        for cell in row:
+            assert cell is rows[cell[1]][cell[0]]
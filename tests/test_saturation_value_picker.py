@@ -1,7 +1,23 @@
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import pytest
+from rich._palettes import EIGHT_BIT_PALETTE
+from rich.color import ColorSystem
+from rich.segment import Segment
+from textual import events
 from textual.app import App, ComposeResult
-from textual.color import HSV
+from textual.color import HSV, WHITE, Color
+from textual.geometry import Region
 
-from textual_colorpicker.saturation_value_picker import SaturationValuePicker
+from textual_colorpicker._palette import get_color_system, quantize_color
+from textual_colorpicker.gradient_cache import gradient_cache
+from textual_colorpicker.saturation_value_picker import (
+    SaturationValuePicker,
+    _build_gradient_rows,
+)
 
 
 class SaturationValuePickerApp(App):
@@ -57,16 +73,15 @@ async def test_clicking_outside_content_is_noop() -> None:
         assert saturation_value_picker.hsv == expected_hsv  # No change
 
 
-# TODO: Remember to uncomment this test after enabling click and drag
-#
-# async def test_click_and_drag_updates_hsv_value() -> None:
-#     app = SaturationValuePickerApp()
-#     async with app.run_test() as pilot:
-#         saturation_value_picker = pilot.app.query_one(SaturationValuePicker)
-#         await pilot.mouse_down(SaturationValuePicker, offset=(7, 4))
-#         await pilot.hover(SaturationValuePicker, offset=(17, 8))
-#         assert saturation_value_picker.hsv.s == 0.5
-#         assert saturation_value_picker.hsv.v == 0.5
+async def test_click_and_drag_updates_hsv_value() -> None:
+    app = SaturationValuePickerApp()
+    async with app.run_test() as pilot:
+        saturation_value_picker = pilot.app.query_one(SaturationValuePicker)
+        await pilot.mouse_down(SaturationValuePicker, offset=(7, 4))
+        await pilot.hover(SaturationValuePicker, offset=(17, 8))
+        await pilot.pause()
+        assert saturation_value_picker.hsv.s == 0.5
+        assert saturation_value_picker.hsv.v == 0.5
 
 
 async def test_changed_hsv_posts_message() -> None:
@@ -80,3 +95,489 @@ async def test_changed_hsv_posts_message() -> None:
         await pilot.pause()
         expected_messages.append("Changed")
         assert app.messages == expected_messages
+
+
+async def test_gradient_rows_are_cached_and_reused_for_pointer_moves() -> None:
+    app = SaturationValuePickerApp()
+    async with app.run_test() as pilot:
+        saturation_value_picker = pilot.app.query_one(SaturationValuePicker)
+        saturation_value_picker.render_line(0)
+        cached_row = saturation_value_picker._get_gradient_row(
+            0, 35, 17, ColorSystem.TRUECOLOR
+        )
+
+        saturation_value_picker.hsv = HSV(0.0, 0.5, 0.5)
+        strip = saturation_value_picker.render_line(0)
+        assert (
+            saturation_value_picker._get_gradient_row(0, 35, 17, ColorSystem.TRUECOLOR)
+            is cached_row
+        )
+        assert strip.text == " " * 17 + "║" + " " * 17
+
+        strip = saturation_value_picker.render_line(8)
+        assert strip.text == "═" * 17 + "╬" + "═" * 17
+
+
+async def test_changing_saturation_value_refreshes_only_pointer_regions(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    app = SaturationValuePickerApp()
+    async with app.run_test() as pilot:
+        saturation_value_picker = pilot.app.query_one(SaturationValuePicker)
+        refreshed_regions: list[tuple[Region, ...]] = []
+
+        def refresh(*regions: Region, **kwargs: bool) -> SaturationValuePicker:
+            refreshed_regions.append(regions)
+            return saturation_value_picker
+
+        monkeypatch.setattr(saturation_value_picker, "refresh", refresh)
+
+        saturation_value_picker.hsv = HSV(0.0, 0.5, 0.5)
+        assert refreshed_regions == [
+            (
+                Region(0, 0, 35, 1),
+                Region(34, 0, 1, 17),
+                Region(0, 8, 35, 1),
+                Region(17, 0, 1, 17),
+            )
+        ]
+
+        saturation_value_picker.hsv = HSV(0.5, 0.5, 0.5)
+        assert refreshed_regions[-1] == ()  # Full refresh
+
+
+async def test_mouse_moves_are_coalesced_while_dragging() -> None:
+    app = SaturationValuePickerApp()
+    async with app.run_test() as pilot:
+        saturation_value_picker = pilot.app.query_one(SaturationValuePicker)
+        await pilot.mouse_down(SaturationValuePicker, offset=(0, 0))
+        await pilot.pause()
+        app.messages.clear()
+
+        for x in range(1, 18):
+            saturation_value_picker.post_message(
+                events.MouseMove(
+                    saturation_value_picker, x, 8, 0, 0, 1, False, False, False
+                )
+            )
+        await pilot.pause()
+
+        assert app.messages == ["Changed"]
+        assert saturation_value_picker.hsv.s == 0.5
+        assert saturation_value_picker.hsv.v == 0.5
+
+
+async def test_half_block_mode_draws_two_gradient_rows_per_cell() -> None:
+    app = SaturationValuePickerApp()
+    async with app.run_test() as pilot:
+        saturation_value_picker = pilot.app.query_one(SaturationValuePicker)
+        saturation_value_picker.half_block = True
+        saturation_value_picker.hsv = HSV(0.0, 0.0, 0.0)
+
+        bottom_row = saturation_value_picker._get_gradient_row(
+            16, 35, 17, ColorSystem.TRUECOLOR
+        )
+        style = bottom_row[0].style
+        assert style is not None and style.color and style.bgcolor
+        # The upper half of the cell is slightly brighter than the lower half.
+        assert style.color.triplet == Color.from_hsv(0.0, 0.0, 1 / 33).rgb
+        assert style.bgcolor.triplet == (0, 0, 0)
+
+        strip = saturation_value_picker.render_line(0)
+        assert strip.text == "║" + "▀" * 34
+        # The pointer is in the lower half of the bottom row.
+        strip = saturation_value_picker.render_line(16)
+        assert strip.text == "╬" + "▀" * 34
+        for segment in list(strip)[1:]:
+            assert segment.style is not None
+            assert segment.style.bgcolor == WHITE.rich_color
+
+
+async def test_half_block_mode_maps_mouse_to_half_rows() -> None:
+    app = SaturationValuePickerApp()
+    async with app.run_test() as pilot:
+        saturation_value_picker = pilot.app.query_one(SaturationValuePicker)
+        saturation_value_picker.half_block = True
+
+        await pilot.click(SaturationValuePicker, offset=(17, 16))
+        assert saturation_value_picker.hsv.s == 0.5
+        assert saturation_value_picker.hsv.v == 0.0
+
+        # Pointer positions within a cell select the upper or lower half.
+        saturation_value_picker.post_message(
+            events.MouseDown(
+                saturation_value_picker, 0, 8.25, 0, 0, 1, False, False, False
+            )
+        )
+        await pilot.pause()
+        assert saturation_value_picker.hsv.v == 1 - 16 / 33
+
+        saturation_value_picker.post_message(
+            events.MouseMove(
+                saturation_value_picker, 0, 8.75, 0, 0, 1, False, False, False
+            )
+        )
+        await pilot.pause()
+        assert saturation_value_picker.hsv.v == 1 - 17 / 33
+
+
+async def test_half_block_mode_maps_pixel_mouse_positions_to_cell_halves() -> None:
+    app = SaturationValuePickerApp()
+    async with app.run_test() as pilot:
+        saturation_value_picker = pilot.app.query_one(SaturationValuePicker)
+        saturation_value_picker.half_block = True
+
+        def press(y: float) -> None:
+            saturation_value_picker.post_message(
+                events.MouseDown(
+                    saturation_value_picker, 0, y, 0, 0, 1, False, False, False
+                )
+            )
+
+        # The bottom half of the first cell.
+        press(0.5)
+        await pilot.pause()
+        assert saturation_value_picker.hsv.v == 1 - 1 / 33
+
+        # The top edge of a cell is a whole number of cells in pixel mode.
+        press(8.0)
+        await pilot.pause()
+        assert saturation_value_picker.hsv.v == 1 - 16 / 33
+
+        press(16.0)
+        await pilot.pause()
+        assert saturation_value_picker.hsv.v == 1 - 32 / 33
+
+        press(16.5)
+        await pilot.pause()
+        assert saturation_value_picker.hsv.v == 0.0
+
+
+@pytest.mark.parametrize(
+    "value, upper_half", [(1 - 16 / 33, True), (1 - 17 / 33, False)]
+)
+async def test_half_block_mode_marks_where_the_pointer_lines_cross(
+    value: float, upper_half: bool
+) -> None:
+    app = SaturationValuePickerApp()
+    async with app.run_test() as pilot:
+        saturation_value_picker = pilot.app.query_one(SaturationValuePicker)
+        saturation_value_picker.half_block = True
+        saturation_value_picker.hsv = HSV(0.0, 0.5, value)
+
+        strip = saturation_value_picker.render_line(8)
+        assert strip.text == "▀" * 17 + "╬" + "▀" * 17
+
+        segments = list(strip)
+        line_style = segments[0].style
+        assert line_style is not None
+        if upper_half:
+            assert line_style.color == WHITE.rich_color
+        else:
+            assert line_style.bgcolor == WHITE.rich_color
+        pointer_style = segments[17].style
+        assert pointer_style is not None
+        assert pointer_style.color == WHITE.rich_color
+        assert pointer_style.bgcolor != WHITE.rich_color
+
+
+async def test_gradient_is_quantized_to_the_terminal_palette() -> None:
+    app = SaturationValuePickerApp()
+    async with app.run_test() as pilot:
+        app.console._color_system = ColorSystem.EIGHT_BIT
+        saturation_value_picker = pilot.app.query_one(SaturationValuePicker)
+        saturation_value_picker.hsv = HSV(0.3, 0.0, 1.0)
+        palette_colors = {EIGHT_BIT_PALETTE[number] for number in range(256)}
+
+        strip = saturation_value_picker.render_line(5)
+        for segment in strip:
+            assert segment.style is not None and segment.style.bgcolor
+            assert segment.style.bgcolor.triplet in palette_colors
+
+        saturation_value_picker.dither = True
+        dithered_strip = saturation_value_picker.render_line(5)
+        assert [segment.style for segment in dithered_strip] != [
+            segment.style for segment in strip
+        ]
+
+
+async def test_large_fields_are_computed_in_a_worker() -> None:
+    gradient_cache.clear()
+    app = SaturationValuePickerApp()
+    async with app.run_test() as pilot:
+        saturation_value_picker = pilot.app.query_one(SaturationValuePicker)
+        saturation_value_picker._BACKGROUND_FIELD_SIZE = 0
+        color_system = get_color_system(app.console)
+        previous_row = saturation_value_picker._get_gradient_row(
+            0, 35, 17, color_system
+        )
+
+        # The previous field is shown until the worker has finished.
+        saturation_value_picker.hsv = HSV(0.5, 1.0, 1.0)
+        row = saturation_value_picker._get_gradient_row(0, 35, 17, color_system)
+        assert row is previous_row
+
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        row = saturation_value_picker._get_gradient_row(0, 35, 17, color_system)
+        assert row is not previous_row
+        assert row[-1].style is not None
+        expected_rgb = quantize_color(Color.from_hsv(0.5, 1.0, 1.0).rgb, color_system)
+        assert row[-1].style.bgcolor == Color(*expected_rgb).rich_color
+
+
+async def test_low_resolution_field_is_shown_while_resizing() -> None:
+    gradient_cache.clear()
+    app = SaturationValuePickerApp()
+    async with app.run_test() as pilot:
+        saturation_value_picker = pilot.app.query_one(SaturationValuePicker)
+        saturation_value_picker._BACKGROUND_FIELD_SIZE = 0
+        # No field has been built for this hue, so there is no master field.
+        saturation_value_picker.hsv = HSV(0.5, 1.0, 1.0)
+        # Resize the widget too, so rendering it needs the same field.
+        saturation_value_picker.styles.width = 40
+        saturation_value_picker.styles.height = 20
+        color_system = get_color_system(app.console)
+
+        row = saturation_value_picker._get_gradient_row(0, 40, 20, color_system)
+        assert len(row) == 40
+        # Each low-resolution cell is repeated to fill the field.
+        assert row[0] is row[1]
+
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        row = saturation_value_picker._get_gradient_row(0, 40, 20, color_system)
+        assert len(row) == 40
+        assert row[0] is not row[1]
+
+
+async def test_field_is_built_on_the_event_loop_if_the_worker_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fail_to_build_in_thread(*args: Any) -> list[list[Segment]]:
+        if threading.current_thread() is not threading.main_thread():
+            raise RuntimeError("failed to build the gradient field")
+        return _build_gradient_rows(*args)
+
+    monkeypatch.setattr(
+        "textual_colorpicker.saturation_value_picker._build_gradient_rows",
+        fail_to_build_in_thread,
+    )
+    gradient_cache.clear()
+    app = SaturationValuePickerApp()
+    async with app.run_test() as pilot:
+        saturation_value_picker = pilot.app.query_one(SaturationValuePicker)
+        saturation_value_picker._BACKGROUND_FIELD_SIZE = 0
+        color_system = get_color_system(app.console)
+
+        saturation_value_picker.hsv = HSV(0.5, 1.0, 1.0)
+        await pilot.pause()
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+        assert saturation_value_picker._pending_field_key is None
+        key = ("saturation_value", 0.5, 35, 17, False, color_system, False)
+        assert gradient_cache.get(key) is not None
+
+
+def fail_to_build_gradient_rows(*args: object) -> None:
+    raise AssertionError("the gradient field should be resampled, not built")
+
+
+async def test_shrinking_resamples_the_master_field(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    gradient_cache.clear()
+    app = SaturationValuePickerApp()
+    async with app.run_test():
+        saturation_value_picker = app.query_one(SaturationValuePicker)
+        saturation_value_picker.hsv = HSV(0.3, 1.0, 1.0)
+        color_system = ColorSystem.TRUECOLOR
+        first_row = saturation_value_picker._get_gradient_row(0, 30, 15, color_system)
+        last_row = saturation_value_picker._get_gradient_row(14, 30, 15, color_system)
+
+        monkeypatch.setattr(
+            "textual_colorpicker.saturation_value_picker._build_gradient_rows",
+            fail_to_build_gradient_rows,
+        )
+        row = saturation_value_picker._get_gradient_row(0, 20, 10, color_system)
+        assert len(row) == 20
+        assert row[0] is first_row[0]
+        assert row[-1] is first_row[-1]
+        row = saturation_value_picker._get_gradient_row(9, 20, 10, color_system)
+        assert row[-1] is last_row[-1]
+
+
+async def test_growing_builds_the_master_field_with_headroom(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    gradient_cache.clear()
+    app = SaturationValuePickerApp()
+    async with app.run_test():
+        saturation_value_picker = app.query_one(SaturationValuePicker)
+        saturation_value_picker._BACKGROUND_FIELD_SIZE = None
+        saturation_value_picker.hsv = HSV(0.7, 1.0, 1.0)
+        color_system = ColorSystem.TRUECOLOR
+        saturation_value_picker._get_gradient_row(0, 30, 15, color_system)
+
+        row = saturation_value_picker._get_gradient_row(0, 40, 20, color_system)
+        assert len(row) == 40
+        master_rows = gradient_cache.get(
+            ("saturation_value_master", 0.7, False, color_system)
+        )
+        assert master_rows is not None
+        assert (len(master_rows[0]), len(master_rows)) == (50, 25)
+
+        monkeypatch.setattr(
+            "textual_colorpicker.saturation_value_picker._build_gradient_rows",
+            fail_to_build_gradient_rows,
+        )
+        row = saturation_value_picker._get_gradient_row(0, 50, 25, color_system)
+        assert len(row) == 50
+
+
+def test_frame_budget_is_clamped() -> None:
+    saturation_value_picker = SaturationValuePicker(frame_budget=-1.0)
+    assert saturation_value_picker.frame_budget == 0.0
+
+    saturation_value_picker.frame_budget = None
+    assert saturation_value_picker.frame_budget is None
+
+
+async def test_preview_is_drawn_when_over_frame_budget_then_refined() -> None:
+    gradient_cache.clear()
+    app = SaturationValuePickerApp()
+    async with app.run_test() as pilot:
+        saturation_value_picker = app.query_one(SaturationValuePicker)
+        saturation_value_picker.frame_budget = 1 / 60
+        width, height = saturation_value_picker.content_size
+        color_system = get_color_system(app.console)
+        # Pretend computing each cell is slow, so the field is over budget.
+        saturation_value_picker._cell_build_time = 1e-3
+
+        saturation_value_picker.hsv = HSV(0.6, 1.0, 1.0)
+        row = saturation_value_picker._get_gradient_row(0, width, height, color_system)
+        assert len(row) == width
+        # Each reduced-resolution cell is repeated to fill the field.
+        assert row[0] is row[1]
+        field_key = ("saturation_value", 0.6, width, height, False, color_system)
+        assert gradient_cache.get((*field_key, False)) is None
+
+        await pilot.pause(saturation_value_picker._REFINE_DELAY * 5)
+        rows = gradient_cache.get((*field_key, False))
+        assert rows is not None
+        assert rows[0][0] is not rows[0][1]
+        row = saturation_value_picker._get_gradient_row(0, width, height, color_system)
+        assert row is rows[0]
+
+
+async def test_preview_is_kept_when_a_stale_worker_finishes() -> None:
+    gradient_cache.clear()
+    app = SaturationValuePickerApp()
+    async with app.run_test():
+        saturation_value_picker = app.query_one(SaturationValuePicker)
+        saturation_value_picker.frame_budget = 1 / 60
+        width, height = saturation_value_picker.content_size
+        color_system = get_color_system(app.console)
+        saturation_value_picker._cell_build_time = 1e-3
+
+        saturation_value_picker.hsv = HSV(0.6, 1.0, 1.0)
+        preview_row = saturation_value_picker._get_gradient_row(
+            0, width, height, color_system
+        )
+
+        # A worker for an earlier hue finishes while the preview is shown.
+        stale_key = (0.3, width, height, False, color_system, False)
+        saturation_value_picker._set_gradient_rows(
+            stale_key, _build_gradient_rows(*stale_key)
+        )
+
+        row = saturation_value_picker._get_gradient_row(0, width, height, color_system)
+        assert row[0] is row[1]
+        assert [segment.style for segment in row] == [
+            segment.style for segment in preview_row
+        ]
+
+
+async def test_preview_is_not_refined_while_the_hue_is_changing() -> None:
+    gradient_cache.clear()
+    app = SaturationValuePickerApp()
+    async with app.run_test() as pilot:
+        saturation_value_picker = app.query_one(SaturationValuePicker)
+        saturation_value_picker.frame_budget = 1 / 60
+        width, height = saturation_value_picker.content_size
+        color_system = get_color_system(app.console)
+        saturation_value_picker._cell_build_time = 1e-3
+
+        saturation_value_picker.hsv = HSV(0.2, 1.0, 1.0)
+        saturation_value_picker._get_gradient_row(0, width, height, color_system)
+        saturation_value_picker.hsv = HSV(0.4, 1.0, 1.0)
+        saturation_value_picker._get_gradient_row(0, width, height, color_system)
+
+        await pilot.pause(saturation_value_picker._REFINE_DELAY * 5)
+        for hue, refined in [(0.2, False), (0.4, True)]:
+            key = ("saturation_value", hue, width, height, False, color_system, False)
+            assert (gradient_cache.get(key) is not None) == refined
+
+
+async def test_no_preview_without_a_frame_budget() -> None:
+    gradient_cache.clear()
+    app = SaturationValuePickerApp()
+    async with app.run_test():
+        saturation_value_picker = app.query_one(SaturationValuePicker)
+        saturation_value_picker._cell_build_time = 1.0
+
+        saturation_value_picker.hsv = HSV(0.6, 1.0, 1.0)
+        row = saturation_value_picker._get_gradient_row(
+            0, 40, 20, ColorSystem.TRUECOLOR
+        )
+        assert row[0] is not row[1]
+
+
+class LargeSaturationValuePickerApp(App):
+    CSS = """
+    SaturationValuePicker {
+        width: 1fr;
+        height: 1fr;
+    }
+    """
+
+    def compose(self) -> ComposeResult:
+        yield SaturationValuePicker(frame_budget=0.0001)
+
+
+async def test_preview_is_drawn_for_a_large_field_from_a_cold_start() -> None:
+    gradient_cache.clear()
+    app = LargeSaturationValuePickerApp()
+    async with app.run_test(size=(200, 90)) as pilot:
+        await pilot.pause()
+        saturation_value_picker = app.query_one(SaturationValuePicker)
+        width, height = saturation_value_picker.content_size
+        background_field_size = saturation_value_picker._BACKGROUND_FIELD_SIZE
+        assert background_field_size is not None
+        assert width * height >= background_field_size
+        color_system = get_color_system(app.console)
+
+        # The build time was estimated from a small calibration field.
+        calibrated_time = saturation_value_picker._cell_build_time
+        assert calibrated_time is not None
+        row = saturation_value_picker._get_gradient_row(0, width, height, color_system)
+        assert row[0] is row[1]
+
+        # The preview is refined, then the field is built in a worker.
+        key = ("saturation_value", 0.0, width, height, False, color_system, False)
+        for _ in range(20):
+            await pilot.pause(saturation_value_picker._REFINE_DELAY)
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            if gradient_cache.get(key) is not None:
+                break
+        rows = gradient_cache.get(key)
+        assert rows is not None
+        assert rows[0][0] is not rows[0][1]
+        # The time taken by the worker is recorded too.
+        assert saturation_value_picker._cell_build_time != calibrated_time
+
+        saturation_value_picker.hsv = HSV(0.5, 1.0, 1.0)
+        row = saturation_value_picker._get_gradient_row(0, width, height, color_system)
+        assert row[0] is row[1]
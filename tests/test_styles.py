@@ -0,0 +1,24 @@
+from textual.color import Color
+
+from textual_colorpicker._styles import get_style, get_styles, pack_rgb
+
+
+def test_styles_are_interned() -> None:
+    style = get_style((255, 255, 255), (0, 128, 255))
+
+    assert get_style((255, 255, 255), (0, 128, 255)) is style
+    assert get_style((0, 0, 0), (0, 128, 255)) is not style
+
+
+def test_style_has_foreground_and_background_colors() -> None:
+    style = get_style((255, 255, 255), (0, 128, 255))
+
+    assert style.color == Color(255, 255, 255).rich_color
+    assert style.bgcolor == Color(0, 128, 255).rich_color
+
+
+def test_styles_for_packed_colors_are_interned() -> None:
+    key = pack_rgb((255, 255, 255)) << 24 | pack_rgb((0, 128, 255))
+
+    assert get_styles([key, key]) == [get_style((255, 255, 255), (0, 128, 255))] * 2
+    assert get_styles([key])[0] is get_style((255, 255, 255), (0, 128, 255))
@@ -0,0 +1,79 @@
+from textual.app import App, ComposeResult
+from textual.color import Color
+
+from textual_colorpicker.swatch_grid import SwatchGrid
+
+COLORS = [Color(index % 256, index // 256 % 256, 0) for index in range(20000)]
+
+
+class SwatchGridApp(App):
+    CSS = """
+    SwatchGrid {
+        width: 42;
+        height: 10;
+    }
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.selected: list[tuple[int, Color]] = []
+
+    def compose(self) -> ComposeResult:
+        yield SwatchGrid(COLORS)
+
+    def on_swatch_grid_selected(self, event: SwatchGrid.Selected) -> None:
+        self.selected.append((event.index, event.color))
+
+
+async def test_virtual_size_fits_all_swatches() -> None:
+    app = SwatchGridApp()
+    async with app.run_test():
+        swatch_grid = app.query_one(SwatchGrid)
+
+        # The scrollbar gutter leaves room for 10 columns of swatches.
+        assert swatch_grid.columns == 10
+        assert swatch_grid.virtual_size.height == 2000 * SwatchGrid.SWATCH_HEIGHT
+
+
+async def test_render_line_uses_scroll_offset() -> None:
+    app = SwatchGridApp()
+    async with app.run_test() as pilot:
+        swatch_grid = app.query_one(SwatchGrid)
+
+        strip = swatch_grid.render_line(2)
+        segment = list(strip)[0]
+        assert segment.style is not None
+        assert segment.style.bgcolor == COLORS[10].rich_color
+
+        swatch_grid.scroll_to(y=1000, animate=False)
+        await pilot.pause()
+        strip = swatch_grid.render_line(2)
+        segments = list(strip)
+        assert segments[0].style is not None
+        assert segments[0].style.bgcolor == COLORS[5010].rich_color
+        assert strip.cell_length == 40
+
+
+async def test_clicking_swatch_posts_selected() -> None:
+    app = SwatchGridApp()
+    async with app.run_test() as pilot:
+        await pilot.click(SwatchGrid, offset=(9, 3))
+        assert app.selected == [(12, COLORS[12])]
+
+        swatch_grid = app.query_one(SwatchGrid)
+        swatch_grid.scroll_to(y=1000, animate=False)
+        await pilot.pause()
+        await pilot.click(SwatchGrid, offset=(0, 0))
+        assert app.selected[-1] == (5000, COLORS[5000])
+
+
+async def test_clicking_past_the_last_swatch_is_ignored() -> None:
+    app = SwatchGridApp()
+    async with app.run_test() as pilot:
+        swatch_grid = app.query_one(SwatchGrid)
+        swatch_grid.swatches = COLORS[:3]
+        await pilot.pause()
+
+        await pilot.click(SwatchGrid, offset=(13, 0))
+        await pilot.click(SwatchGrid, offset=(0, 3))
+        assert app.selected == []